@@ -6,15 +6,14 @@
 
 import os
 from typing import Dict, Optional
-from google import genai
+from llm.client import generate
 
 
 class AnalystAgent:
     """분석 에이전트 - 데이터 분석 및 인사이트 도출"""
     
     def __init__(self, api_key: str):
-        self.client = genai.Client(api_key=api_key)
-        self.model = "models/gemini-2.0-flash"
+        self.api_key = api_key
     
     def analyze(self, research_data: Dict, topic: Dict) -> Dict:
         """
@@ -65,12 +64,7 @@ class AnalystAgent:
         
         try:
             print(f"  [분석] 데이터 분석 중...")
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=analysis_prompt
-            )
-            
-            analysis_result = response.text
+            analysis_result = generate(analysis_prompt, task="analysis", api_key=self.api_key)
             
             print(f"  [OK] 분석 완료")
             
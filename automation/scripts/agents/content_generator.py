@@ -5,7 +5,7 @@ Google Gemini API를 사용하여 블로그 포스트 콘텐츠를 생성한다.
 
 import os
 from typing import Dict, Optional
-from google import genai
+from llm.client import generate, model_chain
 
 
 class ContentGeneratorAgent:
@@ -15,12 +15,8 @@ class ContentGeneratorAgent:
         if not api_key:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
         
-        # 최신 클라이언트 초기화
-        self.client = genai.Client(api_key=api_key)
-        # 모델 설정 (사용 가능한 최신 모델 사용)
-        # gemini-2.0-flash가 가장 안정적이고 빠름
-        self.model_name = "models/gemini-2.0-flash"
-        print(f"✅ Gemini 클라이언트 초기화 완료 (모델: {self.model_name})")
+        self.api_key = api_key
+        print(f"✅ Gemini 설정 완료 (모델: {', '.join(model_chain('default'))})")
     
     def generate_content(self, topic: Dict) -> Optional[Dict]:
         """
@@ -39,13 +35,7 @@ class ContentGeneratorAgent:
         full_prompt = f"{system_prompt}\n\n{user_prompt}"
         
         try:
-            # 최신 API 호출 방식
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=full_prompt
-            )
-            
-            content_text = response.text
+            content_text = generate(full_prompt, api_key=self.api_key, cache=False)
             
             # 생성된 콘텐츠 파싱
             parsed_content = self._parse_content(content_text, topic)
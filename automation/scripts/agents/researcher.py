@@ -6,16 +6,14 @@ Gemini Deep Research를 활용하여 다양한 소스에서 정보를 수집한
 
 import os
 from typing import Dict, List, Optional
-from google import genai
+from llm.client import generate
 
 
 class ResearcherAgent:
     """연구 에이전트 - 정보 수집 및 조사"""
     
     def __init__(self, api_key: str):
-        self.client = genai.Client(api_key=api_key)
-        # 일반 조사용 모델 (안정적이고 빠름)
-        self.search_model = "models/gemini-2.0-flash"
+        self.api_key = api_key
     
     def research_topic(self, topic: Dict) -> Dict:
         """
@@ -68,13 +66,8 @@ class ResearcherAgent:
         
         try:
             print(f"  [연구] 조사 시작...")
-            # 일반 모델 사용 (Deep Research는 별도 API 필요)
-            # gemini-2.0-flash가 안정적이고 빠름
-            response = self.client.models.generate_content(
-                model=self.search_model,
-                contents=research_prompt
-            )
-            research_result = response.text
+            # 일반 모델 사용 (Deep Research는 별도 API 필요), 모델 순서는 llm.client의 "research" 체인
+            research_result = generate(research_prompt, task="research", api_key=self.api_key)
             print(f"  [OK] 조사 완료")
             
             # 조사 결과 파싱
@@ -8,15 +8,19 @@ import random
 from datetime import datetime, timedelta
 from typing import List, Dict
 import os
-import xml.etree.ElementTree as ET
-from email.utils import parsedate_to_datetime
 from zoneinfo import ZoneInfo
 
+from feeds.cache import FeedCache
+from feeds.fetcher import fetch_all
+from feeds.parser import parse_feed_entries, parse_published, select_entries
+
 
 class TopicCollectorAgent:
     """주제 수집 에이전트"""
     
     def __init__(self):
+        # 피드 조건부 요청 캐시 (변경 없는 피드는 XML을 다시 파싱하지 않는다)
+        self.feed_cache = FeedCache()
         self.sources = [
             self._collect_bloomberg_yesterday_digest,
             self._collect_tech_news,
@@ -111,28 +115,25 @@ class TopicCollectorAgent:
         items: List[Dict] = []
         seen_links = set()
 
-        for url in feed_urls:
+        results = fetch_all(
+            [{"url": url, "headers": {"User-Agent": "rldhkstopic-auto-post/1.0"}} for url in feed_urls],
+            timeout=8,
+            cache=self.feed_cache,
+        )
+        for result in results:
             try:
-                resp = requests.get(url, timeout=8, headers={"User-Agent": "rldhkstopic-auto-post/1.0"})
-                if resp.status_code != 200:
-                    continue
-                root = ET.fromstring(resp.text)
-
-                # RSS 2.0: rss/channel/item
-                channel = root.find("channel")
-                if channel is None:
+                if result["error"]:
                     continue
+                # 캐시에는 피드 전체 항목이 있으므로 전일 시작 시각 이후 항목만 고른다.
+                entries = select_entries(
+                    self.feed_cache.load_items(result, parse_feed_entries), cutoff=yesterday_start
+                )
 
-                for item in channel.findall("item"):
-                    title_el = item.find("title")
-                    link_el = item.find("link")
-                    pub_el = item.find("pubDate")
-                    desc_el = item.find("description")
-
-                    title = (title_el.text or "").strip() if title_el is not None else ""
-                    link = (link_el.text or "").strip() if link_el is not None else ""
-                    pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                    desc = (desc_el.text or "").strip() if desc_el is not None else ""
+                for entry in entries:
+                    title = entry["title"]
+                    link = entry["link"]
+                    pub = entry["pub"]
+                    desc = entry["desc"]
 
                     if not title or not link or not pub:
                         continue
@@ -140,10 +141,8 @@ class TopicCollectorAgent:
                         continue
 
                     try:
-                        dt = parsedate_to_datetime(pub)
-                        if dt.tzinfo is None:
-                            # tz가 없으면 UTC로 가정
-                            dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+                        # tz가 없으면 UTC로 가정
+                        dt = parse_published(pub)
                         dt_kst = dt.astimezone(tz)
                     except Exception:
                         continue
@@ -162,6 +161,7 @@ class TopicCollectorAgent:
                     )
             except Exception:
                 continue
+        self.feed_cache.save()
 
         if not items:
             return []
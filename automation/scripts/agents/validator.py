@@ -28,13 +28,43 @@ class ValidatorAgent:
         Returns:
             Dict: 검증 결과 (valid, errors, warnings)
         """
+        meta = self.validate_meta(content)
+        body = self.validate_body(content)
+        errors = meta['errors'] + body['errors']
+        return {
+            'valid': len(errors) == 0,
+            'errors': errors,
+            'warnings': meta['warnings'] + body['warnings']
+        }
+    
+    def validate_meta(self, content: Dict) -> Dict:
+        """
+        본문과 무관한 항목(제목, 카테고리)만 검증한다.
+        주제가 정해지면 바로 실행할 수 있어, 글 생성(LLM 호출) 전에 실패를 알 수 있다.
+        """
         errors = []
-        warnings = []
         
         # 필수 필드 검증
         if not content.get('title') or not content['title'].strip():
             errors.append('제목이 없습니다.')
         
+        # 카테고리 검증
+        category = content.get('category', '')
+        if category not in self.valid_categories:
+            errors.append(f'유효하지 않은 카테고리: {category}')
+        
+        return {
+            'valid': len(errors) == 0,
+            'errors': errors,
+            'warnings': []
+        }
+    
+    def validate_body(self, content: Dict) -> Dict:
+        """본문(길이, 한글 비율, 금지어, 이모지, 문체, 참조) 검증"""
+        errors = []
+        warnings = []
+        category = content.get('category', '')
+        
         if not content.get('content') or len(content['content']) < self.min_content_length:
             errors.append(f'본문이 너무 짧습니다 (최소 {self.min_content_length}자 필요).')
 
@@ -45,11 +75,6 @@ class ValidatorAgent:
         if hangul_count < 200:
             errors.append('본문 한글 비율이 너무 낮습니다. (생성 결과가 깨졌을 가능성)')
         
-        # 카테고리 검증
-        category = content.get('category', '')
-        if category not in self.valid_categories:
-            errors.append(f'유효하지 않은 카테고리: {category}')
-        
         # 금지어 검증
         content_text = content.get('content', '').lower()
         for word in self.forbidden_words:
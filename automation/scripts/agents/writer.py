@@ -9,8 +9,17 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict
-from google import genai
+from typing import Dict, Optional
+from llm.client import LLMError, generate, model_chain
+
+# 스트리밍 생성 + 중간 검사 (0이면 응답 전체를 받은 뒤에만 검증)
+STREAMING_ENABLED = os.getenv("WRITER_STREAMING", "1") == "1"
+# 스트리밍 중간 검사 기준: 이만큼(공백 제외) 받기 전에는 판단하지 않는다
+STREAM_MIN_CHARS = 400
+# 최근 구간 한글 비율을 볼 창 크기(공백 제외 글자 수)
+STREAM_WINDOW_CHARS = 500
+# References 섹션 시작 (헤더 또는 첫 각주 정의 줄): 그 뒤는 영문 제목/링크라 언어 검사에서 뺀다
+_REFERENCES_START_RE = re.compile(r"^\s*(?:#{1,6}\s*(?:References|참고)|-?\s*\[\^[^\]]+\]:)", re.MULTILINE | re.IGNORECASE)
 
 # Windows 콘솔에서 한글 출력이 깨지는 문제 완화 (UTF-8 강제)
 if sys.platform.startswith("win"):
@@ -31,19 +40,11 @@ class WriterAgent:
     """작성 에이전트 - 최종 글 작성"""
     
     def __init__(self, api_key: str):
-        self.client = genai.Client(api_key=api_key)
-        # 모델은 환경/권한에 따라 가용성이 달라질 수 있으므로 폴백 체인을 둔다.
-        # - 일부 환경에서는 특정 모델이 404/NOT_FOUND로 실패할 수 있다.
-        # - 이 경우 다음 후보로 자동 폴백한다.
-        self.model_candidates = [
-            os.getenv("GEMINI_WRITER_MODEL"),
-            "models/gemini-2.5-flash",
-            "models/gemini-2.0-flash-exp",
-            "models/gemini-2.0-flash",
-            "models/gemini-flash-latest",
-        ]
-        self.model_candidates = [m for m in self.model_candidates if m]
-        self.model = self.model_candidates[0]
+        self.api_key = api_key
+        # 모델 폴백(404/NOT_FOUND 시 다음 후보), 429/5xx 백오프 재시도는 llm.client의 "writer" 체인이 맡는다.
+        # GEMINI_WRITER_MODEL이 있으면 체인 맨 앞에 들어간다.
+        self.model_candidates = model_chain("writer")
+        self.stream_check = self._stream_drift if STREAMING_ENABLED else None
     
     def _is_korean_output(self, text: str) -> bool:
         """
@@ -115,6 +116,45 @@ class WriterAgent:
 
         return True
 
+    def _stream_drift(self, text: str) -> Optional[str]:
+        """
+        스트리밍 중인 부분 출력이 이미 확실히 실패했는지 점검한다 (중단 사유, 괜찮으면 None).
+
+        _is_korean_output보다 느슨하게 본다. 끝까지 받아도 통과할 수 없는 경우만 중단한다.
+        1. 전체 한글 비율 20% 미만, 또는 최근 STREAM_WINDOW_CHARS자 한글 비율 10% 미만 (영어로 전환)
+        2. 완성된 본문 줄 중 해요체("~요.")가 3줄 이상이고 "~다." 줄보다 많음
+        3. 완성된 본문 줄이 8줄 이상인데 "~다."로 끝나는 줄이 30% 미만
+        References 섹션(헤더 또는 첫 각주 정의부터, 영문 제목/링크)과 코드 블록(닫히지 않은 것 포함)은 검사하지 않는다.
+        """
+        body = _REFERENCES_START_RE.split(text, 1)[0]
+        body = re.sub(r"```[\s\S]*?(```|$)", "", body)
+        non_ws = re.sub(r"\s+", "", body)
+        if len(non_ws) < STREAM_MIN_CHARS:
+            return None
+
+        hangul_ratio = len(re.findall(r"[가-힣]", non_ws)) / len(non_ws)
+        if hangul_ratio < 0.2:
+            return f"한글 비율 {hangul_ratio*100:.1f}%"
+        window = non_ws[-STREAM_WINDOW_CHARS:]
+        window_ratio = len(re.findall(r"[가-힣]", window)) / len(window)
+        if window_ratio < 0.1:
+            return f"최근 {len(window)}자 한글 비율 {window_ratio*100:.1f}% (언어 전환)"
+
+        # 마지막 줄은 아직 받는 중일 수 있으므로 제외
+        prose = []
+        for line in body.split('\n')[:-1]:
+            line = line.strip()
+            if len(line) < 10 or line.startswith(('#', '-', '*', '>', '|')) or re.match(r'^\d+[.)]\s', line):
+                continue
+            prose.append(line)
+        da_count = sum(1 for line in prose if re.search(r'다\s*(\[.*?\])?\.$', line))
+        yo_count = sum(1 for line in prose if re.search(r'요[.!?]?\s*(\[.*?\])?$', line))
+        if yo_count >= 3 and yo_count > da_count:
+            return f"해요체 문장 {yo_count}줄 ('~다.' {da_count}줄)"
+        if len(prose) >= 8 and da_count / len(prose) < 0.3:
+            return f"'~다.'로 끝나는 문장 비율 {da_count}/{len(prose)}"
+        return None
+
     def write(self, topic: Dict, research_data: Dict, analysis_data: Dict) -> str:
         """
         조사 및 분석 결과를 바탕으로 블로그 포스트를 작성한다.
@@ -191,7 +231,7 @@ class WriterAgent:
 
             # 모델이 비정상 출력(영문/공백 위주)하는 케이스가 있어, 최대 3회까지 재시도한다.
             for attempt in range(1, 4):
-                print(f"  [작성] 블로그 포스트 작성 중... (시도 {attempt}/3, 모델: {self.model})")
+                print(f"  [작성] 블로그 포스트 작성 중... (시도 {attempt}/3, 모델: {self.model_candidates[0]} 외 폴백)")
 
                 writing_prompt = base_prompt
                 if attempt >= 2:
@@ -206,22 +246,16 @@ class WriterAgent:
 - 예시: "CSV 파일을 사용한다" (O), "Use CSV file" (X)
 """
 
-                # API 호출 (모델이 없으면 후보 모델로 폴백)
+                # API 호출 (비어 있거나 100자 미만인 응답은 다음 후보 모델로 폴백)
+                # "writer" 작업은 응답을 캐시하지 않는다 (재생성과 검증 실패 후 재시도 모두 새 초안이 필요)
                 try:
-                    response = self.client.models.generate_content(
-                        model=self.model,
-                        contents=writing_prompt
+                    content = generate(
+                        writing_prompt,
+                        task="writer",
+                        api_key=self.api_key,
+                        min_length=100,
+                        check=self.stream_check,
                     )
-                    content = (response.text or "").strip()
-                    
-                    # 응답이 비어있거나 너무 짧으면 에러 출력
-                    if not content:
-                        print(f"  [ERROR] API 응답이 비어있습니다.")
-                        continue
-                    if len(content) < 100:
-                        print(f"  [ERROR] API 응답이 너무 짧습니다: {len(content)}자")
-                        print(f"  [DEBUG] 응답 내용: {content}")
-                        continue
                     
                     # 디버깅: 생성된 내용의 일부와 한글 통계 출력
                     preview = content[:300] if len(content) > 300 else content
@@ -236,22 +270,11 @@ class WriterAgent:
                     print(f"  [DEBUG] 한글 수 (전체): {hangul_count}자")
                     print(f"  [DEBUG] 한글 수 (코드 제외): {hangul_count_wo_code}자")
                     print(f"  [DEBUG] 한글 비율 (코드 제외): {hangul_ratio:.1f}%")
-                except Exception as e:
+                except LLMError as e:
                     last_error = str(e)
-                    # 모델 미존재/권한 문제(404/NOT_FOUND)면 다음 후보로 폴백한다.
-                    err_upper = last_error.upper()
-                    if ("404" in err_upper) or ("NOT_FOUND" in err_upper):
-                        next_model = None
-                        for m in self.model_candidates:
-                            if m == self.model:
-                                continue
-                            next_model = m
-                            break
-                        if next_model:
-                            print(f"  [WARN] 모델 호출 실패(모델 미존재/권한 가능): {self.model} -> {next_model}")
-                            self.model = next_model
-                            continue
                     print(f"  [ERROR] API 호출 실패: {last_error}")
+                    if e.permanent:
+                        break
                     continue
 
                 # 후처리: 이모지 제거 및 문체 개선
@@ -342,11 +365,11 @@ class WriterAgent:
 
 "~다."로 끝나는 건조한 문체로, 최소 1200자 이상 한국어로 작성해주세요. 이모지는 절대 사용하지 마세요."""
                 
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=simple_prompt
-                )
-                content = response.text
+                try:
+                    content = generate(simple_prompt, task="writer", api_key=self.api_key, check=self.stream_check)
+                except LLMError as e:
+                    print(f"  [ERROR] API 호출 실패: {e}")
+                    content = ""
             
             # 응답 검증
             if not content or len(content.strip()) < 500:
@@ -370,11 +393,11 @@ class WriterAgent:
 - 최소 1500자 이상 작성하세요
 - 한글을 자연스럽게 사용하세요"""
                 
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=simple_prompt
-                )
-                content = response.text
+                try:
+                    content = generate(simple_prompt, task="writer", api_key=self.api_key, check=self.stream_check)
+                except LLMError as e:
+                    print(f"  [ERROR] API 호출 실패: {e}")
+                    content = ""
             
             # 후처리: 이모지 제거 및 문체 개선
             content = self._post_process(content)
@@ -0,0 +1,2 @@
+# Articles package
+
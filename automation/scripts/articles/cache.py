@@ -0,0 +1,101 @@
+"""
+기사 본문 캐시
+추출한 기사 본문을 정규화 URL 기준으로 디스크에 보관한다 (URL -> text, fetched_at, content_hash).
+같은 날 포스트를 다시 생성할 때 이미 추출한 기사는 내려받지 않는다.
+
+- TTL이 지난 항목은 다시 가져온다.
+- 항목 수가 max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 지운다 (LRU).
+- 여러 스레드에서 동시에 get/put 해도 안전하다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from feeds.urls import canonicalize_url
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_ARTICLE_CACHE_PATH = Path(
+    os.getenv("ARTICLE_CACHE_PATH", str(PROJECT_ROOT / "automation" / "cache" / "article_cache.json"))
+)
+DEFAULT_TTL_HOURS = float(os.getenv("ARTICLE_CACHE_TTL_HOURS", "24"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "500"))
+
+
+class ArticleCache:
+    """정규화 URL -> 기사 본문 캐시 (TTL + LRU)"""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = Path(path) if path else DEFAULT_ARTICLE_CACHE_PATH
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            # 파일에는 오래 쓰이지 않은 항목부터 저장돼 있다.
+            self.entries = OrderedDict(data.get("articles", {}))
+        except Exception as e:
+            print(f"[WARN] 기사 캐시 로드 실패 ({self.path}): {e}")
+            self.entries = OrderedDict()
+
+    def save(self):
+        """변경 사항이 있을 때만 임시 파일에 쓰고 교체한다."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                tmp_path.write_text(
+                    json.dumps({"articles": self.entries}, ensure_ascii=False),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"[WARN] 기사 캐시 저장 실패 ({self.path}): {e}")
+
+    def get(self, url: str) -> Optional[str]:
+        """캐시된 본문 (없거나 TTL이 지났으면 None)"""
+        key = canonicalize_url(url)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or time.time() - entry.get("fetched_at", 0) > self.ttl:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return entry["text"]
+
+    def put(self, url: str, text: str):
+        key = canonicalize_url(url)
+        with self._lock:
+            self.entries[key] = {
+                "text": text,
+                "fetched_at": time.time(),
+                "content_hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            }
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._dirty = True
@@ -0,0 +1,270 @@
+"""
+기사 본문 추출기 (텍스트 밀도 기반)
+HTML을 한 번만 훑으면서(스트리밍) 블록 단위로 텍스트 길이와 링크 텍스트 길이를 모으고,
+본문다운 문단이 가장 많이 모인 컨테이너 안의 문단만 골라낸다.
+
+- lxml이 있으면 lxml 파서(target 인터페이스), 없으면 표준 라이브러리 html.parser를 쓴다. 두 경로는 같은 수집기를 공유한다.
+- script/style/nav/header/footer/aside/form 등과, class/id가 댓글·공유·관련기사 등으로 보이는 요소는 통째로 건너뛴다.
+  class/id는 토큰(공백, _, - 구분) 단위로 비교하고, html/body/main/article은 class와 상관없이 건너뛰지 않는다.
+- 문단 판정: 충분히 길고 링크 텍스트 비율이 낮은 블록 (메뉴, 관련기사 목록은 짧고 링크 비율이 높다)
+- 컨테이너 선택: 좋은 문단 글자 수 합계가 전체의 CONTAINER_COVERAGE 이상인 가장 깊은 블록
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Union
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+SKIP_TAGS = {
+    "script", "style", "noscript", "nav", "header", "footer", "aside", "form",
+    "iframe", "svg", "button", "select", "textarea", "template", "figure", "head",
+}
+BLOCK_TAGS = {
+    "html", "body", "main", "article", "section", "div", "p", "li", "ul", "ol",
+    "dl", "dt", "dd", "table", "tbody", "tr", "td", "th", "blockquote", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6", "figcaption",
+}
+# class/id로 건너뛰지 않는 태그 (html/body의 class는 "sidebar-visible", "modal-open" 같은 페이지 상태다)
+NEVER_SKIP_TAGS = {"html", "body", "main", "article"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+# class/id 토큰 단위로만 본다 (공백, _, - 경계). "canvas"의 nav, "shareholder"의 share 같은 부분 일치는 제외.
+_BOILERPLATE_RE = re.compile(
+    r"(?:^|[\s_-])(?:comments?|sidebar|related|share|sharing|social|promo|newsletter|advert\w*|ads?|sponsor\w*|"
+    r"cookies?|subscribe|signup|popup|modal|breadcrumbs?|menu|nav|navbar|navigation|footer|recommend\w*|trending)"
+    r"(?:$|[\s_-])",
+    re.I,
+)
+_CONTENT_RE = re.compile(r"article|body|content|entry|main|post|story|text", re.I)
+_WS_RE = re.compile(r"\s+")
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.I)
+
+# 문단 판정 기준
+MIN_PARAGRAPH_CHARS = 60
+MAX_LINK_DENSITY = 0.33
+# 컨테이너 안에서 함께 내보낼 짧은 블록(소제목 등) 기준
+MIN_SHORT_CHARS = 20
+MAX_SHORT_LINK_DENSITY = 0.1
+CONTAINER_COVERAGE = 0.7
+
+
+class _Block:
+    __slots__ = ("node_id", "tag", "parts", "link_chars", "order", "ancestors")
+
+    def __init__(self, node_id: int, tag: str, ancestors: List[int]):
+        self.node_id = node_id
+        self.tag = tag
+        self.parts: List[str] = []
+        self.link_chars = 0
+        self.order: Optional[int] = None
+        self.ancestors = ancestors
+
+
+class _DensityCollector:
+    """파서 이벤트(start/end/data)를 받아 블록별 텍스트/링크 밀도를 모은다."""
+
+    def __init__(self):
+        self.stack: List[tuple] = []  # (tag, kind) kind: "skip" | "block" | "inline"
+        self.blocks: List[_Block] = []
+        self.skip_depth = 0
+        self.link_depth = 0
+        self.seq = 0
+        self.node_count = 0
+        self.paragraphs: List[Dict] = []
+        self.scores: Dict[int, int] = {}
+        self.depths: Dict[int, int] = {}
+
+    def _is_boilerplate(self, tag: str, attrs: Dict[str, str]) -> bool:
+        if tag in NEVER_SKIP_TAGS:
+            return False
+        marker = f"{attrs.get('class', '')} {attrs.get('id', '')} {attrs.get('role', '')}"
+        if not marker.strip():
+            return False
+        return bool(_BOILERPLATE_RE.search(marker)) and not _CONTENT_RE.search(marker)
+
+    def start(self, tag: str, attrs: Dict[str, str]):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in VOID_TAGS:
+            if tag == "br" and self.skip_depth == 0:
+                self.data("\n")
+            return
+
+        if self.skip_depth or tag in SKIP_TAGS or self._is_boilerplate(tag, attrs) or attrs.get("aria-hidden") == "true":
+            self.skip_depth += 1
+            self.stack.append((tag, "skip"))
+            return
+
+        if tag in BLOCK_TAGS:
+            self.node_count += 1
+            ancestors = (self.blocks[-1].ancestors + [self.blocks[-1].node_id]) if self.blocks else []
+            block = _Block(self.node_count, tag, ancestors)
+            self.depths[block.node_id] = len(ancestors)
+            self.blocks.append(block)
+            self.stack.append((tag, "block"))
+            return
+
+        if tag == "a":
+            self.link_depth += 1
+        self.stack.append((tag, "inline"))
+
+    def end(self, tag: str):
+        tag = tag.lower() if isinstance(tag, str) else ""
+        if tag in VOID_TAGS:
+            return
+        # 닫는 태그가 어긋난 HTML: 같은 태그가 열려 있을 때만 그 위치까지 닫는다.
+        if not any(t == tag for t, _ in self.stack):
+            return
+        while self.stack:
+            open_tag, kind = self.stack.pop()
+            self._close(open_tag, kind)
+            if open_tag == tag:
+                break
+
+    def _close(self, tag: str, kind: str):
+        if kind == "skip":
+            self.skip_depth -= 1
+        elif kind == "inline":
+            if tag == "a":
+                self.link_depth -= 1
+        elif kind == "block":
+            self._finish_block(self.blocks.pop())
+
+    def data(self, text: str):
+        if self.skip_depth or not self.blocks or not text:
+            return
+        block = self.blocks[-1]
+        if block.order is None and text.strip():
+            self.seq += 1
+            block.order = self.seq
+        block.parts.append(text)
+        if self.link_depth:
+            block.link_chars += len(text.strip())
+
+    def _finish_block(self, block: _Block):
+        text = _WS_RE.sub(" ", "".join(block.parts)).strip()
+        if not text:
+            return
+        link_density = min(1.0, block.link_chars / len(text))
+        good = len(text) >= MIN_PARAGRAPH_CHARS and link_density <= MAX_LINK_DENSITY
+        self.paragraphs.append({
+            "text": text,
+            "order": block.order or 0,
+            "path": block.ancestors + [block.node_id],
+            "good": good,
+            "link_density": link_density,
+        })
+        if good:
+            for node_id in block.ancestors + [block.node_id]:
+                self.scores[node_id] = self.scores.get(node_id, 0) + len(text)
+
+    def close(self):
+        while self.stack:
+            tag, kind = self.stack.pop()
+            self._close(tag, kind)
+        return self
+
+    def result(self) -> str:
+        if not self.scores:
+            return ""
+        total = max(self.scores.values())
+        # 좋은 문단 대부분을 포함하는 가장 깊은 블록
+        container = max(
+            (node_id for node_id, score in self.scores.items() if score >= total * CONTAINER_COVERAGE),
+            key=lambda node_id: self.depths[node_id],
+        )
+        selected = [
+            p for p in self.paragraphs
+            if container in p["path"] and (
+                p["good"] or (len(p["text"]) >= MIN_SHORT_CHARS and p["link_density"] <= MAX_SHORT_LINK_DENSITY)
+            )
+        ]
+        selected.sort(key=lambda p: p["order"])
+        return "\n\n".join(p["text"] for p in selected)
+
+
+class _StdlibParser(HTMLParser):
+    """표준 라이브러리 html.parser를 수집기에 연결"""
+
+    def __init__(self, collector: _DensityCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, {k: v or "" for k, v in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.collector.start(tag, {k: v or "" for k, v in attrs})
+        if tag.lower() not in VOID_TAGS:
+            self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+class _LxmlTarget:
+    """lxml target 파서 인터페이스를 수집기에 연결"""
+
+    def __init__(self, collector: _DensityCollector):
+        self.collector = collector
+
+    def start(self, tag, attrib):
+        self.collector.start(tag, dict(attrib))
+
+    def end(self, tag):
+        self.collector.end(tag)
+
+    def data(self, data):
+        self.collector.data(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return self.collector.close()
+
+
+def decode_html(content: Union[str, bytes], encoding: Optional[str] = None) -> str:
+    """응답 본문을 문자열로 변환 (헤더 charset -> meta charset -> UTF-8 순)"""
+    if isinstance(content, str):
+        return content
+    if not encoding:
+        match = _META_CHARSET_RE.search(content[:4096])
+        encoding = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def extract_article_text(content: Union[str, bytes], encoding: Optional[str] = None, use_lxml: bool = True) -> str:
+    """
+    HTML에서 기사 본문 텍스트 추출
+
+    Args:
+        content: HTML (str 또는 bytes)
+        encoding: 응답 헤더의 charset (없으면 meta charset/UTF-8)
+        use_lxml: lxml이 설치되어 있으면 사용
+
+    Returns:
+        str: 문단을 빈 줄로 구분한 본문 (찾지 못하면 빈 문자열)
+    """
+    text = decode_html(content, encoding)
+    collector = _DensityCollector()
+    if use_lxml and LXML_AVAILABLE:
+        parser = etree.HTMLParser(target=_LxmlTarget(collector), remove_comments=True)
+        parser.feed(text)
+        parser.close()
+    else:
+        parser = _StdlibParser(collector)
+        parser.feed(text)
+        parser.close()
+        collector.close()
+    return collector.result()
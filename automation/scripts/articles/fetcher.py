@@ -0,0 +1,123 @@
+"""
+기사 본문 동시 추출
+여러 기사 URL을 병렬로 가져오되, 같은 호스트에는 동시 요청 수와 요청 간격을 제한한다 (전역 sleep 대신 호스트별 예의).
+전체 마감 시간을 넘기면 끝난 것만 돌려주고, 결과는 항상 입력 순서를 따른다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_WORKERS = 6
+DEFAULT_PER_HOST = 2
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_TIMEOUT = 10
+DEFAULT_DEADLINE = 60
+
+
+class HostThrottle:
+    """호스트별 동시 요청 수 제한 + 같은 호스트 요청 사이 최소 간격"""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, min_interval: float = DEFAULT_MIN_INTERVAL):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._slots: Dict[str, threading.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _slot(self, host: str) -> threading.Semaphore:
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.Semaphore(self.per_host)
+            return self._slots[host]
+
+    def _reserve_start(self, host: str) -> float:
+        """이 호스트에 다음 요청을 보내도 되는 시각을 예약한다."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+            return start
+
+    def run(self, url: str, func: Callable[[], Optional[str]], run_deadline: float) -> Optional[str]:
+        host = urlsplit(url).netloc.lower()
+        slot = self._slot(host)
+        if not slot.acquire(timeout=max(0.0, run_deadline - time.monotonic())):
+            return None
+        try:
+            delay = self._reserve_start(host) - time.monotonic()
+            if delay > 0:
+                if time.monotonic() + delay >= run_deadline:
+                    return None
+                time.sleep(delay)
+            return func()
+        finally:
+            slot.release()
+
+
+def extract_all(
+    urls: List[str],
+    extract: Callable[[str, float], Optional[str]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host: int = DEFAULT_PER_HOST,
+    min_interval: float = DEFAULT_MIN_INTERVAL,
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+    throttle: Optional[HostThrottle] = None,
+) -> List[Optional[str]]:
+    """
+    기사 본문을 병렬로 추출한다.
+
+    Args:
+        urls: 기사 URL 목록
+        extract: extract(url, timeout) -> 본문 또는 None
+        max_workers: 전체 동시 요청 수
+        per_host: 호스트당 동시 요청 수
+        min_interval: 같은 호스트 요청 시작 사이 최소 간격(초)
+        timeout: 요청 하나당 타임아웃(초). 마감 시간이 가까우면 남은 시간으로 줄인다.
+        deadline: 전체 마감 시간(초)
+        throttle: 여러 호출이 호스트 제한을 공유할 때 넘긴다 (없으면 per_host/min_interval로 새로 만든다)
+
+    Returns:
+        List[Optional[str]]: 입력과 같은 순서의 본문 (실패/마감 초과는 None)
+    """
+    if not urls:
+        return []
+
+    throttle = throttle or HostThrottle(per_host=per_host, min_interval=min_interval)
+    run_deadline = time.monotonic() + deadline
+
+    def _task(url: str) -> Optional[str]:
+        def _call():
+            remaining = run_deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            return extract(url, min(timeout, remaining))
+        try:
+            return throttle.run(url, _call, run_deadline)
+        except Exception as e:
+            print(f"[WARN] 기사 내용 추출 실패 ({url}): {e}")
+            return None
+
+    workers = max(1, min(max_workers, len(urls)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="article-fetch")
+    try:
+        futures = [executor.submit(_task, url) for url in urls]
+        wait(futures, timeout=deadline)
+
+        results: List[Optional[str]] = []
+        timed_out = 0
+        for future in futures:
+            if future.done():
+                results.append(future.result())
+            else:
+                future.cancel()
+                timed_out += 1
+                results.append(None)
+        if timed_out:
+            print(f"[WARN] 기사 추출 마감 시간({deadline:.0f}초) 초과: {timed_out}개는 제목/요약만 사용")
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
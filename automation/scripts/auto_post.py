@@ -4,15 +4,18 @@
 여러 에이전트를 오케스트레이션하여 매일 포스트를 생성한다.
 """
 
+import argparse
 import os
 import sys
 import json
 import random
 import re
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent.parent
@@ -25,6 +28,7 @@ from agents.writer import WriterAgent
 from agents.validator import ValidatorAgent
 from agents.post_creator import PostCreatorAgent
 from reviewer_agent import ReviewerAgent
+from pipeline.dag import StageGraph
 
 try:
     from discord_notifier import notify_post_success, notify_post_failure, save_processing_result
@@ -35,6 +39,15 @@ REQUEST_DIR = project_root / "automation" / "requests"
 PROCESSED_DIR = project_root / "automation" / "processed"
 RESULTS_DIR = project_root / "automation" / "results"
 
+# --drain 모드: 대기 중인 요청을 임대(lease) 파일로 선점해 한 번의 실행에서 모두 처리한다.
+LEASE_SUFFIX = ".lease"
+LEASE_TTL_HOURS = float(os.getenv("REQUEST_LEASE_TTL_HOURS", "3"))
+DRAIN_WORKERS = int(os.getenv("AUTO_POST_WORKERS", "2"))
+
+
+class NoTopicsError(RuntimeError):
+    """수집된 주제가 없다 (오류가 아니라 정상 종료 사유)"""
+
 
 
 def _load_existing_post_titles(posts_dir: Path) -> Set[str]:
@@ -89,262 +102,454 @@ def _select_topic(topics: List[Dict], existing_titles: Set[str]) -> Dict:
     return ranked[0]
 
 
-def _load_request() -> Dict:
-    """요청 큐에서 JSON 요청을 하나 불러온다."""
+def _read_request(req_file: Path) -> Dict:
+    """
+    요청 파일 하나를 읽는다. 파싱 실패/auto-post 대상이 아닌 요청이면 빈 dict를 돌려준다.
+
+    반복 포스팅 방지:
+    - daily 카테고리 요청은 자동 포스팅(auto-post)에서 기본적으로 처리하지 않는다.
+      (일상 글은 daily-diary 워크플로우/일상 로그 파이프라인에서 다루는 편이 자연스럽다.)
+    - daily 요청을 auto-post로 강제하려면 JSON에 force_auto_post: true 또는 pipeline: "auto_post"를 넣는다.
+    """
+    try:
+        data = json.loads(req_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        # 다른 실행이 먼저 선점(lease)했다
+        return {}
+    except Exception as e:
+        print(f"[ERROR] 요청 파일 파싱 실패: {req_file.name}: {e}")
+        return {}
+
+    topic = data.get("Topic") or data.get("title") or "N/A"
+    category_raw = (data.get("Category") or data.get("category") or "").strip().lower()
+    pipeline = (data.get("pipeline") or "").strip().lower()
+    force = bool(data.get("force_auto_post"))
+
+    if category_raw == "daily" and pipeline != "auto_post" and not force:
+        # auto-post에서 처리하지 않고, 큐에 남기면 무한 반복이 되므로 "처리됨"으로 이동해 둔다.
+        PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+        dest = PROCESSED_DIR / req_file.name
+        try:
+            shutil.move(str(req_file), dest)
+            print(f"[INFO] daily 요청을 auto-post에서 스킵: {req_file.name} -> {dest}")
+        except Exception as e:
+            print(f"[WARN] 스킵 요청 이동 실패: {req_file.name}: {e}")
+
+        # 처리 결과 파일(스킵) 기록
+        try:
+            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+            result_path = RESULTS_DIR / f"result_{req_file.stem}.json"
+            result_path.write_text(
+                json.dumps(
+                    {
+                        "request_id": req_file.stem,
+                        "status": "skipped",
+                        "reason": "daily request is skipped by auto-post (use daily-diary pipeline or set force_auto_post)",
+                        "topic": topic,
+                        "processed_at": datetime.utcnow().isoformat() + "Z",
+                    },
+                    ensure_ascii=False,
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+        except Exception:
+            pass
+        return {}
+
+    print(f"[INFO] 처리할 요청 파일: {req_file.name}")
+    print(f"[INFO] 요청 내용 - 주제: {topic}, 카테고리: {category_raw or 'N/A'}")
+    data["_request_file"] = req_file
+    return data
+
+
+def _pending_request_files() -> List[Path]:
+    """대기 중인 요청 파일 목록 (이름순)"""
     if not REQUEST_DIR.exists():
         print("[INFO] 요청 디렉토리가 존재하지 않습니다.")
-        return {}
+        return []
     request_files = sorted(REQUEST_DIR.glob("*.json"))
     if not request_files:
         print("[INFO] 대기 중인 요청이 없습니다.")
-        return {}
+        return []
 
     print(f"[INFO] 발견된 요청 파일 수: {len(request_files)}")
     for i, f in enumerate(request_files[:5], 1):  # 최대 5개만 출력
         print(f"  {i}. {f.name}")
+    return request_files
+
+
+def _load_request() -> Dict:
+    """요청 큐에서 JSON 요청을 하나 불러온다."""
+    for req_file in _pending_request_files():
+        data = _read_request(req_file)
+        if data:
+            return data
+
+    if REQUEST_DIR.exists():
+        print("[INFO] 처리 가능한 요청이 없습니다.")
+    return {}
+
+
+def _lease_owner() -> str:
+    """임대 파일 이름에 넣을 실행 식별자 (Actions 실행 ID 또는 로컬 + PID)"""
+    run_id = re.sub(r"[^0-9A-Za-z_-]", "", os.getenv("GITHUB_RUN_ID") or "local")
+    return f"{run_id}-{os.getpid()}"
 
-    # 반복 포스팅 방지:
-    # - daily 카테고리 요청은 자동 포스팅(auto-post)에서 기본적으로 처리하지 않는다.
-    #   (일상 글은 daily-diary 워크플로우/일상 로그 파이프라인에서 다루는 편이 자연스럽다.)
-    # - daily 요청을 auto-post로 강제하려면 JSON에 force_auto_post: true 또는 pipeline: "auto_post"를 넣는다.
-    for req_file in request_files:
+
+def _lease_origin(lease_file: Path) -> Path:
+    """임대 파일 -> 원래 요청 파일 경로 (<이름>.json.<소유자>.lease -> <이름>.json)"""
+    name = lease_file.name
+    return lease_file.with_name(name[: name.rindex(".json.") + len(".json")])
+
+
+def _reclaim_stale_leases():
+    """LEASE_TTL_HOURS보다 오래된 임대 파일은 처리하던 실행이 죽은 것으로 보고 큐로 되돌린다."""
+    if not REQUEST_DIR.exists():
+        return
+    now = time.time()
+    for lease_file in REQUEST_DIR.glob(f"*.json.*{LEASE_SUFFIX}"):
         try:
-            data = json.loads(req_file.read_text(encoding="utf-8"))
-        except Exception as e:
-            print(f"[ERROR] 요청 파일 파싱 실패: {req_file.name}: {e}")
+            age = now - lease_file.stat().st_mtime
+        except OSError:
+            continue
+        if age < LEASE_TTL_HOURS * 3600:
+            continue
+        original = _lease_origin(lease_file)
+        try:
+            os.rename(lease_file, original)
+            print(f"[WARN] 만료된 요청 임대를 회수: {lease_file.name} -> {original.name} ({age / 3600:.1f}시간 경과)")
+        except OSError:
             continue
 
-        topic = data.get("Topic") or data.get("title") or "N/A"
-        category_raw = (data.get("Category") or data.get("category") or "").strip().lower()
-        pipeline = (data.get("pipeline") or "").strip().lower()
-        force = bool(data.get("force_auto_post"))
 
-        if category_raw == "daily" and pipeline != "auto_post" and not force:
-            # auto-post에서 처리하지 않고, 큐에 남기면 무한 반복이 되므로 "처리됨"으로 이동해 둔다.
-            PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-            dest = PROCESSED_DIR / req_file.name
-            try:
-                shutil.move(str(req_file), dest)
-                print(f"[INFO] daily 요청을 auto-post에서 스킵: {req_file.name} -> {dest}")
-            except Exception as e:
-                print(f"[WARN] 스킵 요청 이동 실패: {req_file.name}: {e}")
-
-            # 처리 결과 파일(스킵) 기록
-            try:
-                RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-                result_path = RESULTS_DIR / f"result_{req_file.stem}.json"
-                result_path.write_text(
-                    json.dumps(
-                        {
-                            "request_id": req_file.stem,
-                            "status": "skipped",
-                            "reason": "daily request is skipped by auto-post (use daily-diary pipeline or set force_auto_post)",
-                            "topic": topic,
-                            "processed_at": datetime.utcnow().isoformat() + "Z",
-                        },
-                        ensure_ascii=False,
-                        indent=2,
-                    ),
-                    encoding="utf-8",
-                )
-            except Exception:
-                pass
+def _claim_requests() -> List[Dict]:
+    """
+    대기 중인 요청을 모두 선점한다.
+    요청 파일을 <이름>.json.<소유자>.lease로 rename해서 임대를 잡는다 (rename은 원자적이라
+    같은 큐를 보는 다른 실행과 한 요청을 두 번 처리하지 않는다). 처리에 성공하면 임대 파일을
+    처리됨 디렉토리로 옮기고, 실패하면 원래 이름으로 되돌려 다음 실행에서 다시 시도한다.
+    """
+    _reclaim_stale_leases()
+    owner = _lease_owner()
+    claimed = []
+    for req_file in _pending_request_files():
+        data = _read_request(req_file)
+        if not data:
+            continue
+        lease_file = req_file.with_name(f"{req_file.name}.{owner}{LEASE_SUFFIX}")
+        try:
+            os.rename(req_file, lease_file)
+        except FileNotFoundError:
+            print(f"[INFO] 다른 실행이 먼저 선점한 요청: {req_file.name}")
+            continue
+        except OSError as e:
+            print(f"[WARN] 요청 선점 실패: {req_file.name}: {e}")
             continue
+        try:
+            # rename은 수정 시각을 유지하므로, 임대 시작 시각으로 갱신해 둔다 (만료 판정 기준)
+            os.utime(lease_file)
+        except OSError:
+            pass
+        data["_lease_file"] = lease_file
+        claimed.append(data)
 
-        print(f"[INFO] 처리할 요청 파일: {req_file.name}")
-        print(f"[INFO] 요청 내용 - 주제: {topic}, 카테고리: {category_raw or 'N/A'}")
-        data["_request_file"] = req_file
-        return data
+    if claimed:
+        print(f"[INFO] 선점한 요청 수: {len(claimed)}")
+    return claimed
 
-    print("[INFO] 처리 가능한 요청이 없습니다.")
-    return {}
 
+def _settle_request(request_data: Dict, success: bool):
+    """
+    요청 파일 정리
+    - 성공: (임대 파일 또는 원본을) 처리됨 디렉토리로 이동
+    - 실패: 임대를 풀어 큐로 되돌린다 (임대 없이 처리한 원본은 그대로 둔다)
+    """
+    request_file = request_data.get("_request_file")
+    lease_file = request_data.get("_lease_file")
+    if not request_file:
+        return
+    if success:
+        PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+        dest = PROCESSED_DIR / request_file.name
+        try:
+            shutil.move(str(lease_file or request_file), dest)
+            print(f"[INFO] 요청 파일 이동: {request_file.name} -> {dest}")
+        except Exception as e:
+            print(f"[WARN] 요청 파일 이동 실패: {e}")
+    elif lease_file:
+        try:
+            os.rename(lease_file, request_file)
+            print(f"[INFO] 실패한 요청을 큐로 되돌림: {request_file.name}")
+        except OSError as e:
+            print(f"[WARN] 요청 임대 해제 실패: {lease_file.name}: {e}")
+
+
+def _save_result(
+    request_id: str,
+    status: str,
+    topic: str,
+    post_path: Optional[str] = None,
+    error: Optional[str] = None,
+):
+    """처리 결과 파일(result_<요청 ID>.json) 저장 (알림 모듈이 없어도 같은 형식으로 남긴다)"""
+    try:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        if DISCORD_NOTIFIER_AVAILABLE:
+            save_processing_result(str(RESULTS_DIR), request_id, status, topic, post_path, error)
+            return
+        (RESULTS_DIR / f"result_{request_id}.json").write_text(
+            json.dumps(
+                {
+                    "request_id": request_id,
+                    "status": status,
+                    "topic": topic,
+                    "post_path": post_path,
+                    "error": error,
+                    "processed_at": datetime.utcnow().isoformat() + "Z",
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    except Exception as e:
+        print(f"[WARN] 처리 결과 저장 실패 ({request_id}): {e}")
+
+
+def _build_agents(gemini_key: str) -> Dict:
+    """에이전트 초기화 (역할별)"""
+    return {
+        "topic": TopicCollectorAgent(),
+        "researcher": ResearcherAgent(gemini_key),
+        "analyst": AnalystAgent(gemini_key),
+        "writer": WriterAgent(gemini_key),
+        "reviewer": ReviewerAgent(gemini_key),
+        "validator": ValidatorAgent(),
+        "post_creator": PostCreatorAgent(),
+    }
+
+
+def _request_topic(request_data: Dict) -> Dict:
+    """디스코드 요청을 주제 정보로 변환한다."""
+    request_file = request_data.get("_request_file")
+    print("\n[1단계] 디스코드 요청 처리 중...")
+    print(f"[INFO] 요청 파일: {request_file.name if request_file else 'N/A'}")
+    req_title = request_data.get("Topic") or request_data.get("title") or "Untitled"
+    req_category = (request_data.get("Category") or "document").lower()
+    req_situation = request_data.get("Situation") or ""
+    mapped_category = req_category if req_category in ["dev", "study", "daily", "document"] else "document"
+    selected_topic = {
+        "title": req_title,
+        "description": req_situation,
+        "category": mapped_category,
+        "tags": [],
+        "source": "discord",
+        "source_url": "",
+    }
+    print(f"[OK] 요청 주제: {selected_topic.get('title')}")
+    print(f"[OK] 카테고리: {mapped_category}")
+    print(f"[OK] 요청 출처: {request_data.get('source', 'discord')}")
+    return selected_topic
+
+
+def _collect_topics(agents: Dict) -> List[Dict]:
+    print("\n[1단계] 주제 수집 중...")
+    topics = agents["topic"].collect_topics()
+    if not topics:
+        raise NoTopicsError("수집된 주제가 없습니다.")
+    print(f"[OK] {len(topics)}개의 주제를 수집했습니다.")
+    for i, topic in enumerate(topics[:3], 1):
+        print(f"   {i}. {topic.get('title', 'N/A')}")
+    return topics
+
+
+def _pick_topic(topics: List[Dict], existing_titles: Set[str]) -> Dict:
+    # 이미 발행된 글과 동일한 제목은 우선 제외하여 선택
+    selected_topic = _select_topic(topics, existing_titles)
+    print(f"\n[선택] 주제: {selected_topic.get('title', 'N/A')}")
+    return selected_topic
+
+
+def _request_research(request_data: Dict, topic: Dict) -> Dict:
+    """요청 기반: 메모/상황/액션을 조사 데이터로 간주 (조사 에이전트를 호출하지 않는다)"""
+    memo_text = f"상황: {topic.get('description','')}\n" \
+                f"액션: {request_data.get('Action','')}\n" \
+                f"메모: {request_data.get('Memo','')}"
+    print("[OK] 요청 기반 조사 데이터 사용")
+    return {
+        "raw_research": memo_text,
+        "sources": []
+    }
+
+
+def _bloomberg_research(topic: Dict) -> Dict:
+    """Bloomberg 다이제스트: RSS 제목/요약/링크를 그대로 조사 데이터로 사용한다(원문 전문 수집 금지)."""
+    items = topic.get("digest_items", [])
+    lines = ["전일 Bloomberg RSS 수집 항목(제목/요약/링크):", ""]
+    sources = []
+    for i, it in enumerate(items, 1):
+        t = (it.get("title") or "").strip()
+        u = (it.get("link") or "").strip()
+        p = (it.get("published_at") or "").strip()
+        s = (it.get("summary") or "").strip()
+        if u:
+            sources.append(u)
+        lines.append(f"[{i}] {t}")
+        if p:
+            lines.append(f"- 게시시각(KST): {p}")
+        if s:
+            lines.append(f"- 요약: {s}")
+        if u:
+            lines.append(f"- 링크: {u}")
+        lines.append("")
+    print(f"[OK] Bloomberg RSS 기반 조사 데이터 사용 (항목 {len(items)}개)")
+    return {
+        "raw_research": "\n".join(lines),
+        "sources": sources[:50],
+    }
+
+
+def _research(agents: Dict, topic: Dict) -> Dict:
+    print("\n[2단계] 심층 조사 중...")
+    if topic.get("source") == "bloomberg_rss" and topic.get("digest_items"):
+        return _bloomberg_research(topic)
+    research_data = agents["researcher"].research_topic(topic)
+    if not research_data or not research_data.get('raw_research'):
+        print("[WARN] 조사 데이터가 부족합니다. 계속 진행합니다.")
+    print(f"[OK] 조사 완료 (출처: {len(research_data.get('sources', []))}개)")
+    return research_data
+
+
+def _analyze(agents: Dict, topic: Dict, research: Dict) -> Dict:
+    print("\n[3단계] 데이터 분석 중...")
+    analysis_data = agents["analyst"].analyze(research, topic)
+    if not analysis_data or not analysis_data.get('insights'):
+        print("[WARN] 분석 데이터가 부족합니다. 계속 진행합니다.")
+    print("[OK] 분석 완료")
+    return analysis_data
+
+
+def _write(agents: Dict, topic: Dict, research: Dict, analysis: Dict) -> str:
+    print("\n[4단계] 글 작성 중...")
+    content_text = agents["writer"].write(topic, research, analysis)
+    if not content_text:
+        raise RuntimeError("글 작성에 실패했습니다.")
+    print(f"[OK] 작성 완료 ({len(content_text)}자)")
+    return content_text
+
+
+def _review(agents: Dict, topic: Dict, draft: str) -> str:
+    print("\n[4-1단계] 작성물 검토/교정 중...")
+    final_content_text = agents["reviewer"].review(draft, topic.get("category", "document"))
+    if not final_content_text:
+        raise RuntimeError("검토 결과가 비었습니다.")
+    return final_content_text
+
+
+def _print_validation(validation_result: Dict):
+    if not validation_result['valid']:
+        print("[WARN] 검증 실패:")
+        for error in validation_result.get('errors', []):
+            print(f"   - {error}")
+    if validation_result.get('warnings'):
+        print("[WARN] 경고:")
+        for warning in validation_result['warnings']:
+            print(f"   - {warning}")
+
+
+def _preflight(agents: Dict, topic: Dict) -> Dict:
+    """본문과 무관한 검증(제목/카테고리)을 글 생성 전에 먼저 수행한다."""
+    validation_result = agents["validator"].validate_meta({
+        'title': topic.get('title', ''),
+        'category': topic.get('category', 'document'),
+    })
+    _print_validation(validation_result)
+    if validation_result.get('errors'):
+        raise RuntimeError("주제 검증 실패: " + "; ".join(validation_result['errors']))
+    return validation_result
+
+
+def _validate(agents: Dict, topic: Dict, review: str, preflight: Dict) -> Dict:
+    """본문 검증 후 포스트에 쓸 콘텐츠 구조를 돌려준다."""
+    content = {
+        'title': topic.get('title', ''),
+        'content': review,
+        'category': topic.get('category', 'document'),
+        'tags': topic.get('tags', []),
+        'date': datetime.now().strftime('%Y-%m-%d'),
+        'author': 'rldhkstopic',
+        'source': topic.get('source', 'auto'),
+        'source_url': topic.get('source_url', '')
+    }
+    print("\n[5단계] 콘텐츠 검증 중...")
+    validation_result = agents["validator"].validate_body(content)
+    _print_validation(validation_result)
+    if validation_result.get('errors'):
+        raise RuntimeError("치명적 오류로 인해 중단합니다: " + "; ".join(validation_result['errors']))
+    print("[OK] 검증 완료")
+    return content
+
+
+def _create_post(agents: Dict, topic: Dict, validate: Dict) -> str:
+    print("\n[6단계] 포스트 파일 생성 중...")
+    post_path = agents["post_creator"].create_post(validate, topic)
+    if not post_path:
+        raise RuntimeError("포스트 생성에 실패했습니다.")
+    print(f"[OK] 포스트 생성 완료: {post_path}")
+    return post_path
+
+
+def _build_stage_graph(gemini_key: str, request_data: Dict) -> StageGraph:
+    """
+    포스팅 단계 의존성 그래프
 
-def main():
-    """메인 실행 함수"""
-    print("=" * 60)
-    print("자동 포스팅 시스템 시작")
-    print(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 60)
-    
-    # 환경 변수 확인
-    gemini_key = os.getenv('GEMINI_API_KEY')
-    if not gemini_key:
-        print("[ERROR] GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
-        sys.exit(1)
-    
-    # Discord 웹훅 URL (선택 사항)
-    discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
-    
-    # 에이전트 초기화 (역할별)
-    topic_agent = TopicCollectorAgent()
-    researcher_agent = ResearcherAgent(gemini_key)
-    analyst_agent = AnalystAgent(gemini_key)
-    writer_agent = WriterAgent(gemini_key)
-    reviewer_agent = ReviewerAgent(gemini_key)
-    validator_agent = ValidatorAgent()
-    post_creator = PostCreatorAgent()
+    요청 모드:  agents, topic -> preflight, research(메모) -> analysis -> draft -> review -> validate -> post
+    주제 모드:  agents -> topics ┐
+                existing_titles ─┴> topic -> preflight, research -> analysis -> draft -> review -> validate -> post
+    preflight(제목/카테고리 검증)는 조사 단계와 동시에 돌고, 실패하면 이후 LLM 단계를 시작하지 않는다.
+    """
+    graph = StageGraph("auto_post")
+    graph.add("agents", lambda: _build_agents(gemini_key))
+    if request_data:
+        graph.add("topic", lambda: _request_topic(request_data))
+        graph.add("research", lambda topic: _request_research(request_data, topic), deps=["topic"])
+    else:
+        graph.add("topics", _collect_topics, deps=["agents"])
+        graph.add("existing_titles", lambda: _load_existing_post_titles(project_root / "_posts"))
+        graph.add("topic", _pick_topic, deps=["topics", "existing_titles"])
+        graph.add("research", _research, deps=["agents", "topic"])
+    graph.add("preflight", _preflight, deps=["agents", "topic"])
+    graph.add("analysis", _analyze, deps=["agents", "topic", "research"])
+    graph.add("draft", _write, deps=["agents", "topic", "research", "analysis"])
+    graph.add("review", _review, deps=["agents", "topic", "draft"])
+    graph.add("validate", _validate, deps=["agents", "topic", "review", "preflight"])
+    graph.add("post", _create_post, deps=["agents", "topic", "validate"])
+    return graph
+
+
+def _run_pipeline(gemini_key: str, discord_webhook: str, request_data: Dict) -> str:
+    """
+    요청 하나(또는 요청이 없으면 주제 수집 모드)를 단계 그래프로 처리한다.
+
+    Returns:
+        str: "success" | "no_topics" | "failure"
+    """
+    request_mode = bool(request_data)
+    request_file = request_data.get("_request_file") if request_mode else None
+    request_id = request_data.get("request_id") or (request_file.stem if request_file else None) if request_mode else None
+    request_source = request_data.get("source", "discord") if request_mode else None
+    graph = _build_stage_graph(gemini_key, request_data)
     
     try:
-        # 0. 요청 큐 우선 처리
-        request_data = _load_request()
-        request_mode = bool(request_data)
-        request_file = request_data.get("_request_file") if request_mode else None
-        request_id = request_data.get("request_id") or (request_file.stem if request_file else None) if request_mode else None
-        request_source = request_data.get("source", "discord") if request_mode else None
-
-        # 1. 주제 수집
-        if request_mode:
-            print("\n[1단계] 디스코드 요청 처리 중...")
-            print(f"[INFO] 요청 파일: {request_file.name if request_file else 'N/A'}")
-            req_title = request_data.get("Topic") or request_data.get("title") or "Untitled"
-            req_category = (request_data.get("Category") or "document").lower()
-            req_situation = request_data.get("Situation") or ""
-            req_action = request_data.get("Action") or ""
-            req_memo = request_data.get("Memo") or ""
-            mapped_category = req_category if req_category in ["dev", "study", "daily", "document"] else "document"
-            selected_topic = {
-                "title": req_title,
-                "description": req_situation,
-                "category": mapped_category,
-                "tags": [],
-                "source": "discord",
-                "source_url": "",
-            }
-            print(f"[OK] 요청 주제: {selected_topic.get('title')}")
-            print(f"[OK] 카테고리: {mapped_category}")
-            print(f"[OK] 요청 출처: {request_source}")
-        else:
-            print("\n[1단계] 주제 수집 중...")
-            topics = topic_agent.collect_topics()
-            if not topics:
-                print("[WARN] 수집된 주제가 없습니다. 종료합니다.")
-                return  # 주제가 없으면 정상 종료
-            
-            print(f"[OK] {len(topics)}개의 주제를 수집했습니다.")
-            for i, topic in enumerate(topics[:3], 1):
-                print(f"   {i}. {topic.get('title', 'N/A')}")
-            
-            # 이미 발행된 글과 동일한 제목은 우선 제외하여 선택
-            existing_titles = _load_existing_post_titles(project_root / "_posts")
-            selected_topic = _select_topic(topics, existing_titles)
-            print(f"\n[선택] 주제: {selected_topic.get('title', 'N/A')}")
-        
-        # 2. 심층 조사 (ResearcherAgent)
-        print("\n[2단계] 심층 조사 중...")
-        if request_mode:
-            # 요청 기반: 메모/상황/액션을 조사 데이터로 간주
-            memo_text = f"상황: {selected_topic.get('description','')}\n" \
-                        f"액션: {request_data.get('Action','')}\n" \
-                        f"메모: {request_data.get('Memo','')}"
-            research_data = {
-                "raw_research": memo_text,
-                "sources": []
-            }
-            print("[OK] 요청 기반 조사 데이터 사용")
-        elif selected_topic.get("source") == "bloomberg_rss" and selected_topic.get("digest_items"):
-            # Bloomberg 다이제스트: RSS 제목/요약/링크를 그대로 조사 데이터로 사용한다(원문 전문 수집 금지).
-            items = selected_topic.get("digest_items", [])
-            lines = ["전일 Bloomberg RSS 수집 항목(제목/요약/링크):", ""]
-            sources = []
-            for i, it in enumerate(items, 1):
-                t = (it.get("title") or "").strip()
-                u = (it.get("link") or "").strip()
-                p = (it.get("published_at") or "").strip()
-                s = (it.get("summary") or "").strip()
-                if u:
-                    sources.append(u)
-                lines.append(f"[{i}] {t}")
-                if p:
-                    lines.append(f"- 게시시각(KST): {p}")
-                if s:
-                    lines.append(f"- 요약: {s}")
-                if u:
-                    lines.append(f"- 링크: {u}")
-                lines.append("")
-            research_data = {
-                "raw_research": "\n".join(lines),
-                "sources": sources[:50],
-            }
-            print(f"[OK] Bloomberg RSS 기반 조사 데이터 사용 (항목 {len(items)}개)")
-        else:
-            research_data = researcher_agent.research_topic(selected_topic)
-            if not research_data or not research_data.get('raw_research'):
-                print("[WARN] 조사 데이터가 부족합니다. 계속 진행합니다.")
-            print(f"[OK] 조사 완료 (출처: {len(research_data.get('sources', []))}개)")
-        
-        # 3. 데이터 분석 (AnalystAgent)
-        print("\n[3단계] 데이터 분석 중...")
-        analysis_data = analyst_agent.analyze(research_data, selected_topic)
-        if not analysis_data or not analysis_data.get('insights'):
-            print("[WARN] 분석 데이터가 부족합니다. 계속 진행합니다.")
-        
-        print("[OK] 분석 완료")
-        
-        # 4. 글 작성 (WriterAgent)
-        print("\n[4단계] 글 작성 중...")
-        content_text = writer_agent.write(selected_topic, research_data, analysis_data)
-        if not content_text:
-            print("[ERROR] 글 작성에 실패했습니다.")
-            sys.exit(1)
-        
-        # 4-1. 작성 후 검토 (ReviewerAgent)
-        print("\n[4-1단계] 작성물 검토/교정 중...")
-        final_content_text = reviewer_agent.review(content_text, selected_topic.get("category", "document"))
-        if not final_content_text:
-            print("[ERROR] 검토 결과가 비었습니다.")
-            sys.exit(1)
-
-        # 콘텐츠 구조화
-        content = {
-            'title': selected_topic.get('title', ''),
-            'content': final_content_text,
-            'category': selected_topic.get('category', 'document'),
-            'tags': selected_topic.get('tags', []),
-            'date': datetime.now().strftime('%Y-%m-%d'),
-            'author': 'rldhkstopic',
-            'source': selected_topic.get('source', 'auto'),
-            'source_url': selected_topic.get('source_url', '')
-        }
-        
-        print(f"[OK] 작성 완료 ({len(content_text)}자)")
-        
-        # 5. 검증
-        print("\n[5단계] 콘텐츠 검증 중...")
-        validation_result = validator_agent.validate(content)
-        if not validation_result['valid']:
-            print("[WARN] 검증 실패:")
-            for error in validation_result.get('errors', []):
-                print(f"   - {error}")
-            if validation_result.get('errors'):
-                print("[ERROR] 치명적 오류로 인해 중단합니다.")
-                sys.exit(1)
-        
-        if validation_result.get('warnings'):
-            print("[WARN] 경고:")
-            for warning in validation_result['warnings']:
-                print(f"   - {warning}")
-        
-        print("[OK] 검증 완료")
-        
-        # 6. 포스트 생성
-        print("\n[6단계] 포스트 파일 생성 중...")
-        post_path = post_creator.create_post(content, selected_topic)
-        if not post_path:
-            print("[ERROR] 포스트 생성에 실패했습니다.")
-            sys.exit(1)
-        
-        print(f"[OK] 포스트 생성 완료: {post_path}")
+        results = graph.run()
+        selected_topic = results["topic"]
+        content_text = results["draft"]
+        post_path = results["post"]
 
         # 요청 처리 완료 시 파일 이동
-        if request_mode and request_file:
-            PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-            dest = PROCESSED_DIR / request_file.name
-            try:
-                shutil.move(str(request_file), dest)
-                print(f"[INFO] 요청 파일 이동: {request_file.name} -> {dest}")
-            except Exception as e:
-                print(f"[WARN] 요청 파일 이동 실패: {e}")
+        if request_mode:
+            _settle_request(request_data, success=True)
         
         # Discord 알림 전송 (성공)
         if DISCORD_NOTIFIER_AVAILABLE and discord_webhook:
@@ -365,29 +570,30 @@ def main():
             )
         
         # 처리 결과 저장
-        if request_id and DISCORD_NOTIFIER_AVAILABLE:
-            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-            save_processing_result(
-                str(RESULTS_DIR),
-                request_id,
-                "success",
-                selected_topic.get('title', 'N/A'),
-                str(post_path),
-            )
+        if request_id:
+            _save_result(request_id, "success", selected_topic.get('title', 'N/A'), str(post_path))
         
-        print("\n" + "=" * 60)
-        print("[SUCCESS] 자동 포스팅 완료!")
-        print("=" * 60)
+        graph.print_timings()
+        return "success"
+        
+    except NoTopicsError:
+        graph.print_timings()
+        print("[WARN] 수집된 주제가 없습니다. 종료합니다.")
+        return "no_topics"  # 주제가 없으면 정상 종료
         
     except Exception as e:
+        graph.print_timings()
         error_msg = str(e)
         print(f"\n[ERROR] 오류 발생: {error_msg}")
         import traceback
         traceback.print_exc()
         
+        if request_mode:
+            _settle_request(request_data, success=False)
+        
         # Discord 알림 전송 (실패)
+        topic_title = request_data.get('Topic', '알 수 없음') if request_data else '알 수 없음'
         if DISCORD_NOTIFIER_AVAILABLE and discord_webhook:
-            topic_title = request_data.get('Topic', '알 수 없음') if request_data else '알 수 없음'
             notify_post_failure(
                 discord_webhook,
                 topic_title,
@@ -396,21 +602,81 @@ def main():
             )
         
         # 처리 결과 저장 (실패)
-        if request_id and DISCORD_NOTIFIER_AVAILABLE:
-            RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-            topic_title = request_data.get('Topic', '알 수 없음') if request_data else '알 수 없음'
-            save_processing_result(
-                str(RESULTS_DIR),
-                request_id,
-                "failure",
-                topic_title,
-                None,
-                error_msg,
-            )
+        if request_id:
+            _save_result(request_id, "failure", topic_title, None, error_msg)
         
+        return "failure"
+
+
+def _drain_queue(gemini_key: str, discord_webhook: str, workers: int) -> List[str]:
+    """
+    대기 중인 요청을 모두 선점해 최대 workers개씩 동시에 처리한다.
+    요청이 하나도 없으면 평소처럼 주제 수집 모드로 한 번 실행한다.
+
+    Returns:
+        List[str]: 요청별 처리 상태
+    """
+    requests = _claim_requests()
+    if not requests:
+        return [_run_pipeline(gemini_key, discord_webhook, {})]
+
+    workers = max(1, min(workers, len(requests)))
+    print(f"[INFO] 요청 큐 비우기: {len(requests)}건, 동시 처리 {workers}개")
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auto_post") as executor:
+        statuses = list(executor.map(lambda data: _run_pipeline(gemini_key, discord_webhook, data), requests))
+
+    print(f"[INFO] 요청 큐 처리 결과 ({time.monotonic() - started:.1f}초):")
+    for data, status in zip(requests, statuses):
+        print(f"  {data['_request_file'].name}: {status}")
+    return statuses
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="자동 블로그 포스팅")
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        default=os.getenv("AUTO_POST_DRAIN", "").strip().lower() in ("1", "true", "yes"),
+        help="대기 중인 요청을 한 번에 모두 처리 (기본: 요청 1건 또는 주제 수집 1회)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DRAIN_WORKERS,
+        help=f"--drain 모드 동시 처리 수 (기본: {DRAIN_WORKERS})",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("자동 포스팅 시스템 시작")
+    print(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+    
+    # 환경 변수 확인
+    gemini_key = os.getenv('GEMINI_API_KEY')
+    if not gemini_key:
+        print("[ERROR] GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
+        sys.exit(1)
+    
+    # Discord 웹훅 URL (선택 사항)
+    discord_webhook = os.getenv('DISCORD_WEBHOOK_URL')
+    
+    if args.drain:
+        statuses = _drain_queue(gemini_key, discord_webhook, args.workers)
+    else:
+        # 0. 요청 큐 우선 처리 (요청 여부에 따라 단계 그래프 구성이 달라진다)
+        statuses = [_run_pipeline(gemini_key, discord_webhook, _load_request())]
+
+    # 일부라도 성공하면 결과를 커밋할 수 있도록 정상 종료한다 (실패한 요청은 큐에 남아 다음 실행에서 재시도)
+    if "success" in statuses:
+        print("\n" + "=" * 60)
+        print(f"[SUCCESS] 자동 포스팅 완료! ({statuses.count('success')}/{len(statuses)}건)")
+        print("=" * 60)
+    elif "failure" in statuses:
         sys.exit(1)
 
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+기사 본문 추출 벤치마크
+benchmarks/fixtures/articles/*.html(저장한 기사 페이지)과 같은 이름의 .txt(정답 본문)로
+기존 BeautifulSoup 선택자 방식과 텍스트 밀도 추출기(lxml / html.parser)의 속도와 추출 품질을 비교한다.
+
+픽스처:
+- article_with_chrome, blog_post, news_wrapper, press_release: 뉴스/블로그 페이지 구조를 흉내 낸 합성 페이지
+- rust_book_intro: 실제 저장한 페이지 (Rust 툴체인 문서에 포함된 The Rust Programming Language 서문, MIT/Apache-2.0).
+  사이드바/메뉴/이전·다음 링크가 붙은 mdBook 원본 그대로이며, 정답 .txt는 추출기와 별도로 <main> 안의 제목/문단/목록/표 텍스트만 모았다.
+
+품질: 단어 단위 정밀도(추출문 중 정답에 있는 비율) / 재현율(정답 중 추출된 비율) / F1
+
+실행: python automation/scripts/benchmarks/bench_article_extractor.py
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from articles.extract import LXML_AVAILABLE, extract_article_text
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "articles"
+REPEAT = 50
+_WORD_RE = re.compile(r"\w+")
+
+
+def selector_baseline(content: bytes) -> str:
+    """기존 fetch_article_content의 추출 방식 (BeautifulSoup + 선택자 순회)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
+        tag.decompose()
+
+    article_content = None
+    selectors = [
+        'article', '[class*="article"]', '[class*="content"]', '[class*="post"]',
+        '[id*="article"]', '[id*="content"]', 'main', '.entry-content',
+        '.article-body', '.post-content'
+    ]
+    for selector in selectors:
+        article = soup.select_one(selector)
+        if article:
+            article_content = article
+            break
+    if not article_content:
+        article_content = soup.find('body') or soup
+
+    text = article_content.get_text(separator='\n', strip=True)
+    text = re.sub(r'\n\s*\n+', '\n\n', text)
+    return re.sub(r' +', ' ', text)
+
+
+def word_scores(extracted: str, expected: str):
+    got = Counter(w.lower() for w in _WORD_RE.findall(extracted))
+    want = Counter(w.lower() for w in _WORD_RE.findall(expected))
+    overlap = sum((got & want).values())
+    precision = overlap / max(1, sum(got.values()))
+    recall = overlap / max(1, sum(want.values()))
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main():
+    fixtures = sorted(FIXTURES_DIR.glob("*.html"))
+    if not fixtures:
+        print(f"[ERROR] 픽스처가 없습니다: {FIXTURES_DIR}")
+        return
+
+    methods = []
+    if BS4_AVAILABLE:
+        methods.append(("기존(BS4 선택자)", selector_baseline))
+    if LXML_AVAILABLE:
+        methods.append(("밀도 추출(lxml)", lambda content: extract_article_text(content)))
+    methods.append(("밀도 추출(html.parser)", lambda content: extract_article_text(content, use_lxml=False)))
+
+    print(f"픽스처 {len(fixtures)}개, 반복 {REPEAT}회")
+    print(f"{'픽스처':<22} {'방식':<22} {'ms/페이지':>10} {'정밀도':>7} {'재현율':>7} {'F1':>6}")
+    print("-" * 82)
+
+    totals = {name: [0.0, 0.0, 0.0, 0.0] for name, _ in methods}
+    for path in fixtures:
+        content = path.read_bytes()
+        expected = path.with_suffix(".txt").read_text(encoding="utf-8")
+        for name, func in methods:
+            started = time.perf_counter()
+            for _ in range(REPEAT):
+                extracted = func(content)
+            ms = (time.perf_counter() - started) / REPEAT * 1000
+            precision, recall, f1 = word_scores(extracted, expected)
+            for i, value in enumerate((ms, precision, recall, f1)):
+                totals[name][i] += value
+            print(f"{path.stem:<22} {name:<22} {ms:>10.2f} {precision:>7.2f} {recall:>7.2f} {f1:>6.2f}")
+
+    print("-" * 82)
+    for name, (ms, precision, recall, f1) in totals.items():
+        n = len(fixtures)
+        print(f"{'평균':<22} {name:<22} {ms / n:>10.2f} {precision / n:>7.2f} {recall / n:>7.2f} {f1 / n:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
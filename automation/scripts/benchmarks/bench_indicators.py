@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+기술적 지표 벤치마크
+N개 심볼 x T봉 랜덤 워크로 기존 pandas 방식(심볼별 rolling/ewm)과 NumPy 배치 계산(market.indicators),
+그리고 저장된 상태에서 새 봉 하나만 반영하는 스트리밍 갱신을 비교한다.
+
+- 정확도: 같은 정의(SMA, EMA, 볼린저, Wilder RSI)는 pandas 결과와의 최대 절대 오차를 출력한다.
+- 기존 RSI(14일 단순평균)는 Wilder 방식과 정의가 달라 속도만 비교한다.
+
+실행: python automation/scripts/benchmarks/bench_indicators.py [--symbols 50] [--bars 1000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from market.indicators import StreamingIndicators, atr, bollinger, ema, rsi, sma, volume_zscore
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+REPEAT = 5
+
+
+def random_walk(n_symbols: int, n_bars: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_symbols, n_bars)), axis=1))
+    spread = np.abs(rng.normal(0, 0.01, (n_symbols, n_bars)))
+    high = close * (1 + spread)
+    low = close * (1 - spread)
+    volume = rng.lognormal(15, 0.5, (n_symbols, n_bars))
+    return high, low, close, volume
+
+
+def timed(func):
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func()
+    return (time.perf_counter() - started) / REPEAT * 1000, result
+
+
+def numpy_batch(high, low, close, volume):
+    return {
+        "sma20": sma(close, 20),
+        "sma60": sma(close, 60),
+        "ema12": ema(close, 12),
+        "rsi": rsi(close, 14),
+        "bb": bollinger(close, 20),
+        "atr": atr(high, low, close, 14),
+        "volume_z": volume_zscore(volume, 20),
+    }
+
+
+def pandas_wilder_rsi(close: "pd.Series", period: int = 14) -> "pd.Series":
+    """pandas로 구현한 Wilder RSI (정확도 비교용)"""
+    delta = close.diff()
+    gain = delta.clip(lower=0).to_numpy()
+    loss = (-delta.clip(upper=0)).to_numpy()
+    avg = []
+    for values in (gain, loss):
+        seeded = np.full_like(values, np.nan)
+        seeded[period] = values[1:period + 1].mean()
+        seeded[period + 1:] = values[period + 1:]
+        avg.append(pd.Series(seeded).ewm(alpha=1 / period, adjust=False, ignore_na=True).mean().to_numpy())
+    return pd.Series(100 - 100 / (1 + avg[0] / avg[1]))
+
+
+def pandas_legacy(close, volume):
+    """기존 fetch_technical_data 방식 (심볼마다 Series 연산)"""
+    out = []
+    for c, v in zip(close, volume):
+        series = pd.Series(c)
+        vol = pd.Series(v)
+        delta = series.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+        out.append({
+            "rsi_sma": 100 - (100 / (1 + gain / loss)),
+            "sma20": series.rolling(window=20).mean(),
+            "sma60": series.rolling(window=60).mean(),
+            "ema12": series.ewm(span=12, adjust=False).mean(),
+            "bb_std": series.rolling(window=20).std(ddof=0),
+            "volume_std": vol.rolling(window=20).std(ddof=0),
+        })
+    return out
+
+
+def max_error(numpy_values, pandas_values) -> float:
+    return float(np.nanmax(np.abs(numpy_values - np.asarray(pandas_values))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기술적 지표 벤치마크")
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--bars", type=int, default=1000)
+    args = parser.parse_args()
+
+    high, low, close, volume = random_walk(args.symbols, args.bars)
+    print(f"심볼 {args.symbols}개 x {args.bars}봉, 반복 {REPEAT}회")
+    print("-" * 60)
+
+    numpy_ms, batch = timed(lambda: numpy_batch(high, low, close, volume))
+    print(f"{'NumPy 배치 (전체 지표)':<36} {numpy_ms:>10.2f} ms")
+
+    if PANDAS_AVAILABLE:
+        pandas_ms, legacy = timed(lambda: pandas_legacy(close, volume))
+        print(f"{'pandas 심볼별 (기존 방식)':<36} {pandas_ms:>10.2f} ms  ({pandas_ms / numpy_ms:.1f}배)")
+
+        i = 0
+        errors = {
+            "SMA20": max_error(batch["sma20"][i], legacy[i]["sma20"]),
+            "SMA60": max_error(batch["sma60"][i], legacy[i]["sma60"]),
+            "EMA12": max_error(batch["ema12"][i], legacy[i]["ema12"]),
+            "볼린저 표준편차": max_error((batch["bb"]["upper"][i] - batch["bb"]["mid"][i]) / 2, legacy[i]["bb_std"]),
+            "Wilder RSI": max_error(batch["rsi"][i], pandas_wilder_rsi(pd.Series(close[i]))),
+        }
+        for name, error in errors.items():
+            print(f"  최대 오차 {name:<16} {error:.2e}")
+
+    # 스트리밍: 마지막 봉 하나를 반영하는 비용 (배치 재계산과 비교)
+    history = tuple(a[:, :-1] for a in (high, low, close, volume))
+    last_bar = tuple(a[:, -1] for a in (high, low, close, volume))
+    engine = StreamingIndicators.from_history(*history)
+    update_ms, streamed = timed(lambda: engine.peek(*last_bar))
+    recompute_ms, _ = timed(lambda: numpy_batch(high, low, close, volume))
+    print("-" * 60)
+    print(f"{'스트리밍 갱신 (새 봉 1개)':<36} {update_ms:>10.3f} ms")
+    print(f"{'배치 재계산 (전체 기간)':<36} {recompute_ms:>10.3f} ms  ({recompute_ms / update_ms:.0f}배)")
+    print(f"  최대 오차 RSI  {max_error(streamed['rsi'], batch['rsi'][:, -1]):.2e}")
+    print(f"  최대 오차 ATR  {max_error(streamed['atr'], batch['atr'][:, -1]):.2e}")
+    print(f"  최대 오차 볼린저 상단 {max_error(streamed['bb_upper'], batch['bb']['upper'][:, -1]):.2e}")
+    print(f"  최대 오차 거래량 z {max_error(streamed['volume_z'], batch['volume_z'][:, -1]):.2e}")
+
+
+if __name__ == "__main__":
+    main()
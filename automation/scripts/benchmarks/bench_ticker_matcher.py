@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+관심종목 매칭 벤치마크
+관심종목 수(10 ~ 2000개)를 늘려 가며 항목당 매칭 비용을 측정한다.
+TickerMatcher는 항목당 비용이 거의 일정해야 하고, 기존 방식(티커마다 부분 문자열 검사)은 선형으로 늘어난다.
+측정 전에 한글 조사/캐시태그/토큰 경계 같은 기본 매칭 결과가 맞는지 먼저 확인한다.
+
+실행: python automation/scripts/benchmarks/bench_ticker_matcher.py
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feeds.watchlist import TickerMatcher
+
+WATCHLIST_SIZES = [10, 100, 500, 2000]
+ITEM_COUNT = 5000
+WORDS = (
+    "shares rose after the company reported quarterly earnings guidance beat analysts "
+    "expectations while rates and lending margins weighed on fintech peers in the market"
+).split()
+
+# (텍스트, 기대 티커) - 기존 부분 문자열 방식이 태깅하던 한글 제목도 그대로 태깅해야 한다
+MATCH_CASES = [
+    ("SOFI가 급등했다", ["SOFI"]),
+    ("SoFi는 오늘 실적을 발표했다", ["SOFI"]),
+    ("$sofi 매수 의견", ["SOFI"]),
+    ("SoFi Technologies, Inc. reported earnings.", ["SOFI"]),
+    ("SOFIA the robot", []),
+]
+
+
+def check_matches():
+    """기본 매칭 결과 확인 (틀리면 AssertionError)"""
+    matcher = TickerMatcher([{"ticker": "SOFI", "name": "SoFi Technologies, Inc."}])
+    for text, expected in MATCH_CASES:
+        got = matcher.match(text)
+        assert got == expected, f"{text!r}: {got} != {expected}"
+    print(f"[OK] 매칭 확인 {len(MATCH_CASES)}건 통과")
+
+
+def make_watchlist(size: int, rng: random.Random) -> list:
+    watchlist = [{"ticker": "SOFI", "name": "SoFi Technologies, Inc."}]
+    seen = {"SOFI"}
+    while len(watchlist) < size:
+        ticker = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 5)))
+        if ticker in seen:
+            continue
+        seen.add(ticker)
+        name = " ".join(rng.choice(string.ascii_uppercase) + "".join(rng.choice(string.ascii_lowercase) for _ in range(6))
+                        for _ in range(rng.randint(1, 3)))
+        watchlist.append({"ticker": ticker, "name": f"{name}, Inc."})
+    return watchlist
+
+
+def make_items(count: int, watchlist: list, rng: random.Random) -> list:
+    items = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(20, 40))]
+        if rng.random() < 0.3:
+            entry = rng.choice(watchlist)
+            words.insert(rng.randint(0, len(words)), rng.choice([entry["ticker"], entry["name"]]))
+        items.append(" ".join(words))
+    return items
+
+
+def substring_baseline(text: str, tickers: list) -> list:
+    """기존 extract_tickers 방식"""
+    text_upper = text.upper()
+    return [t for t in tickers if t in text_upper]
+
+
+def per_item_us(func, items) -> float:
+    started = time.perf_counter()
+    for text in items:
+        func(text)
+    return (time.perf_counter() - started) / len(items) * 1e6
+
+
+def main():
+    check_matches()
+    rng = random.Random(42)
+    print(f"항목 수: {ITEM_COUNT}")
+    print(f"{'관심종목 수':>10} | {'빌드(ms)':>9} | {'TickerMatcher(us/항목)':>22} | {'부분문자열(us/항목)':>19}")
+    print("-" * 72)
+    for size in WATCHLIST_SIZES:
+        watchlist = make_watchlist(size, rng)
+        items = make_items(ITEM_COUNT, watchlist, rng)
+        tickers = [e["ticker"] for e in watchlist]
+
+        started = time.perf_counter()
+        matcher = TickerMatcher(watchlist)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        matcher_us = per_item_us(matcher.match, items)
+        baseline_us = per_item_us(lambda text: substring_baseline(text, tickers), items)
+        print(f"{size:>10} | {build_ms:>9.1f} | {matcher_us:>22.1f} | {baseline_us:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,138 @@ Discord 웹훅으로 처리 결과를 전송하는 유틸리티
 
 import os
 import json
+import random
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import requests
 
+# Discord 웹훅 한도: 메시지당 embed 10개, embed 글자 수 합계 6000자
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+_SESSION: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """프로세스 안에서 공유하는 웹훅 세션 (연결 재사용)"""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+def _embed_chars(embed: Dict) -> int:
+    """Discord가 한도 계산에 쓰는 embed 글자 수"""
+    total = len(embed.get("title", "")) + len(embed.get("description", ""))
+    total += len((embed.get("footer") or {}).get("text", ""))
+    total += len((embed.get("author") or {}).get("name", ""))
+    for field in embed.get("fields", []):
+        total += len(field.get("name", "")) + len(field.get("value", ""))
+    return total
+
+
+def batch_embeds(embeds: List[Dict]) -> List[List[Dict]]:
+    """embed 목록을 메시지 한도(개수/글자 수)에 맞게 나눈다."""
+    batches: List[List[Dict]] = []
+    current: List[Dict] = []
+    current_chars = 0
+    for embed in embeds:
+        chars = _embed_chars(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or current_chars + chars > MAX_EMBED_CHARS_PER_MESSAGE):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(embed)
+        current_chars += chars
+    if current:
+        batches.append(current)
+    return batches
+
+
+class WebhookDispatcher:
+    """
+    Discord 웹훅 전송기
+    - embed를 메시지당 최대 10개씩 묶어 보낸다.
+    - 공유 세션으로 연결을 재사용한다.
+    - X-RateLimit-Remaining이 0이면 X-RateLimit-Reset-After만큼 기다렸다가 다음 요청을 보낸다.
+    - 429는 retry_after만큼, 5xx/네트워크 오류는 지수 백오프로 재시도한다.
+    """
+
+    def __init__(self, webhook_url: str, max_retries: int = 3, timeout: float = 10, session: Optional[requests.Session] = None):
+        self.webhook_url = (webhook_url or "").strip().strip('"').strip("'")
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = session or _get_session()
+        self._blocked_until = 0.0
+
+    def _wait_for_bucket(self):
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _update_bucket(self, response: requests.Response):
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_after = response.headers.get("X-RateLimit-Reset-After")
+        if remaining is not None and reset_after is not None:
+            try:
+                if int(remaining) <= 0:
+                    self._blocked_until = time.monotonic() + float(reset_after)
+            except ValueError:
+                pass
+
+    def post(self, payload: Dict) -> bool:
+        """메시지 하나 전송 (재시도 포함)"""
+        if not self.webhook_url:
+            return False
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_bucket()
+            try:
+                response = self.session.post(self.webhook_url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt >= self.max_retries:
+                    print(f"[WARN] Discord 웹훅 전송 실패: {e}")
+                    return False
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+                continue
+
+            self._update_bucket(response)
+            if response.status_code == 429:
+                try:
+                    retry_after = float(response.json().get("retry_after", 1))
+                except Exception:
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                if attempt >= self.max_retries:
+                    print(f"[WARN] Discord 웹훅 rate limit 초과 (retry_after={retry_after}s)")
+                    return False
+                print(f"[INFO] Discord rate limit, {retry_after:.1f}초 후 재시도")
+                time.sleep(retry_after)
+                continue
+            if response.status_code >= 500 and attempt < self.max_retries:
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+                continue
+
+            try:
+                response.raise_for_status()
+                return True
+            except Exception as e:
+                print(f"[WARN] Discord 웹훅 전송 실패: {e}")
+                return False
+        return False
+
+    def send_embeds(self, embeds: List[Dict]) -> int:
+        """
+        embed 목록을 묶어서 전송
+
+        Returns:
+            int: 전송에 성공한 embed 수
+        """
+        sent = 0
+        for batch in batch_embeds(embeds):
+            if self.post({"embeds": batch}):
+                sent += len(batch)
+        return sent
+
 
 def send_discord_notification(
     webhook_url: str,
@@ -48,15 +176,7 @@ def send_discord_notification(
     if footer:
         embed["footer"] = {"text": footer}
     
-    payload = {"embeds": [embed]}
-    
-    try:
-        response = requests.post(webhook_url, json=payload, timeout=10)
-        response.raise_for_status()
-        return True
-    except Exception as e:
-        print(f"[WARN] Discord 웹훅 전송 실패: {e}")
-        return False
+    return WebhookDispatcher(webhook_url).post({"embeds": [embed]})
 
 
 def notify_post_success(
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+피드 소스 상태 보고서
+automation/results/feed_metrics.jsonl을 읽어 소스별 p50/p95 응답 시간, 실패율, 평균 응답 크기/항목 수를 출력한다.
+느리거나 자주 실패하는 피드를 빼거나 수집 주기를 조정할 때 참고한다.
+
+실행:
+    python automation/scripts/feed_health_report.py            # 전체 기록
+    python automation/scripts/feed_health_report.py --days 7   # 최근 7일
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from feeds.metrics import DEFAULT_METRICS_PATH, load_metrics, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 소스별 수집 지표 요약")
+    parser.add_argument("--days", type=float, default=None, help="최근 N일 기록만 사용")
+    parser.add_argument("--path", default=str(DEFAULT_METRICS_PATH), help="지표 파일 경로")
+    args = parser.parse_args()
+
+    records = load_metrics(args.path)
+    if args.days is not None:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=args.days)).isoformat()
+        records = [r for r in records if r.get("run_at", "") >= cutoff]
+
+    if not records:
+        print(f"[INFO] 지표 기록이 없습니다: {args.path}")
+        return
+
+    runs = len({r.get("run_at") for r in records})
+    print(f"[INFO] 실행 {runs}회, 기록 {len(records)}건")
+    print(f"{'소스':<48} {'횟수':>5} {'실패율':>7} {'p50(s)':>7} {'p95(s)':>7} {'평균KB':>7} {'항목':>5} {'파싱(ms)':>8}")
+    print("-" * 100)
+    for s in summarize(records):
+        print(
+            f"{s['source'][:48]:<48} {s['runs']:>5} {s['failure_rate']:>7.1%} "
+            f"{s['p50']:>7.2f} {s['p95']:>7.2f} {s['avg_bytes'] / 1024:>7.1f} "
+            f"{s['avg_items']:>5.1f} {s['avg_parse'] * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+피드 아카이브 (일자별 JSONL 파티션)
+수집한 피드 항목을 assets/data/feed/YYYY-MM-DD.jsonl에 추가만(append-only) 한다.
+
+- 쓰기는 새 항목 수에 비례한다 (기존 전체 파일을 다시 쓰지 않는다).
+- 중복 제거는 새 항목이 속한 날짜 파티션의 id만 읽어서 판단한다.
+- 읽기는 요청한 시간 구간에 해당하는 파티션만 연다.
+- assets/data/stock_feed.json은 최신 N개만 담는 공개용 뷰로, 아카이브에서 다시 만든다.
+- 보관 기간(FEED_ARCHIVE_RETENTION_DAYS, 기본 180일)이 지난 파티션은 prune()으로 지운다 (0이면 지우지 않는다).
+- 아카이브는 수집 이력 저장소일 뿐 사이트에서 읽지 않으므로 Jekyll 빌드에서 제외한다 (_config.yml exclude).
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_ARCHIVE_DIR = PROJECT_ROOT / "assets" / "data" / "feed"
+RETENTION_DAYS = int(os.getenv("FEED_ARCHIVE_RETENTION_DAYS", "180"))
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def _partition_day(timestamp: str) -> str:
+    """항목 timestamp(KST ISO 8601)에서 파티션 날짜(YYYY-MM-DD) 추출"""
+    try:
+        return datetime.fromisoformat(timestamp).astimezone(KST).strftime("%Y-%m-%d")
+    except Exception:
+        return timestamp[:10]
+
+
+class FeedArchive:
+    """일자별 JSONL 파티션 아카이브"""
+
+    def __init__(self, archive_dir: Optional[Path] = None):
+        self.archive_dir = Path(archive_dir) if archive_dir else DEFAULT_ARCHIVE_DIR
+
+    def partition_path(self, day: str) -> Path:
+        return self.archive_dir / f"{day}.jsonl"
+
+    def days(self) -> List[str]:
+        """보관 중인 파티션 날짜 목록 (오름차순)"""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(p.stem for p in self.archive_dir.glob("*.jsonl"))
+
+    def iter_day(self, day: str) -> Iterator[Dict]:
+        """한 날짜 파티션의 항목 (기록된 순서)"""
+        return self._read_partition(day)
+
+    def _read_partition(self, day: str) -> Iterator[Dict]:
+        path = self.partition_path(day)
+        if not path.exists():
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단된 쓰기로 잘린 마지막 줄은 건너뛴다.
+                    continue
+
+    def read_from(self, day: str, offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        파티션의 offset(바이트) 이후에 추가된 항목 (append-only라 이어 읽을 수 있다)
+
+        Returns:
+            (항목 목록, 마지막 완전한 줄 끝 위치). 쓰는 중인 마지막 줄은 다음에 다시 읽도록 위치에 넣지 않는다.
+        """
+        path = self.partition_path(day)
+        if not path.exists():
+            return [], 0
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        items = []
+        for line in data[:end].decode("utf-8", errors="replace").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return items, offset + end
+
+    def _partition_ids(self, day: str) -> Set[str]:
+        return {item["id"] for item in self._read_partition(day) if item.get("id")}
+
+    def append_items(self, items: List[Dict]) -> List[Dict]:
+        """
+        아직 아카이브에 없는 항목만 해당 날짜 파티션에 추가한다.
+
+        Returns:
+            List[Dict]: 실제로 추가된(새) 항목 (입력 순서 유지)
+        """
+        seen_by_day: Dict[str, Set[str]] = {}
+        new_by_day: Dict[str, List[Dict]] = {}
+        appended: List[Dict] = []
+
+        for item in items:
+            day = _partition_day(item["timestamp"])
+            if day not in seen_by_day:
+                seen_by_day[day] = self._partition_ids(day)
+            seen = seen_by_day[day]
+            if item["id"] in seen:
+                continue
+            seen.add(item["id"])
+            new_by_day.setdefault(day, []).append(item)
+            appended.append(item)
+
+        if not appended:
+            return []
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        for day, day_items in new_by_day.items():
+            with open(self.partition_path(day), "a", encoding="utf-8") as f:
+                for item in day_items:
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        return appended
+
+    def prune(self, retention_days: int = RETENTION_DAYS) -> List[str]:
+        """
+        보관 기간이 지난 파티션 삭제
+
+        Returns:
+            List[str]: 삭제한 파티션 날짜
+        """
+        if retention_days <= 0:
+            return []
+        cutoff = (datetime.now(KST).date() - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+        removed = []
+        for day in self.days():
+            if day >= cutoff:
+                break
+            try:
+                self.partition_path(day).unlink()
+                removed.append(day)
+            except OSError as e:
+                print(f"[WARN] 피드 아카이브 파티션 삭제 실패 ({day}): {e}")
+        if removed:
+            print(f"[INFO] 보관 기간({retention_days}일)이 지난 피드 아카이브 파티션 {len(removed)}개 삭제 ({removed[0]} ~ {removed[-1]})")
+        return removed
+
+    def iter_items(self, since: datetime, until: Optional[datetime] = None) -> Iterator[Dict]:
+        """since ~ until 구간의 항목 (구간에 걸친 파티션만 읽는다, 최신순 아님)"""
+        until = until or datetime.now(KST)
+        day = since.astimezone(KST).date()
+        last_day = until.astimezone(KST).date()
+        while day <= last_day:
+            for item in self._read_partition(day.strftime("%Y-%m-%d")):
+                try:
+                    ts = datetime.fromisoformat(item["timestamp"])
+                except Exception:
+                    continue
+                if since <= ts <= until:
+                    yield item
+            day += timedelta(days=1)
+
+    def recent_items(self, hours: int = 24) -> List[Dict]:
+        """최근 N시간 항목 (최신순)"""
+        since = datetime.now(KST) - timedelta(hours=hours)
+        items = list(self.iter_items(since))
+        items.sort(key=lambda x: x["timestamp"], reverse=True)
+        return items
+
+    def latest_items(self, limit: int) -> List[Dict]:
+        """가장 최근 파티션부터 거슬러 올라가며 최신 N개를 모은다."""
+        collected: List[Dict] = []
+        for day in reversed(self.days()):
+            collected.extend(self._read_partition(day))
+            if len(collected) >= limit:
+                break
+        collected.sort(key=lambda x: x["timestamp"], reverse=True)
+        return collected[:limit]
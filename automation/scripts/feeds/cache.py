@@ -0,0 +1,127 @@
+"""
+피드 조건부 요청(Conditional GET) 캐시
+URL별 검증자(ETag, Last-Modified)와 본문 해시, 마지막으로 파싱한 항목을 디스크에 보관한다.
+- 다음 요청에 If-None-Match / If-Modified-Since 헤더를 실어 보낸다.
+- 304 응답이거나 본문 해시가 같으면 XML을 다시 파싱하지 않고 저장된 항목을 돌려준다.
+- 같은 URL을 수집 구간(cutoff/limit)이 다른 여러 수집기가 함께 쓰므로, 항목은 거르지 않은 전체를 저장한다.
+  구간 선택은 호출자가 load_items 결과에 feeds.parser.select_entries로 한다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_CACHE_PATH = Path(
+    os.getenv("FEED_CACHE_PATH", str(PROJECT_ROOT / "automation" / "cache" / "feed_cache.json"))
+)
+
+
+# 저장 형식 버전 (2: 거르지 않은 전체 항목 저장). 버전이 다르면 캐시를 비우고 새로 받는다.
+CACHE_VERSION = 2
+
+
+def body_hash(content: bytes) -> str:
+    """응답 본문 해시 (변경 여부 판단용)"""
+    return hashlib.sha256(content or b"").hexdigest()
+
+
+class FeedCache:
+    """URL별 검증자/본문 해시/파싱 결과 캐시"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != CACHE_VERSION:
+                # 이전 형식은 호출자의 cutoff/limit으로 거른 항목이라 다른 호출자에게 돌려줄 수 없다.
+                return
+            self.entries = data.get("feeds", {})
+        except Exception as e:
+            print(f"[WARN] 피드 캐시 로드 실패 ({self.path}): {e}")
+            self.entries = {}
+
+    def save(self):
+        """변경 사항이 있을 때만 임시 파일에 쓰고 교체한다 (중간에 중단돼도 파일이 깨지지 않도록)."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": CACHE_VERSION, "feeds": self.entries}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[WARN] 피드 캐시 저장 실패 ({self.path}): {e}")
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        entry = self.entries.get(url) or {}
+        headers = {}
+        # 저장된 파싱 결과가 없으면 304를 받아도 쓸 수 없으므로 조건부 요청을 하지 않는다.
+        if entry.get("items") is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_unchanged(self, result: Dict) -> bool:
+        """
+        응답이 이전과 같은지 판단하고 검증자를 갱신한다.
+
+        Args:
+            result: feeds.fetcher 형식의 결과 (url, status, headers, content)
+        """
+        url = result["url"]
+        entry = self.entries.get(url) or {}
+        headers = {k.lower(): v for k, v in (result.get("headers") or {}).items()}
+
+        if result.get("status") == 304:
+            entry["checked_at"] = datetime.now(timezone.utc).isoformat()
+            self.entries[url] = entry
+            self._dirty = True
+            return entry.get("items") is not None
+
+        digest = body_hash(result.get("content") or b"")
+        unchanged = entry.get("body_hash") == digest and entry.get("items") is not None
+
+        entry.update({
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "body_hash": digest,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+        })
+        self.entries[url] = entry
+        self._dirty = True
+        return unchanged
+
+    def load_items(self, result: Dict, parse: Callable[[bytes], List[Dict]]) -> List[Dict]:
+        """
+        변경이 없으면 저장된 항목을, 변경됐으면 parse(content) 결과를 저장 후 반환한다.
+        parse는 본문의 항목을 거르지 않고 모두 돌려줘야 하며(예: parse_feed_entries), JSON으로 직렬화 가능해야 한다.
+        """
+        url = result["url"]
+        if self.is_unchanged(result):
+            return list(self.entries[url]["items"])
+
+        # 파싱 도중 실패하면 다음 실행에서 다시 파싱하도록 이전 항목을 먼저 비운다.
+        self.entries[url]["items"] = None
+        items = parse(result.get("content") or b"")
+        self.entries[url]["items"] = items
+        self._dirty = True
+        return items
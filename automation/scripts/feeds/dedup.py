@@ -0,0 +1,157 @@
+"""
+근접 중복 기사 묶기 (MinHash + LSH)
+같은 소식이 Bloomberg, Yahoo Finance, Reddit에서 URL만 달리해 들어오는 경우를 하나로 묶는다.
+
+- 제목/본문을 소문자 단어 2-gram(shingle) 집합으로 바꾸고 MinHash 서명을 만든다.
+- 서명을 밴드로 나눠 버킷에 넣고(LSH), 같은 버킷에 걸린 후보끼리만 실제 Jaccard 유사도를 계산한다.
+  항목 수가 늘어도 모든 쌍을 비교하지 않는다.
+- 묶인 항목 중 하나를 대표(canonical)로 남기고 나머지는 대표 항목의 "alternates"에 붙인다.
+"""
+
+import hashlib
+import random
+import re
+from typing import Dict, List, Optional, Set
+
+NUM_PERM = 32
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# 제목 유사도 / 제목+요약 유사도 기준 (둘 중 하나만 넘어도 같은 기사로 본다)
+TITLE_THRESHOLD = 0.6
+CONTENT_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_WORD_RE = re.compile(r"\w+")
+_STOPWORDS = {"a", "an", "the", "of", "to", "in", "on", "for", "and", "or", "is", "are", "at", "as", "by", "with"}
+
+# 대표 항목 선택 우선순위 (낮을수록 우선)
+_SOURCE_TYPE_PRIORITY = {"NEWS": 0, "SNS": 1}
+
+
+def _item_title(item: Dict) -> str:
+    """수집기는 content를 "제목 - 요약" 형태로 만든다. 첫 구분자 앞을 제목으로 본다."""
+    content = item.get("content") or ""
+    return content.split(" - ", 1)[0]
+
+
+def shingles(text: str) -> Set[str]:
+    """소문자 단어 2-gram 집합 (단어가 하나뿐이면 단어 자체)"""
+    words = [w for w in _WORD_RE.findall(text.lower()) if w not in _STOPWORDS]
+    if len(words) < 2:
+        return set(words)
+    return {f"{words[i]} {words[i + 1]}" for i in range(len(words) - 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(shingle_set: Set[str]) -> List[int]:
+    """MinHash 서명 (NUM_PERM개)"""
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingle_set]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+class NearDuplicateIndex:
+    """MinHash LSH 인덱스: 항목을 넣어 두고 새 항목과 근접 중복인 항목을 찾는다."""
+
+    def __init__(self):
+        self.buckets: Dict[tuple, List[int]] = {}
+        self.entries: List[Dict] = []
+
+    def features(self, item: Dict) -> Dict:
+        return {
+            "title": shingles(_item_title(item)),
+            "content": shingles(item.get("content") or ""),
+        }
+
+    def _band_keys(self, title_shingles: Set[str]) -> List[tuple]:
+        if not title_shingles:
+            return []
+        signature = minhash(title_shingles)
+        return [(band, tuple(signature[band * ROWS:(band + 1) * ROWS])) for band in range(BANDS)]
+
+    def find(self, item: Dict, features: Optional[Dict] = None) -> Optional[int]:
+        """근접 중복인 기존 항목의 위치 (없으면 None)"""
+        features = features or self.features(item)
+        checked = set()
+        for key in self._band_keys(features["title"]):
+            for pos in self.buckets.get(key, []):
+                if pos in checked:
+                    continue
+                checked.add(pos)
+                other = self.entries[pos]["features"]
+                if (jaccard(features["title"], other["title"]) >= TITLE_THRESHOLD
+                        or jaccard(features["content"], other["content"]) >= CONTENT_THRESHOLD):
+                    return pos
+        return None
+
+    def add(self, item: Dict, features: Optional[Dict] = None) -> int:
+        features = features or self.features(item)
+        pos = len(self.entries)
+        self.entries.append({"item": item, "features": features})
+        for key in self._band_keys(features["title"]):
+            self.buckets.setdefault(key, []).append(pos)
+        return pos
+
+
+def _canonical_rank(item: Dict):
+    """뉴스 > SNS, 내용이 긴 항목, 먼저 보도된 항목 순으로 대표 항목을 고른다."""
+    return (
+        _SOURCE_TYPE_PRIORITY.get(item.get("source_type"), 2),
+        -len(item.get("content") or ""),
+        item.get("timestamp") or "",
+    )
+
+
+def _alternate(item: Dict) -> Dict:
+    return {
+        "id": item["id"],
+        "source_name": item.get("source_name"),
+        "url": item.get("url"),
+        "timestamp": item.get("timestamp"),
+    }
+
+
+def cluster_items(items: List[Dict]) -> List[Dict]:
+    """
+    근접 중복 항목을 묶어 대표 항목만 반환한다 (묶음이 처음 등장한 순서).
+    대표 항목에는 나머지 항목이 "alternates"로, 관련 티커는 합집합으로 붙는다.
+    """
+    index = NearDuplicateIndex()
+    clusters: List[List[Dict]] = []
+    for item in items:
+        features = index.features(item)
+        pos = index.find(item, features)
+        if pos is None:
+            index.add(item, features)
+            clusters.append([item])
+        else:
+            clusters[pos].append(item)
+
+    result = []
+    for members in clusters:
+        if len(members) == 1:
+            result.append(members[0])
+            continue
+        members = sorted(members, key=_canonical_rank)
+        canonical = dict(members[0])
+        tickers = list(canonical.get("related_tickers", []))
+        alternates = list(canonical.get("alternates", []))
+        for other in members[1:]:
+            alternates.append(_alternate(other))
+            alternates.extend(other.get("alternates", []))
+            tickers.extend(t for t in other.get("related_tickers", []) if t not in tickers)
+        canonical["related_tickers"] = tickers
+        canonical["alternates"] = alternates
+        result.append(canonical)
+    return result
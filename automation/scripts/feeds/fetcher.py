@@ -0,0 +1,132 @@
+"""
+피드 동시 수집 엔진
+여러 RSS/Atom 피드를 제한된 동시성으로 병렬 요청하고, 입력 순서대로 결과를 돌려준다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from feeds.cache import FeedCache
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; StockFeedBot/1.0)"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 10
+DEFAULT_DEADLINE = 30
+
+
+def _normalize_request(req: Union[str, Dict]) -> Dict:
+    """URL 문자열 또는 {"url", "headers"} 딕셔너리를 공통 형태로 맞춘다."""
+    if isinstance(req, str):
+        return {"url": req, "headers": {}}
+    return {"url": req["url"], "headers": dict(req.get("headers") or {})}
+
+
+def _build_session(max_workers: int) -> requests.Session:
+    """워커 수만큼 커넥션을 재사용할 수 있는 세션 생성"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = DEFAULT_USER_AGENT
+    return session
+
+
+def _fetch_one(session: requests.Session, req: Dict, timeout: float, run_deadline: float) -> Dict:
+    """단일 피드 요청. 예외는 결과 딕셔너리의 error로 흡수한다."""
+    url = req["url"]
+    started = time.monotonic()
+    result = {
+        "url": url,
+        "status": None,
+        "content": b"",
+        "headers": {},
+        "elapsed": 0.0,
+        "error": None,
+    }
+
+    # 실행 마감 시간이 얼마 남지 않았으면 개별 타임아웃도 그만큼 줄인다.
+    remaining = run_deadline - started
+    if remaining <= 0:
+        result["error"] = "deadline exceeded"
+        return result
+
+    try:
+        resp = session.get(url, headers=req["headers"], timeout=min(timeout, remaining))
+        result["status"] = resp.status_code
+        result["headers"] = dict(resp.headers)
+        resp.raise_for_status()
+        result["content"] = resp.content
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        result["elapsed"] = round(time.monotonic() - started, 3)
+
+    return result
+
+
+def fetch_all(
+    requests_list: List[Union[str, Dict]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+    session: Optional[requests.Session] = None,
+    cache: Optional[FeedCache] = None,
+) -> List[Dict]:
+    """
+    피드 목록을 병렬로 가져온다.
+
+    Args:
+        requests_list: URL 문자열 또는 {"url": ..., "headers": {...}} 목록
+        max_workers: 동시에 진행할 최대 요청 수
+        timeout: 요청 하나당 타임아웃(초)
+        deadline: 전체 실행 마감 시간(초). 넘기면 남은 요청은 실패로 기록한다.
+        session: 재사용할 requests 세션 (없으면 새로 만든다)
+        cache: 조건부 요청 캐시. 주어지면 If-None-Match/If-Modified-Since 헤더를 붙인다.
+
+    Returns:
+        List[Dict]: 입력과 같은 순서의 결과 (url, status, content, headers, elapsed, error)
+            304 응답은 status=304, content=b"" 로 성공 처리된다.
+    """
+    reqs = [_normalize_request(r) for r in requests_list]
+    if not reqs:
+        return []
+
+    if cache is not None:
+        for req in reqs:
+            req["headers"].update(cache.request_headers(req["url"]))
+
+    workers = max(1, min(max_workers, len(reqs)))
+    own_session = session is None
+    if own_session:
+        session = _build_session(workers)
+
+    run_deadline = time.monotonic() + deadline
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed-fetch")
+    try:
+        futures = [executor.submit(_fetch_one, session, req, timeout, run_deadline) for req in reqs]
+        wait(futures, timeout=deadline)
+
+        results: List[Dict] = []
+        for req, future in zip(reqs, futures):
+            if future.done():
+                results.append(future.result())
+            else:
+                future.cancel()
+                results.append({
+                    "url": req["url"],
+                    "status": None,
+                    "content": b"",
+                    "headers": {},
+                    "elapsed": round(deadline, 3),
+                    "error": "deadline exceeded",
+                })
+        return results
+    finally:
+        # 마감 시간을 넘긴 요청은 기다리지 않는다 (개별 timeout으로 곧 정리된다).
+        executor.shutdown(wait=False, cancel_futures=True)
+        if own_session:
+            session.close()
@@ -0,0 +1,195 @@
+"""
+피드 검색 인덱스 (SQLite)
+아카이브(assets/data/feed/*.jsonl)와 같은 항목을 SQLite에 담아 티커/소스별 시간 구간 조회를 인덱스 범위 스캔으로 처리한다.
+
+- 표준 라이브러리 sqlite3, WAL 모드 (읽기와 쓰기가 서로 막지 않음)
+- items: id 기본키, (source_name, ts) 인덱스
+- item_tickers: (ticker, ts) 복합 기본키/인덱스
+- ts는 UTC epoch 초로 저장해 시간대가 섞여도 정렬/범위 비교가 정확하다.
+- 인덱스 파일은 automation/cache/에 두는 파생 데이터다. 파티션별로 어디까지 읽었는지(바이트 위치) 기록해 두고,
+  다른 실행/로컬 실행/인덱스를 끈 실행이 아카이브에 추가한 줄만 이어서 적재한다.
+  보관 기간이 지나 아카이브에서 지워진 파티션의 항목은 인덱스에서도 지운다.
+- export_json()으로 Jekyll 사이트용 stock_feed.json(최신 N개)을 계속 만든다.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_INDEX_PATH = Path(
+    os.getenv("FEED_INDEX_PATH", str(PROJECT_ROOT / "automation" / "cache" / "feed_index.sqlite3"))
+)
+
+KST = ZoneInfo("Asia/Seoul")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    ts REAL NOT NULL,
+    source_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_ts ON items (ts);
+CREATE INDEX IF NOT EXISTS idx_items_source_ts ON items (source_name, ts);
+CREATE TABLE IF NOT EXISTS item_tickers (
+    ticker TEXT NOT NULL,
+    ts REAL NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (ticker, ts, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS partitions (
+    day TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+def _to_epoch(timestamp: str) -> float:
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class FeedIndex:
+    """피드 항목 SQLite 인덱스"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_INDEX_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def add_items(self, items: Iterable[Dict]) -> int:
+        """
+        항목 추가 (이미 있는 id는 무시)
+
+        Returns:
+            int: 새로 추가된 항목 수
+        """
+        added = 0
+        with self.conn:
+            for item in items:
+                try:
+                    ts = _to_epoch(item["timestamp"])
+                except Exception:
+                    continue
+                cur = self.conn.execute(
+                    "INSERT OR IGNORE INTO items (id, ts, source_name, data) VALUES (?, ?, ?, ?)",
+                    (item["id"], ts, item.get("source_name"), json.dumps(item, ensure_ascii=False)),
+                )
+                if cur.rowcount == 0:
+                    continue
+                added += 1
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO item_tickers (ticker, ts, id) VALUES (?, ?, ?)",
+                    [(ticker, ts, item["id"]) for ticker in item.get("related_tickers", [])],
+                )
+        return added
+
+    def sync_from_archive(self, archive) -> int:
+        """
+        아카이브 파티션 중 마지막 동기화 이후 커진 부분만 적재한다 (처음이면 전체).
+        파티션이 기록보다 작아졌으면(다시 쓰인 경우) 처음부터 다시 읽는다. 이미 있는 id는 무시된다.
+        """
+        synced = dict(self.conn.execute("SELECT day, size FROM partitions"))
+        days = archive.days()
+        if days:
+            # 가장 오래된 파티션보다 앞선 기록은 보관 기간 정리로 지워진 것이다 (아카이브가 비어 있으면 건드리지 않는다)
+            for day in sorted(d for d in synced if d < days[0]):
+                self._drop_partition(day)
+        added = 0
+        for day in days:
+            try:
+                size = archive.partition_path(day).stat().st_size
+            except OSError:
+                continue
+            offset = synced.get(day, 0)
+            if size == offset:
+                continue
+            if size < offset:
+                offset = 0
+            items, end = archive.read_from(day, offset)
+            added += self.add_items(items)
+            with self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO partitions (day, size) VALUES (?, ?)", (day, end))
+        if added:
+            print(f"[INFO] 아카이브에서 피드 인덱스 동기화: {added}개 추가")
+        return added
+
+    def _drop_partition(self, day: str):
+        """한 날짜 파티션(KST 기준)의 항목과 동기화 기록 삭제"""
+        start = datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=KST)
+        bounds = (start.timestamp(), (start + timedelta(days=1)).timestamp())
+        with self.conn:
+            self.conn.execute("DELETE FROM item_tickers WHERE ts >= ? AND ts < ?", bounds)
+            self.conn.execute("DELETE FROM items WHERE ts >= ? AND ts < ?", bounds)
+            self.conn.execute("DELETE FROM partitions WHERE day = ?", (day,))
+
+    def query(
+        self,
+        ticker: Optional[str] = None,
+        source_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        조건에 맞는 항목을 최신순으로 반환한다.
+        ticker가 있으면 (ticker, ts), source_name이 있으면 (source_name, ts) 인덱스를 탄다.
+        """
+        clauses = []
+        params: List = []
+        if ticker:
+            sql = "SELECT i.data FROM item_tickers t JOIN items i ON i.id = t.id WHERE t.ticker = ?"
+            params.append(ticker)
+            ts_col = "t.ts"
+            if source_name:
+                clauses.append("i.source_name = ?")
+                params.append(source_name)
+        else:
+            sql = "SELECT data FROM items WHERE 1 = 1"
+            ts_col = "ts"
+            if source_name:
+                clauses.append("source_name = ?")
+                params.append(source_name)
+
+        if since is not None:
+            clauses.append(f"{ts_col} >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append(f"{ts_col} <= ?")
+            params.append(until.timestamp())
+        for clause in clauses:
+            sql += f" AND {clause}"
+        sql += f" ORDER BY {ts_col} DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+    def export_json(self, path: Path, limit: int) -> List[Dict]:
+        """최신 N개를 stock_feed.json 형식으로 내보낸다 (임시 파일에 쓰고 교체)."""
+        items = self.query(limit=limit)
+        data = {
+            "last_updated": datetime.now(KST).isoformat(),
+            "items": items,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return items
@@ -0,0 +1,128 @@
+"""
+피드 수집 지표 기록
+실행마다 소스(URL)별 응답 시간, 상태 코드, 응답 크기, 파싱 시간, 항목 수를 automation/results/feed_metrics.jsonl에 한 줄씩 남긴다.
+파일은 최근 MAX_RECORDS줄만 유지한다.
+"""
+
+import json
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_METRICS_PATH = Path(
+    os.getenv("FEED_METRICS_PATH", str(PROJECT_ROOT / "automation" / "results" / "feed_metrics.jsonl"))
+)
+MAX_RECORDS = 5000
+
+
+def source_label(url: str) -> str:
+    """보고서용 짧은 소스 이름 (호스트 + 경로)"""
+    parts = urlsplit(url)
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    return f"{host}{parts.path}".rstrip("/")
+
+
+class FeedMetrics:
+    """한 번의 수집 실행 동안 소스별 지표를 모았다가 flush()로 기록한다."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_METRICS_PATH
+        self.run_at = datetime.now(timezone.utc).isoformat()
+        self.records: Dict[str, Dict] = {}
+
+    def _record(self, url: str) -> Dict:
+        if url not in self.records:
+            self.records[url] = {"run_at": self.run_at, "url": url, "source": source_label(url)}
+        return self.records[url]
+
+    def record_fetch(self, result: Dict):
+        """feeds.fetcher 결과 기록"""
+        record = self._record(result["url"])
+        record.update({
+            "status": result.get("status"),
+            "ok": not result.get("error"),
+            "latency": round(result.get("elapsed") or 0.0, 4),
+            "bytes": len(result.get("content") or b""),
+            "error": result.get("error"),
+        })
+
+    def record_parse(self, url: str, parse_time: float, items: int):
+        """파싱 시간과 cutoff를 통과한 항목 수 (같은 소스를 여러 번 읽으면 누적)"""
+        record = self._record(url)
+        record["parse_time"] = round(record.get("parse_time", 0.0) + parse_time, 4)
+        record["items"] = record.get("items", 0) + items
+
+    def flush(self):
+        """이번 실행 기록을 추가하고, 파일이 길어지면 최근 MAX_RECORDS줄만 남긴다."""
+        if not self.records:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                for record in self.records.values():
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.records = {}
+
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+            if len(lines) > MAX_RECORDS:
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                tmp_path.write_text("\n".join(lines[-MAX_RECORDS:]) + "\n", encoding="utf-8")
+                os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"[WARN] 피드 지표 기록 실패 ({self.path}): {e}")
+
+
+def load_metrics(path: Optional[Path] = None) -> List[Dict]:
+    path = Path(path) if path else DEFAULT_METRICS_PATH
+    if not path.exists():
+        return []
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """최근접 순위(nearest-rank) 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(records: Iterable[Dict]) -> List[Dict]:
+    """
+    소스별 요약 (p95 응답 시간이 느린 순)
+
+    Returns:
+        List[Dict]: [{"source", "runs", "failure_rate", "p50", "p95", "avg_bytes", "avg_items", "avg_parse"}, ...]
+    """
+    by_source: Dict[str, List[Dict]] = {}
+    for record in records:
+        by_source.setdefault(record.get("source") or source_label(record["url"]), []).append(record)
+
+    summary = []
+    for source, rows in by_source.items():
+        latencies = [r.get("latency") or 0.0 for r in rows if r.get("ok")]
+        failures = sum(1 for r in rows if not r.get("ok"))
+        summary.append({
+            "source": source,
+            "runs": len(rows),
+            "failure_rate": failures / len(rows),
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "avg_bytes": sum(r.get("bytes") or 0 for r in rows) / len(rows),
+            "avg_items": sum(r.get("items") or 0 for r in rows) / len(rows),
+            "avg_parse": sum(r.get("parse_time") or 0.0 for r in rows) / len(rows),
+        })
+    summary.sort(key=lambda s: s["p95"], reverse=True)
+    return summary
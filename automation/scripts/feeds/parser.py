@@ -0,0 +1,175 @@
+"""
+RSS/Atom 스트리밍 파서
+모든 수집기가 공유하는 피드 파서. ElementTree.iterparse로 항목을 하나씩 읽고 바로 버려서
+큰 피드에서도 메모리 사용량이 일정하다.
+
+- RSS 2.0: rss/channel/item (title, link, pubDate, description)
+- Atom: feed/entry (title, link@href, published/updated, summary/content)
+- cutoff가 주어지면 기준보다 오래된 항목은 건너뛰고, 오래된 항목이 연속으로 나오면 읽기를 멈춘다.
+  (최신순 피드에서만 의미가 있으므로 max_stale=None이면 멈추지 않는다)
+- 같은 cutoff/limit 규칙을 이미 파싱한 항목 목록에도 적용할 수 있다 (select_entries).
+  피드 캐시에는 거르지 않은 전체 항목을 저장하고, 호출자마다 자기 구간을 select_entries로 고른다.
+
+반환 항목은 {"title", "link", "pub", "desc"} 딕셔너리로, JSON 직렬화가 가능해 피드 캐시에 그대로 저장된다.
+"""
+
+import html
+import io
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# 피드가 완전히 최신순이 아닐 수 있으므로, 오래된 항목이 이만큼 연속으로 나와야 중단한다.
+# 날짜순이 아닌 피드(Reddit hot 등)는 max_stale=None으로 끝까지 본다.
+DEFAULT_MAX_STALE = 5
+
+_ITEM_TAGS = ("item", "entry")
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
+_DESC_TAGS = ("description", "summary", "content")
+
+
+def _strip_markup(text: str) -> str:
+    """요약/본문에 섞인 HTML 태그와 엔티티를 걷어낸다 (Reddit Atom content는 HTML이다)."""
+    if "<" not in text and "&" not in text:
+        return text
+    text = html.unescape(re.sub(r"<[^>]+>", " ", text))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 제거한 태그 이름 ({http://www.w3.org/2005/Atom}entry -> entry)"""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def parse_published(pub: str) -> datetime:
+    """
+    RSS(RFC 822)와 Atom(ISO 8601) 날짜 문자열을 timezone-aware datetime으로 변환한다.
+    시간대가 없으면 UTC로 가정한다. 해석할 수 없으면 ValueError.
+    """
+    pub = (pub or "").strip()
+    if not pub:
+        raise ValueError("empty date")
+    try:
+        dt = parsedate_to_datetime(pub)
+    except (TypeError, ValueError):
+        dt = datetime.fromisoformat(pub.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _build_entry(elem: ET.Element) -> Dict:
+    """item/entry 요소에서 공통 필드만 뽑아 가벼운 딕셔너리로 만든다."""
+    fields: Dict[str, str] = {}
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            # Atom은 <link href="..." rel="alternate"/>, RSS는 <link>텍스트</link>
+            href = child.get("href")
+            if href:
+                if child.get("rel", "alternate") == "alternate" or "link" not in fields:
+                    fields["link"] = href.strip()
+                continue
+        text = "".join(child.itertext()).strip()
+        if name in fields or not text:
+            continue
+        fields[name] = text
+
+    pub = next((fields[t] for t in _DATE_TAGS if fields.get(t)), "")
+    desc = next((fields[t] for t in _DESC_TAGS if fields.get(t)), "")
+    return {
+        "title": fields.get("title", ""),
+        "link": fields.get("link", ""),
+        "pub": pub,
+        "desc": _strip_markup(desc),
+    }
+
+
+def _iter_raw_entries(content: bytes) -> Iterator[Dict]:
+    """피드 본문의 item/entry를 문서 순서대로 하나씩 돌려준다 (거르지 않음)."""
+    stack: List[ET.Element] = []
+    for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if _local_name(elem.tag) not in _ITEM_TAGS:
+            continue
+
+        entry = _build_entry(elem)
+        # 처리한 항목은 부모에서 떼어내 트리가 커지지 않도록 한다.
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+        yield entry
+
+
+def select_entries(
+    entries: Iterable[Dict],
+    cutoff: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    max_stale: Optional[int] = DEFAULT_MAX_STALE,
+) -> Iterator[Dict]:
+    """
+    항목을 순서대로 보며 cutoff 이후 항목만 최대 limit개 돌려준다 (limit은 cutoff를 통과한 항목 수).
+
+    Args:
+        entries: {"title", "link", "pub", "desc"} 항목들 (피드 문서 순서)
+        cutoff: 이 시각보다 오래된 항목은 건너뛴다 (timezone-aware)
+        limit: 최대 반환 항목 수
+        max_stale: 오래된 항목이 연속으로 이만큼 나오면 나머지를 보지 않는다 (None이면 끝까지 본다)
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    yielded = 0
+    stale_run = 0
+    for entry in entries:
+        if cutoff is not None and entry["pub"]:
+            try:
+                is_stale = parse_published(entry["pub"]) < cutoff
+            except ValueError:
+                is_stale = False
+            if is_stale:
+                stale_run += 1
+                if max_stale is not None and stale_run >= max_stale:
+                    return
+                continue
+        stale_run = 0
+
+        yield entry
+        yielded += 1
+        if limit is not None and yielded >= limit:
+            return
+
+
+def iter_feed_entries(
+    content: bytes,
+    cutoff: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    max_stale: Optional[int] = DEFAULT_MAX_STALE,
+) -> Iterator[Dict]:
+    """
+    피드 본문을 스트리밍으로 읽으며 항목을 하나씩 돌려준다.
+    select_entries가 멈추면 남은 본문은 읽지 않는다.
+
+    Args:
+        content: RSS 2.0 또는 Atom 본문
+        cutoff, limit, max_stale: select_entries와 같다
+
+    Yields:
+        Dict: {"title", "link", "pub", "desc"}
+    """
+    return select_entries(_iter_raw_entries(content), cutoff=cutoff, limit=limit, max_stale=max_stale)
+
+
+def parse_feed_entries(
+    content: bytes,
+    cutoff: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> List[Dict]:
+    """iter_feed_entries의 리스트 버전 (피드 캐시의 parse 함수로 쓸 때는 cutoff/limit 없이 호출한다)"""
+    return list(iter_feed_entries(content, cutoff=cutoff, limit=limit))
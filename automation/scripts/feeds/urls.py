@@ -0,0 +1,243 @@
+"""
+URL 정규화 (피드 항목 식별자용)
+같은 기사가 추적 파라미터나 리다이렉터를 거쳐 다른 URL로 들어와도 같은 식별자를 갖도록 한다.
+정규화한 URL은 식별자/중복 판단에만 쓴다. 저장/링크/본문 요청에는 리다이렉터만 푼 원래 URL(unwrap)을 쓴다.
+("www."만 받는 호스트나 쿼리 순서에 민감한 사이트가 있다)
+
+- 스킴/호스트 소문자화, 기본 포트와 앞쪽 "www." 제거, 끝 슬래시 제거, fragment 제거
+- 추적 파라미터(utm_*, ref, fbclid, gclid 등) 제거, 나머지 쿼리는 키 순서로 정렬
+- 리다이렉터 풀기
+  - 목적지가 쿼리에 들어 있는 경우(google.com/url?q=, out.reddit.com?url= 등): 네트워크 없이 바로 푼다.
+  - 단축 URL/피드 프록시(t.co, bit.ly, feedproxy 등): resolve_all로 한 번에 병렬 요청해 최종 URL을 확인하고 디스크에 캐시한다.
+    실행 마감 시간 안에서만 요청하고, 해석하지 못한 단축 URL은 그대로 둔다 (다음 실행에서 다시 시도).
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_REDIRECT_CACHE_PATH = Path(
+    os.getenv("REDIRECT_CACHE_PATH", str(PROJECT_ROOT / "automation" / "cache" / "redirect_cache.json"))
+)
+
+TRACKING_PARAMS = {
+    "ref", "ref_src", "ref_url", "referrer", "cmpid",
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "guccounter", "guce_referrer", "guce_referrer_sig", "soc_src", "soc_trk",
+    ".tsrc", "taid", "ncid", "sr_share", "smid", "_ga",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# 쿼리 파라미터에 목적지가 들어 있는 리다이렉터: 호스트 -> 파라미터 이름
+QUERY_REDIRECTORS = {
+    "google.com": ("url", "q"),
+    "news.google.com": ("url",),
+    "l.facebook.com": ("u",),
+    "lm.facebook.com": ("u",),
+    "out.reddit.com": ("url",),
+    "t.umblr.com": ("z",),
+    "l.instagram.com": ("u",),
+}
+
+# 요청해 봐야 목적지를 알 수 있는 단축 URL/프록시 호스트
+RESOLVE_HOSTS = {
+    "t.co", "bit.ly", "ow.ly", "buff.ly", "tinyurl.com", "dlvr.it", "trib.al",
+    "feedproxy.google.com", "feeds.feedburner.com", "lnkd.in", "apple.news", "yhoo.it",
+}
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+# 리다이렉트 캐시 형식 버전 (2: 정규화하지 않은 목적지 URL 저장)
+REDIRECT_CACHE_VERSION = 2
+# 마감까지 이보다 적게 남았으면 단축 URL 해석을 건너뛴다 (초)
+MIN_RESOLVE_SECONDS = 1.0
+DEFAULT_RESOLVE_WORKERS = 8
+
+
+def _normalize_host(netloc: str, scheme: str) -> str:
+    host = netloc.rsplit("@", 1)[-1].lower().rstrip(".")
+    if ":" in host:
+        name, port = host.rsplit(":", 1)
+        if _DEFAULT_PORTS.get(scheme) == port:
+            host = name
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def _unwrap_query_redirect(host: str, query: str) -> Optional[str]:
+    names = QUERY_REDIRECTORS.get(host)
+    if not names:
+        return None
+    params = dict(parse_qsl(query))
+    for name in names:
+        target = params.get(name, "")
+        if target.startswith(("http://", "https://")):
+            return target
+    return None
+
+
+def unwrap_url(url: str) -> str:
+    """쿼리형 리다이렉터만 풀어 원래 목적지를 돌려준다 (그 외에는 받은 URL 그대로)"""
+    url = (url or "").strip()
+    for _ in range(3):  # 리다이렉터가 겹쳐 있는 경우 대비
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "https").lower()
+        if scheme not in ("http", "https"):
+            return url
+        target = _unwrap_query_redirect(_normalize_host(parts.netloc, scheme), parts.query)
+        if not target:
+            return url
+        url = target
+    return url
+
+
+def canonicalize_url(url: str) -> str:
+    """네트워크 요청 없이 할 수 있는 정규화 (추적 파라미터 제거, 쿼리형 리다이렉터 풀기 등)"""
+    url = unwrap_url(url)
+    if not url:
+        return url
+    parts = urlsplit(url)
+    scheme = (parts.scheme or "https").lower()
+    if scheme not in ("http", "https"):
+        return url
+    host = _normalize_host(parts.netloc, scheme)
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)
+    ))
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class UrlCanonicalizer:
+    """정규화 + 단축 URL 해석 (해석 결과는 디스크에 캐시)"""
+
+    def __init__(self, cache_path: Optional[Path] = None, resolve: bool = True, timeout: float = 5):
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_REDIRECT_CACHE_PATH
+        self.resolve = resolve and REQUESTS_AVAILABLE
+        self.timeout = timeout
+        self.redirects: Dict[str, str] = {}
+        self._dirty = False
+        self._session = None
+        self._load()
+
+    def _load(self):
+        if not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[WARN] 리다이렉트 캐시 로드 실패 ({self.cache_path}): {e}")
+            return
+        # 이전 형식(정규화된 목적지를 담은 평면 딕셔너리)은 링크로 쓸 수 없으므로 버린다.
+        if isinstance(data, dict) and data.get("version") == REDIRECT_CACHE_VERSION:
+            self.redirects = data.get("redirects", {})
+
+    def save(self):
+        """변경 사항이 있을 때만 임시 파일에 쓰고 교체한다."""
+        if not self._dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            tmp_path.write_text(
+                json.dumps({"version": REDIRECT_CACHE_VERSION, "redirects": self.redirects}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except Exception as e:
+            print(f"[WARN] 리다이렉트 캐시 저장 실패 ({self.cache_path}): {e}")
+
+    def _resolve(self, url: str, timeout: float) -> Optional[str]:
+        try:
+            resp = self._session.head(url, allow_redirects=True, timeout=timeout)
+            if resp.status_code >= 400 or resp.url == url:
+                # HEAD를 막는 단축 URL도 있어 GET으로 한 번 더 확인 (본문은 받지 않는다)
+                resp = self._session.get(url, allow_redirects=True, timeout=timeout, stream=True)
+                resp.close()
+            return resp.url if resp.status_code < 400 else None
+        except Exception as e:
+            print(f"[WARN] 리다이렉트 해석 실패 ({url}): {e}")
+            return None
+
+    def _pending(self, url: str) -> Optional[str]:
+        """아직 해석하지 않은 단축 URL이면 캐시 키(정규화 URL), 아니면 None"""
+        canonical = canonicalize_url(url)
+        if urlsplit(canonical).netloc in RESOLVE_HOSTS and canonical not in self.redirects:
+            return canonical
+        return None
+
+    def resolve_all(self, urls: Iterable[str], deadline: float, max_workers: int = DEFAULT_RESOLVE_WORKERS) -> int:
+        """
+        아직 모르는 단축 URL을 병렬로 해석해 캐시에 넣는다.
+
+        Args:
+            urls: 피드 항목 링크
+            deadline: 마감 시각 (time.monotonic 기준). 남은 시간이 없으면 요청하지 않는다.
+
+        Returns:
+            int: 새로 해석한 URL 수
+        """
+        if not self.resolve:
+            return 0
+        pending: Dict[str, str] = {}
+        for url in urls:
+            url = unwrap_url(url)
+            key = self._pending(url)
+            if key and key not in pending:
+                pending[key] = url
+        if not pending:
+            return 0
+        remaining = deadline - time.monotonic()
+        if remaining < MIN_RESOLVE_SECONDS:
+            print(f"[WARN] 마감 시간이 얼마 남지 않아 단축 URL {len(pending)}개 해석을 건너뜁니다")
+            return 0
+
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers["User-Agent"] = "Mozilla/5.0 (compatible; StockFeedBot/1.0)"
+        # HEAD가 안 되면 GET을 한 번 더 하므로 남은 시간을 반씩 쓴다
+        timeout = min(self.timeout, remaining / 2)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            targets = list(executor.map(lambda url: self._resolve(url, timeout), pending.values()))
+
+        resolved = 0
+        for key, target in zip(pending, targets):
+            # 실패는 캐시하지 않는다 (다음 실행에서 다시 시도)
+            if target:
+                self.redirects[key] = unwrap_url(target)
+                resolved += 1
+        if resolved:
+            self._dirty = True
+        return resolved
+
+    def unwrap(self, url: str) -> str:
+        """저장/링크용 URL: 리다이렉터와 (해석해 둔) 단축 URL만 푼 원래 주소"""
+        url = unwrap_url(url)
+        canonical = canonicalize_url(url)
+        if urlsplit(canonical).netloc in RESOLVE_HOSTS:
+            return self.redirects.get(canonical, url)
+        return url
+
+    def canonicalize(self, url: str) -> str:
+        """식별자/중복 판단용 정규화 URL (네트워크 요청 없음, 단축 URL은 캐시에 있을 때만 푼다)"""
+        return canonicalize_url(self.unwrap(url))
@@ -0,0 +1,153 @@
+"""
+관심종목 매칭 엔진
+_data/stock_watchlist.yml을 읽어 티커/회사명 별칭 사전을 만들고, 텍스트에서 관련 티커를 한 번에 찾아낸다.
+
+- 텍스트는 정규식 한 번으로 영문/숫자 토큰만 뽑아내고, 토큰(및 별칭 길이만큼의 n-gram)을 해시 조회한다.
+  관심종목 수가 늘어도 항목당 비용은 토큰 수에만 비례한다.
+  한글은 토큰에 넣지 않으므로 "SOFI가", "SoFi는"처럼 조사가 붙어도 티커/회사명이 떨어져 나온다.
+- 티커: 대문자 그대로 등장하거나($SOFI, $sofi 같은 캐시태그) 토큰 경계가 맞을 때만 매칭한다. ("SOFIA"는 매칭 안 됨)
+- 별칭: 각 항목의 name과 법인 접미사를 뗀 이름(예: "SoFi Technologies, Inc." -> "SoFi"), aliases 목록. 대소문자 무시.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_WATCHLIST_PATH = PROJECT_ROOT / "_data" / "stock_watchlist.yml"
+
+# yml을 읽을 수 없을 때 사용하는 기본 관심종목
+DEFAULT_WATCHLIST = [{"ticker": "SOFI", "name": "SoFi Technologies, Inc."}]
+
+# 영문/숫자 토큰 ("BRK.B", "AT&T"처럼 안쪽의 . & -는 토큰에 포함, 문장 끝 마침표는 제외)
+_TOKEN_RE = re.compile(r"\$?[A-Za-z0-9]+(?:[.&-][A-Za-z0-9]+)*")
+
+# 회사명에서 떼어낼 법인/업종 접미사 (뒤에서부터 반복 제거)
+_CORPORATE_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "llc", "lp", "nv", "sa", "ag", "se", "holdings", "holding", "group",
+    "technologies", "technology",
+}
+
+
+def load_watchlist(path: Optional[Path] = None) -> List[Dict]:
+    """
+    관심종목 목록 로드
+
+    Returns:
+        List[Dict]: [{"ticker": "SOFI", "name": "...", "aliases": [...], ...}, ...]
+    """
+    path = Path(path) if path else DEFAULT_WATCHLIST_PATH
+    if not YAML_AVAILABLE:
+        print("[WARN] PyYAML이 설치되지 않아 기본 관심종목(SOFI)만 사용합니다.")
+        return list(DEFAULT_WATCHLIST)
+    if not path.exists():
+        print(f"[WARN] 관심종목 파일이 없습니다: {path}")
+        return list(DEFAULT_WATCHLIST)
+
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or []
+    except Exception as e:
+        print(f"[WARN] 관심종목 파일 로드 실패 ({path}): {e}")
+        return list(DEFAULT_WATCHLIST)
+
+    entries = []
+    for entry in data:
+        if isinstance(entry, dict) and entry.get("ticker"):
+            entries.append({**entry, "ticker": str(entry["ticker"]).strip().upper()})
+    return entries or list(DEFAULT_WATCHLIST)
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text)
+
+
+def _strip_suffixes(name: str) -> str:
+    words = [w for w in _tokenize(name) if not w.startswith("$")]
+    while words and words[-1].lower() in _CORPORATE_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def short_name(entry: Dict) -> str:
+    """글 제목/프롬프트에 쓸 짧은 회사명 (예: "SoFi Technologies, Inc." -> "SoFi", 이름이 없으면 티커)"""
+    name = (entry.get("name") or "").strip()
+    short = _strip_suffixes(name) if name else ""
+    return short or name or str(entry["ticker"])
+
+
+def company_aliases(entry: Dict) -> List[str]:
+    """관심종목 항목에서 회사명 별칭 목록 생성 (name, 접미사 제거한 name, aliases)"""
+    aliases = [str(a) for a in entry.get("aliases") or [] if a]
+    name = (entry.get("name") or "").strip()
+    if name:
+        aliases.append(name)
+        short = _strip_suffixes(name)
+        if len(short) >= 3:
+            aliases.append(short)
+    return aliases
+
+
+class TickerMatcher:
+    """관심종목 티커/별칭 매칭기 (한 번 만들어 두고 여러 항목에 재사용)"""
+
+    def __init__(self, watchlist: List[Dict]):
+        self.order: Dict[str, int] = {}
+        self.symbols: Dict[str, str] = {}
+        self.aliases: Dict[Tuple[str, ...], str] = {}
+        # 별칭 첫 토큰 집합: 여기 없는 토큰에서는 n-gram 조회를 건너뛴다.
+        self.alias_heads = set()
+        self.max_alias_len = 1
+
+        for idx, entry in enumerate(watchlist):
+            ticker = str(entry["ticker"]).strip().upper()
+            self.order.setdefault(ticker, idx)
+            self.symbols[ticker] = ticker
+            for alias in company_aliases(entry):
+                key = tuple(t.lower() for t in _tokenize(alias) if not t.startswith("$"))
+                if key:
+                    self.aliases.setdefault(key, ticker)
+                    self.alias_heads.add(key[0])
+                    self.max_alias_len = max(self.max_alias_len, len(key))
+
+    @property
+    def tickers(self) -> List[str]:
+        return sorted(self.order, key=self.order.get)
+
+    def match(self, text: str) -> List[str]:
+        """텍스트에 등장하는 관심종목 티커 목록 (관심종목 파일 순서)"""
+        if not text:
+            return []
+
+        tokens = _tokenize(text)
+        lowered = [t.lower() for t in tokens]
+        found = set()
+
+        for i, token in enumerate(tokens):
+            if token.startswith("$"):
+                ticker = self.symbols.get(token[1:].upper())
+                if ticker:
+                    found.add(ticker)
+                continue
+
+            # 티커는 대문자로 쓰인 경우만 인정한다 (소문자 일반 단어 오탐 방지)
+            ticker = self.symbols.get(token)
+            if ticker:
+                found.add(ticker)
+
+            if lowered[i] not in self.alias_heads:
+                continue
+            for n in range(1, self.max_alias_len + 1):
+                if i + n > len(tokens):
+                    break
+                ticker = self.aliases.get(tuple(lowered[i:i + n]))
+                if ticker:
+                    found.add(ticker)
+
+        return sorted(found, key=self.order.get)
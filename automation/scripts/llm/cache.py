@@ -0,0 +1,133 @@
+"""
+LLM 응답 캐시
+(모델, 프롬프트, 생성 설정)의 해시를 키로 응답 텍스트를 디스크에 보관한다.
+auto_post 재실행이나 같은 날 재생성처럼 같은 프롬프트를 다시 보내면 API를 호출하지 않고 저장된 응답을 돌려준다.
+
+- 항목 하나가 파일 하나다: automation/cache/llm/<키 앞 2자리>/<키>.json
+  응답을 받는 즉시 저장하므로, 뒤 단계가 실패해도 앞 단계 응답은 남는다 (여러 프로세스/스레드가 동시에 써도 안전).
+- TTL이 지난 항목은 없는 것으로 보고 지운다.
+- 전체 크기(max_bytes) 또는 항목 수(max_entries)를 넘으면 가장 오래 쓰이지 않은 항목부터 지운다 (LRU, 파일 수정 시각 기준).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_LLM_CACHE_DIR = Path(
+    os.getenv("LLM_CACHE_DIR", str(PROJECT_ROOT / "automation" / "cache" / "llm"))
+)
+DEFAULT_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "24"))
+DEFAULT_MAX_MB = float(os.getenv("LLM_CACHE_MAX_MB", "50"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+
+
+def cache_key(model: str, prompt: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """(모델, 프롬프트, 생성 설정) 해시"""
+    payload = json.dumps({"model": model, "prompt": prompt, "config": config or {}}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """해시 키 -> 응답 텍스트 (TTL + 크기 제한 LRU)"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        max_bytes: int = int(DEFAULT_MAX_MB * 1024 * 1024),
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_LLM_CACHE_DIR
+        self.ttl = ttl_hours * 3600
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 항목 크기는 처음 쓸 때 한 번 디렉터리를 훑어서 구한다 (파일 내용은 읽지 않는다)
+        self._sizes: Optional[Dict[str, int]] = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _scan(self) -> Dict[str, int]:
+        if self._sizes is None:
+            sizes = {}
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*.json"):
+                    try:
+                        sizes[path.stem] = path.stat().st_size
+                    except OSError:
+                        continue
+            self._sizes = sizes
+        return self._sizes
+
+    def _remove(self, key: str):
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+        if self._sizes is not None:
+            self._sizes.pop(key, None)
+
+    def get(self, key: str) -> Optional[str]:
+        """저장된 응답 (없거나 TTL이 지났으면 None). 적중하면 LRU 순서를 갱신한다."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            if time.time() - float(data.get("created_at", 0)) > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data.get("text")
+
+    def put(self, key: str, text: str, model: str = ""):
+        """응답 저장 (임시 파일에 쓰고 교체) 후 크기 제한을 넘으면 오래된 항목부터 지운다."""
+        path = self._path(key)
+        payload = json.dumps({"model": model, "created_at": time.time(), "text": text}, ensure_ascii=False)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] LLM 응답 캐시 저장 실패 ({path}): {e}")
+            return
+        with self._lock:
+            sizes = self._scan()
+            sizes[key] = len(payload.encode("utf-8"))
+            if len(sizes) > self.max_entries or sum(sizes.values()) > self.max_bytes:
+                self._evict(keep=key)
+
+    def _evict(self, keep: str):
+        """수정 시각(마지막 사용)이 오래된 항목부터 한도 안으로 들어올 때까지 지운다."""
+        sizes = self._sizes
+        ages = []
+        for key in sizes:
+            try:
+                ages.append((self._path(key).stat().st_mtime, key))
+            except OSError:
+                ages.append((0.0, key))
+        total = sum(sizes.values())
+        for _, key in sorted(ages):
+            if len(sizes) <= self.max_entries and total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= sizes.get(key, 0)
+            self._remove(key)
@@ -0,0 +1,337 @@
+"""
+Gemini 호출 공통 계층
+모든 에이전트/스크립트는 generate()로 Gemini를 호출한다.
+
+- 클라이언트: API 키별로 프로세스에 하나만 만들어 재사용한다 (스레드 안전).
+- 모델 체인: 작업 종류(task)별로 시도할 모델 순서를 MODEL_CHAINS에 둔다.
+  환경 변수 GEMINI_<TASK>_MODEL(예: GEMINI_WRITER_MODEL)이 있으면 체인 맨 앞에 넣는다.
+- 오류 분류:
+  transient (429, 5xx, 타임아웃/연결 오류): 같은 모델로 지수 백오프 + 지터 재시도. 서버의 retryDelay/Retry-After가 있으면 따른다.
+  model     (404, 모델 미존재/권한, 빈 응답/짧은 응답): 바로 다음 모델로 넘어간다.
+  permanent (잘못된 API 키, 잘못된 요청 등 그 밖의 4xx): 재시도하지 않고 LLMError(permanent=True)를 던진다.
+- 마감 시간: 호출 하나(모델 체인 전체)의 마감을 넘기지 않는다. 요청 타임아웃과 백오프 대기는 남은 시간으로 줄이고,
+  재시도 대기가 마감을 넘기면 기다리지 않고 다음 모델로 넘어간다.
+- 응답 캐시: (모델, 프롬프트, 생성 설정)이 같은 호출은 llm.cache에 저장된 응답을 돌려준다.
+  체인 순서대로 모델별 키를 조회하고, 실제로 응답한 모델의 키로 저장한다. 호출마다 cache=True/False로 정할 수 있다 (LLM_CACHE=0이면 전체 끔).
+  글을 새로 쓰는 작업(UNCACHED_TASKS: writer, stock_post)은 기본으로 캐시하지 않는다 (재생성하면 새 초안이 나와야 한다).
+  validate를 넘기면 그 검사를 통과한 응답만 저장하고, 캐시에서 꺼낸 응답도 통과할 때만 쓴다.
+- 스트리밍 검사: check를 넘기면 generate_content_stream으로 받으면서 누적 텍스트를 STREAM_CHECK_INTERVAL자마다 검사한다.
+  check가 중단 사유를 돌려주면 스트림을 바로 끊고 LLMAborted를 던진다 (다음 모델로 넘어가지 않는다. 재시도는 호출한 쪽이 정한다).
+  스트림이 멈추거나(STREAM_STALL_SECONDS 동안 청크 없음) 마감 시간을 넘기면 일시 오류로 보고 다른 오류처럼 재시도/다음 모델로 넘어간다.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from google import genai
+    from google.genai import types
+    GENAI_AVAILABLE = True
+except ImportError:
+    GENAI_AVAILABLE = False
+
+from llm.cache import ResponseCache, cache_key
+
+# 작업별 모델 폴백 체인 (앞에서부터 시도)
+MODEL_CHAINS: Dict[str, List[str]] = {
+    "default": ["models/gemini-2.0-flash", "models/gemini-2.5-flash", "models/gemini-flash-latest"],
+    "writer": [
+        "models/gemini-2.5-flash",
+        "models/gemini-2.0-flash-exp",
+        "models/gemini-2.0-flash",
+        "models/gemini-flash-latest",
+    ],
+    "stock_post": ["models/gemini-2.5-flash", "models/gemini-2.0-flash", "models/gemini-flash-latest"],
+    "research": ["models/gemini-2.0-flash", "models/gemini-2.5-flash", "models/gemini-flash-latest"],
+    "analysis": ["models/gemini-2.0-flash", "models/gemini-2.5-flash", "models/gemini-flash-latest"],
+    "review": ["models/gemini-2.0-flash", "models/gemini-2.5-flash", "models/gemini-flash-latest"],
+}
+
+DEFAULT_DEADLINE = float(os.getenv("LLM_DEADLINE_SECONDS", "240"))
+MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 60.0
+# 남은 시간이 이보다 적으면 새 요청을 보내지 않는다
+MIN_REQUEST_SECONDS = 5.0
+# 스트리밍 검사 간격 (새로 받은 글자 수)
+STREAM_CHECK_INTERVAL = 300
+# 스트리밍 요청 타임아웃 상한 (HTTP 읽기마다 적용되므로 청크 사이 최대 대기 시간이 된다)
+STREAM_STALL_SECONDS = float(os.getenv("LLM_STREAM_STALL_SECONDS", "60"))
+
+_TRANSIENT_CODES = {408, 429, 500, 502, 503, 504}
+_MODEL_CODES = {404}
+_TRANSIENT_STATUSES = ("RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "INTERNAL")
+_CODE_RE = re.compile(r"^\s*(\d{3})\b")
+_RETRY_DELAY_RE = re.compile(r"retryDelay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s")
+
+# 요청별 타임아웃 지원 여부 (google-genai 1.x부터 GenerateContentConfig.http_options)
+_REQUEST_TIMEOUT_SUPPORTED = GENAI_AVAILABLE and "http_options" in getattr(types.GenerateContentConfig, "model_fields", {})
+
+CACHE_ENABLED = os.getenv("LLM_CACHE", "1") == "1"
+# 기본으로 응답을 캐시하지 않는 작업 (같은 프롬프트라도 매번 새로 써야 하는 글 생성)
+UNCACHED_TASKS = {"writer", "stock_post"}
+RESPONSE_CACHE = ResponseCache()
+
+_clients: Dict[str, object] = {}
+_clients_lock = threading.Lock()
+
+
+class LLMError(RuntimeError):
+    """모델 체인 전체가 실패했거나(permanent=False) 재시도해도 소용없는 오류(permanent=True)"""
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class LLMAborted(LLMError):
+    """스트리밍 검사(check)가 출력 이탈을 감지해 생성을 중단했다."""
+
+    def __init__(self, reason: str, received: int):
+        super().__init__(f"생성 중단 ({received}자 수신): {reason}")
+        self.reason = reason
+        self.received = received
+
+
+def get_client(api_key: Optional[str] = None):
+    """API 키별 공용 genai.Client (처음 요청할 때 한 번 만든다)"""
+    if not GENAI_AVAILABLE:
+        raise LLMError("google-genai 패키지가 설치되지 않았습니다. pip install google-genai 를 실행하세요.", permanent=True)
+    key = api_key or os.getenv("GEMINI_API_KEY")
+    if not key:
+        raise LLMError("GEMINI_API_KEY가 설정되지 않았습니다.", permanent=True)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = genai.Client(api_key=key)
+            _clients[key] = client
+        return client
+
+
+def model_chain(task: str) -> List[str]:
+    """작업별 모델 순서 (환경 변수로 지정한 모델이 맨 앞, 중복 제거)"""
+    override = os.getenv(f"GEMINI_{task.upper()}_MODEL")
+    chain = [override] if override else []
+    for model in MODEL_CHAINS.get(task, MODEL_CHAINS["default"]):
+        if model not in chain:
+            chain.append(model)
+    return chain
+
+
+def _error_code(error: Exception) -> Optional[int]:
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code
+    match = _CODE_RE.match(str(error))
+    return int(match.group(1)) if match else None
+
+
+def classify_error(error: Exception) -> str:
+    """오류 종류: "transient" | "model" | "permanent" """
+    code = _error_code(error)
+    if code in _TRANSIENT_CODES:
+        return "transient"
+    if code in _MODEL_CODES:
+        return "model"
+    if code is not None and 400 <= code < 500:
+        return "permanent"
+    message = str(error).upper()
+    if "NOT_FOUND" in message:
+        return "model"
+    if any(status in message for status in _TRANSIENT_STATUSES):
+        return "transient"
+    # 상태 코드가 없는 오류: 타임아웃/연결 끊김 등 네트워크 계층 오류로 보고 재시도한다
+    if code is None and (
+        isinstance(error, (TimeoutError, ConnectionError))
+        or any(word in type(error).__name__ for word in ("Timeout", "Connect", "Network", "Protocol"))
+    ):
+        return "transient"
+    if code is not None and code >= 500:
+        return "transient"
+    return "permanent"
+
+
+def retry_hint(error: Exception) -> Optional[float]:
+    """서버가 알려준 재시도 대기 시간(초): Retry-After 헤더 또는 RetryInfo.retryDelay"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        retry_after = headers.get("retry-after") or headers.get("Retry-After")
+        if retry_after:
+            return float(retry_after)
+    except (TypeError, ValueError):
+        pass
+    match = _RETRY_DELAY_RE.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def backoff_delay(attempt: int, hint: Optional[float] = None) -> float:
+    """attempt번째(1부터) 재시도 전 대기 시간. 힌트가 있으면 힌트 + 작은 지터, 없으면 full jitter"""
+    if hint is not None:
+        return hint + random.uniform(0, 1.0)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** (attempt - 1))))
+
+
+def _request_kwargs(timeout: float, generation_config: Dict[str, Any]) -> Dict[str, Any]:
+    options = dict(generation_config)
+    if _REQUEST_TIMEOUT_SUPPORTED:
+        options["http_options"] = types.HttpOptions(timeout=int(timeout * 1000))
+    return {"config": types.GenerateContentConfig(**options)} if options else {}
+
+
+def _request(client, model: str, prompt: str, timeout: float, generation_config: Dict[str, Any]) -> str:
+    response = client.models.generate_content(model=model, contents=prompt, **_request_kwargs(timeout, generation_config))
+    return (getattr(response, "text", None) or "").strip()
+
+
+def _request_stream(
+    client,
+    model: str,
+    prompt: str,
+    timeout: float,
+    generation_config: Dict[str, Any],
+    check: Callable[[str], Optional[str]],
+    run_deadline: float,
+) -> str:
+    """스트리밍으로 받으며 check로 누적 텍스트를 검사한다. 이탈이 감지되면 스트림을 닫고 LLMAborted"""
+    stream = client.models.generate_content_stream(model=model, contents=prompt, **_request_kwargs(timeout, generation_config))
+    parts: List[str] = []
+    received = 0
+    checked = 0
+    try:
+        for chunk in stream:
+            piece = getattr(chunk, "text", None) or ""
+            parts.append(piece)
+            received += len(piece)
+            if received - checked >= STREAM_CHECK_INTERVAL:
+                checked = received
+                reason = check("".join(parts))
+                if reason:
+                    raise LLMAborted(reason, received)
+            if time.monotonic() > run_deadline:
+                # 일시 오류로 분류되어 남은 시간이 있으면 다음 모델로 넘어간다
+                raise TimeoutError(f"스트리밍 중 마감 시간 초과 ({received}자 수신)")
+    finally:
+        # 생성기를 닫으면 HTTP 스트림도 닫혀 나머지 토큰을 받지 않는다
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+    return "".join(parts).strip()
+
+
+def _cached_response(
+    chain: List[str],
+    prompt: str,
+    generation_config: Dict[str, Any],
+    min_length: int,
+    validate: Optional[Callable[[str], Optional[str]]],
+) -> Optional[str]:
+    for model in chain:
+        text = RESPONSE_CACHE.get(cache_key(model, prompt, generation_config))
+        if text is None or len(text) < min_length:
+            continue
+        if validate is not None and validate(text):
+            continue
+        print(f"[OK] 캐시된 응답 사용 ({model}, {len(text)}자)")
+        return text
+    return None
+
+
+def generate(
+    prompt: str,
+    task: str = "default",
+    api_key: Optional[str] = None,
+    min_length: int = 1,
+    deadline: float = DEFAULT_DEADLINE,
+    models: Optional[List[str]] = None,
+    generation_config: Optional[Dict[str, Any]] = None,
+    cache: Optional[bool] = None,
+    check: Optional[Callable[[str], Optional[str]]] = None,
+    validate: Optional[Callable[[str], Optional[str]]] = None,
+) -> str:
+    """
+    모델 체인을 따라 Gemini로 텍스트를 생성한다.
+
+    Args:
+        prompt: 프롬프트
+        task: MODEL_CHAINS의 작업 이름 (모델 순서 선택)
+        api_key: 없으면 GEMINI_API_KEY 환경 변수
+        min_length: 이보다 짧은 응답은 실패로 보고 다음 모델을 시도한다
+        deadline: 체인 전체 마감 시간(초)
+        models: 모델 순서를 직접 지정할 때
+        generation_config: GenerateContentConfig 인자 (temperature 등, 캐시 키에 포함)
+        cache: 캐시 조회/저장 여부. None이면 작업 기본값 (UNCACHED_TASKS는 끔, 나머지는 켬)
+        check: 스트리밍 중 누적 텍스트 검사 함수. 중단 사유(str)를 돌려주면 생성을 멈춘다 (None이면 스트리밍하지 않는다)
+        validate: 캐시 저장 전 응답 검사 함수. 거절 사유(str)를 돌려주면 저장하지 않는다 (응답은 그대로 돌려준다)
+
+    Returns:
+        str: 공백을 정리한 응답 텍스트
+
+    Raises:
+        LLMError: 영구 오류(permanent=True)이거나 모든 모델이 실패/마감 시간 초과
+        LLMAborted: check가 생성을 중단시켰을 때
+    """
+    client = get_client(api_key)
+    chain = models or model_chain(task)
+    generation_config = dict(generation_config or {})
+    if cache is None:
+        cache = task not in UNCACHED_TASKS
+    use_cache = cache and CACHE_ENABLED
+    if use_cache:
+        text = _cached_response(chain, prompt, generation_config, min_length, validate)
+        if text is not None:
+            return text
+    run_deadline = time.monotonic() + deadline
+    last_error = "시도한 모델 없음"
+
+    for model in chain:
+        attempt = 0
+        while True:
+            remaining = run_deadline - time.monotonic()
+            if remaining < MIN_REQUEST_SECONDS:
+                raise LLMError(f"Gemini 호출 마감 시간({deadline:.0f}초) 초과 ({task}, 마지막 오류: {last_error})")
+            attempt += 1
+            try:
+                if check is None:
+                    text = _request(client, model, prompt, remaining, generation_config)
+                else:
+                    text = _request_stream(
+                        client, model, prompt, min(remaining, STREAM_STALL_SECONDS), generation_config, check, run_deadline
+                    )
+            except LLMAborted as e:
+                print(f"[WARN] 모델 {model} {e}")
+                raise
+            except Exception as e:
+                kind = classify_error(e)
+                last_error = f"{model}: {e}"
+                if kind == "permanent":
+                    raise LLMError(f"Gemini 영구 오류 ({model}): {e}", permanent=True) from e
+                if kind == "model" or attempt > MAX_RETRIES:
+                    print(f"[WARN] 모델 {model} 실패 ({kind}): {str(e)[:200]}")
+                    break
+                delay = backoff_delay(attempt, retry_hint(e))
+                if time.monotonic() + delay + MIN_REQUEST_SECONDS > run_deadline:
+                    print(f"[WARN] 모델 {model} 일시 오류, 재시도 대기({delay:.1f}초)가 마감을 넘어 다음 모델로 넘어갑니다: {str(e)[:200]}")
+                    break
+                print(f"[WARN] 모델 {model} 일시 오류, {delay:.1f}초 후 재시도 ({attempt}/{MAX_RETRIES}): {str(e)[:200]}")
+                time.sleep(delay)
+                continue
+
+            if len(text) < min_length:
+                last_error = f"{model}: 응답이 너무 짧습니다 ({len(text)}자)"
+                print(f"[WARN] 모델 {model} 응답이 너무 짧습니다: {len(text)}자")
+                break
+            print(f"[OK] 모델 {model} 응답 ({task}, {len(text)}자)")
+            if use_cache:
+                rejected = validate(text) if validate is not None else None
+                if rejected:
+                    print(f"[INFO] 검사를 통과하지 못한 응답은 캐시하지 않습니다: {rejected}")
+                else:
+                    RESPONSE_CACHE.put(cache_key(model, prompt, generation_config), text, model)
+            return text
+
+    raise LLMError(f"모든 모델 시도 실패 ({task}): {last_error}")
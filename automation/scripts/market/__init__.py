@@ -0,0 +1,2 @@
+# Market data package
+
@@ -0,0 +1,166 @@
+"""
+시장 데이터 일괄 수집
+_data/market_symbols.yml에 정의된 심볼 전체를 yfinance 한 번의 일괄(스레드) 요청으로 받아 심볼별 DataFrame으로 나눈다.
+요청 기간은 필요한 기간 중 가장 긴 것으로 맞춘다 (거시 지표 5일 + 기술적 지표 120일 -> 120일 한 번).
+로컬 OHLCV 저장소(market.store)를 거치면 마지막 저장일 이후 봉만 받는다.
+여러 종목 글을 만들 때는 종목별 설정(ticker_market_config)의 심볼을 합쳐 한 번에 받는다.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = PANDAS_AVAILABLE
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+from market.store import OhlcvStore
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_MARKET_CONFIG_PATH = PROJECT_ROOT / "_data" / "market_symbols.yml"
+
+# 설정 파일을 읽을 수 없을 때 사용하는 기본값 (기존 하드코딩 심볼과 같음)
+DEFAULT_MARKET_CONFIG = {
+    "macro": {"tnx": "^TNX", "nasdaq_fintech": "^IXIC"},
+    "macro_period_days": 5,
+    "competitors": ["UPST", "AFRM"],
+    "technical": {"symbol": "SOFI", "period_days": 120},
+}
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def load_market_config(path: Optional[Path] = None) -> Dict:
+    """시장 데이터 심볼 설정 로드 (누락된 키는 기본값으로 채운다)"""
+    path = Path(path) if path else DEFAULT_MARKET_CONFIG_PATH
+    config = dict(DEFAULT_MARKET_CONFIG)
+    if not YAML_AVAILABLE or not path.exists():
+        return config
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except Exception as e:
+        print(f"[WARN] 시장 데이터 설정 로드 실패 ({path}): {e}")
+        return config
+    for key in DEFAULT_MARKET_CONFIG:
+        if data.get(key) is not None:
+            config[key] = data[key]
+    return config
+
+
+def config_symbols(config: Dict) -> List[str]:
+    """설정에 등장하는 모든 심볼 (중복 제거, 순서 유지)"""
+    symbols = list(config["macro"].values()) + list(config["competitors"]) + [config["technical"]["symbol"]]
+    return list(dict.fromkeys(str(s).strip() for s in symbols if s))
+
+
+def ticker_market_config(base_config: Dict, entry: Dict) -> Dict:
+    """
+    관심종목 항목(_data/stock_watchlist.yml)의 post 설정으로 종목별 시장 데이터 설정을 만든다.
+    기술적 지표 대상은 그 종목, 경쟁사는 post.competitors(없으면 공통 설정), 거시 지표는 post.macro가 있으면 교체한다.
+    """
+    post = entry.get("post") if isinstance(entry.get("post"), dict) else {}
+    config = dict(base_config)
+    config["technical"] = {**base_config["technical"], "symbol": entry["ticker"]}
+    if post.get("competitors") is not None:
+        config["competitors"] = [str(s).strip().upper() for s in post["competitors"] if s]
+    if post.get("macro"):
+        config["macro"] = {**base_config["macro"], **post["macro"]}
+    return config
+
+
+def config_period_days(config: Dict) -> int:
+    """한 번에 받을 기간 (필요한 기간 중 가장 긴 것)"""
+    return max(int(config["macro_period_days"]), int(config["technical"]["period_days"]))
+
+
+def split_download(data: "pd.DataFrame", symbols: List[str]) -> Dict[str, "pd.DataFrame"]:
+    """
+    yf.download 결과를 심볼별 OHLCV DataFrame으로 나눈다.
+    group_by="ticker"면 컬럼이 (심볼, 필드) MultiIndex이고, 버전에 따라 단일 심볼은 평평한 컬럼일 수 있다.
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    if data is None or data.empty:
+        return frames
+
+    if isinstance(data.columns, pd.MultiIndex):
+        available = set(data.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in available:
+                continue
+            frame = data[symbol]
+            frame = frame[[c for c in OHLCV_COLUMNS if c in frame.columns]].dropna(how="all")
+            if not frame.empty:
+                frames[symbol] = frame
+    elif len(symbols) == 1:
+        frame = data[[c for c in OHLCV_COLUMNS if c in data.columns]].dropna(how="all")
+        if not frame.empty:
+            frames[symbols[0]] = frame
+    return frames
+
+
+def download_frames(symbols: List[str], period_days: int, start: Optional[str] = None) -> Dict[str, "pd.DataFrame"]:
+    """
+    여러 심볼의 일봉을 한 번의 요청으로 받는다.
+
+    Args:
+        symbols: 심볼 목록
+        period_days: 받을 기간(일). start가 있으면 무시
+        start: 시작일(YYYY-MM-DD). 주어지면 그 날짜 이후만 받는다.
+
+    Returns:
+        Dict[str, DataFrame]: 심볼 -> OHLCV (받지 못한 심볼은 빠진다)
+    """
+    if not YFINANCE_AVAILABLE or not symbols:
+        return {}
+    kwargs = {"start": start} if start else {"period": f"{period_days}d"}
+    # Ticker.history()와 같은 수정 주가(auto_adjust=True)를 사용한다.
+    data = yf.download(
+        tickers=symbols,
+        interval="1d",
+        group_by="ticker",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+        **kwargs,
+    )
+    return split_download(data, symbols)
+
+
+def fetch_market_frames(
+    config: Optional[Dict] = None,
+    store: Optional[OhlcvStore] = None,
+    extra_configs: Optional[List[Dict]] = None,
+) -> Dict[str, "pd.DataFrame"]:
+    """
+    설정의 모든 심볼을 심볼별 DataFrame으로 반환
+    store가 있으면 로컬 저장소를 먼저 쓰고 새 봉만 일괄 요청한다. 없으면 전체 기간을 한 번에 받는다.
+    extra_configs(종목별 설정)가 있으면 그 심볼까지 합쳐 한 번에 받는다.
+    """
+    configs = [config or load_market_config()] + list(extra_configs or [])
+    symbols = list(dict.fromkeys(s for c in configs for s in config_symbols(c)))
+    period_days = max(config_period_days(c) for c in configs)
+    try:
+        if store is not None:
+            frames = store.get_frames(symbols, period_days, download=download_frames)
+        else:
+            frames = download_frames(symbols, period_days)
+    except Exception as e:
+        print(f"[WARN] 시장 데이터 일괄 수집 실패: {e}")
+        return {}
+    missing = [s for s in symbols if s not in frames]
+    if missing:
+        print(f"[WARN] 시장 데이터 누락: {', '.join(missing)}")
+    return frames
@@ -0,0 +1,428 @@
+"""
+NumPy 기술적 지표 엔진
+배열 전체를 한 번에 계산하는 배치 함수와, 저장해 둔 상태에서 새 봉 하나만 O(1)로 반영하는 스트리밍 엔진을 제공한다.
+
+- 입력은 (T,) 또는 (N, T) 배열 (마지막 축이 시간). N개 심볼을 한 번에 계산한다 (같은 날짜로 맞춰진 배열).
+- 워밍업 구간(값이 정의되지 않는 앞부분)은 NaN
+- RSI/ATR: Wilder 평활 (첫 값은 단순평균, 이후 이전값 + (현재값 - 이전값) / n)
+- EMA: pandas ewm(span, adjust=False)와 같은 정의 (첫 값에서 시작)
+- 볼린저 밴드 / 거래량 z-score: 모집단 표준편차(ddof=0)
+- 심볼별 상태는 automation/cache/indicators/<심볼>.npz에 저장한다 (INDICATOR_STATE_DIR로 변경).
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_STATE_DIR = Path(os.getenv("INDICATOR_STATE_DIR", str(PROJECT_ROOT / "automation" / "cache" / "indicators")))
+
+BAR_FIELDS = ("High", "Low", "Close", "Volume")
+
+
+def _as_2d(x) -> np.ndarray:
+    arr = np.asarray(x, dtype=np.float64)
+    return arr[np.newaxis, :] if arr.ndim == 1 else arr
+
+
+def _restore(out: np.ndarray, like) -> np.ndarray:
+    """입력이 1차원이었으면 1차원으로 돌려준다."""
+    return out[0] if np.ndim(like) == 1 else out
+
+
+def _recursive(values: np.ndarray, alpha: float, seed: np.ndarray, start: int) -> np.ndarray:
+    """y[start] = seed, y[t] = y[t-1] + alpha * (x[t] - y[t-1]) (시간축 순회, 심볼 축은 벡터 연산)"""
+    out = np.full_like(values, np.nan)
+    if start >= values.shape[-1]:
+        return out
+    out[:, start] = seed
+    prev = seed
+    for t in range(start + 1, values.shape[-1]):
+        prev = prev + alpha * (values[:, t] - prev)
+        out[:, t] = prev
+    return out
+
+
+def _wilder(values: np.ndarray, period: int, offset: int) -> np.ndarray:
+    """Wilder 평활. values[:, offset:offset + period]의 평균에서 시작한다."""
+    start = offset + period - 1
+    if start >= values.shape[-1]:
+        return np.full_like(values, np.nan)
+    seed = values[:, offset:start + 1].mean(axis=-1)
+    return _recursive(values, 1.0 / period, seed, start)
+
+
+def _gains_losses(close: np.ndarray):
+    delta = np.diff(close, axis=-1, prepend=np.nan)
+    return np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0)
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    # 하락이 전혀 없으면 100, 변화가 전혀 없으면 50
+    out = np.where((avg_loss == 0) & (avg_gain > 0), 100.0, out)
+    out = np.where((avg_loss == 0) & (avg_gain == 0), 50.0, out)
+    return np.where(np.isnan(avg_gain) | np.isnan(avg_loss), np.nan, out)
+
+
+def sma(x, window: int) -> np.ndarray:
+    """단순 이동평균 (누적합 차분)"""
+    arr = _as_2d(x)
+    out = np.full_like(arr, np.nan)
+    if arr.shape[-1] >= window:
+        csum = np.cumsum(np.pad(arr, ((0, 0), (1, 0))), axis=-1)
+        out[:, window - 1:] = (csum[:, window:] - csum[:, :-window]) / window
+    return _restore(out, x)
+
+
+def rolling_std(x, window: int) -> np.ndarray:
+    """이동 표준편차 (ddof=0). 거래량처럼 큰 값에서도 정확하도록 창 단위로 계산한다."""
+    arr = _as_2d(x)
+    out = np.full_like(arr, np.nan)
+    if arr.shape[-1] >= window:
+        out[:, window - 1:] = sliding_window_view(arr, window, axis=-1).std(axis=-1)
+    return _restore(out, x)
+
+
+def ema(x, span: int) -> np.ndarray:
+    """지수 이동평균 (pandas ewm(span=span, adjust=False).mean()과 같음)"""
+    arr = _as_2d(x)
+    if arr.shape[-1] == 0:
+        return _restore(arr.copy(), x)
+    return _restore(_recursive(arr, 2.0 / (span + 1), arr[:, 0], 0), x)
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    """Wilder RSI (첫 값은 period + 1번째 봉)"""
+    gain, loss = _gains_losses(_as_2d(close))
+    return _restore(_rsi_from_averages(_wilder(gain, period, 1), _wilder(loss, period, 1)), close)
+
+
+def bollinger(close, window: int = 20, k: float = 2.0) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (mid, upper, lower)"""
+    mid = sma(close, window)
+    std = rolling_std(close, window)
+    return {"mid": mid, "upper": mid + k * std, "lower": mid - k * std}
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True Range (첫 봉은 고가 - 저가)"""
+    h, l, c = _as_2d(high), _as_2d(low), _as_2d(close)
+    prev_close = np.concatenate([np.full((c.shape[0], 1), np.nan), c[:, :-1]], axis=-1)
+    # fmax는 NaN을 무시하므로 첫 봉은 고가 - 저가가 된다.
+    tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return _restore(tr, close)
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """Wilder ATR"""
+    tr = _as_2d(true_range(high, low, close))
+    return _restore(_wilder(tr, period, 0), close)
+
+
+def volume_zscore(volume, window: int = 20) -> np.ndarray:
+    """현재 거래량이 최근 window봉(현재 포함) 평균에서 표준편차 몇 배만큼 떨어져 있는지"""
+    mean = sma(volume, window)
+    std = rolling_std(volume, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (np.asarray(volume, dtype=np.float64) - mean) / std
+    return np.where(std > 0, z, np.where(np.isnan(std), np.nan, 0.0))
+
+
+class StreamingIndicators:
+    """
+    N개 심볼의 지표 상태를 보관하고 새 봉마다 O(1)로 갱신한다.
+
+    상태: 마지막 종가, EMA, RSI 평균 상승/하락폭, ATR, 최근 종가/거래량 링버퍼와 창별 합계/제곱합.
+    과거 봉 전체로 상태를 만들고(from_history), 이후 update()는 창에 들어오고 나가는 값만 반영한다.
+    워밍업이 끝나기 전(ready가 False)에는 갱신하지 않고 from_history로 다시 만든다.
+    """
+
+    STATE_ARRAYS = (
+        "last_close", "ema", "avg_gain", "avg_loss", "atr",
+        "close_buf", "volume_buf", "close_sums", "bb_sumsq", "volume_sum", "volume_sumsq",
+    )
+
+    def __init__(
+        self,
+        n_symbols: int,
+        rsi_period: int = 14,
+        sma_windows: Sequence[int] = (20, 60),
+        ema_spans: Sequence[int] = (12, 26),
+        bb_window: int = 20,
+        bb_k: float = 2.0,
+        atr_period: int = 14,
+        volume_window: int = 20,
+    ):
+        self.n_symbols = n_symbols
+        self.rsi_period = rsi_period
+        self.sma_windows = tuple(int(w) for w in sma_windows)
+        self.ema_spans = tuple(int(s) for s in ema_spans)
+        self.bb_window = bb_window
+        self.bb_k = bb_k
+        self.atr_period = atr_period
+        self.volume_window = volume_window
+        self.buf_size = max(self.sma_windows + (bb_window,))
+
+        self.last_close = np.full(n_symbols, np.nan)
+        self.ema = np.full((len(self.ema_spans), n_symbols), np.nan)
+        self.avg_gain = np.full(n_symbols, np.nan)
+        self.avg_loss = np.full(n_symbols, np.nan)
+        self.atr = np.full(n_symbols, np.nan)
+        self.close_buf = np.full((n_symbols, self.buf_size), np.nan)
+        self.volume_buf = np.full((n_symbols, volume_window), np.nan)
+        self.close_sums = np.full((len(self.sma_windows), n_symbols), np.nan)
+        self.bb_sumsq = np.full(n_symbols, np.nan)
+        self.volume_sum = np.full(n_symbols, np.nan)
+        self.volume_sumsq = np.full(n_symbols, np.nan)
+        self.count = 0  # 지금까지 반영한 봉 수 (링버퍼 위치 = count % 버퍼 크기)
+        self.last_date = ""
+
+    @property
+    def warmup_bars(self) -> int:
+        return max(self.buf_size, self.rsi_period + 1, self.atr_period, self.volume_window)
+
+    @property
+    def ready(self) -> bool:
+        """모든 지표의 워밍업이 끝나 update()로 이어 갈 수 있는지"""
+        return self.count >= self.warmup_bars
+
+    def _recent(self, buf: np.ndarray, window: int) -> np.ndarray:
+        """링버퍼에서 최근 window개 값 (오래된 순)"""
+        idx = [(self.count - window + i) % buf.shape[1] for i in range(window)]
+        return buf[:, idx]
+
+    @classmethod
+    def from_history(cls, high, low, close, volume, **kwargs) -> "StreamingIndicators":
+        """과거 봉 전체로 상태를 만든다 (배치 함수 결과의 마지막 값에서 이어진다)."""
+        h, l, c, v = (_as_2d(a) for a in (high, low, close, volume))
+        engine = cls(c.shape[0], **kwargs)
+        T = c.shape[-1]
+        if T == 0:
+            return engine
+
+        engine.last_close = c[:, -1].copy()
+        engine.ema = np.stack([_recursive(c, 2.0 / (s + 1), c[:, 0], 0)[:, -1] for s in engine.ema_spans])
+        gain, loss = _gains_losses(c)
+        engine.avg_gain = _wilder(gain, engine.rsi_period, 1)[:, -1]
+        engine.avg_loss = _wilder(loss, engine.rsi_period, 1)[:, -1]
+        engine.atr = _wilder(_as_2d(true_range(h, l, c)), engine.atr_period, 0)[:, -1]
+
+        for t in range(max(0, T - engine.buf_size), T):
+            engine.close_buf[:, t % engine.buf_size] = c[:, t]
+        for t in range(max(0, T - engine.volume_window), T):
+            engine.volume_buf[:, t % engine.volume_window] = v[:, t]
+        engine.count = T
+        engine._resync()
+        return engine
+
+    def _resync(self):
+        """합계/제곱합을 링버퍼에서 다시 계산한다 (로드할 때마다 호출해 부동소수점 오차가 쌓이지 않게 한다)."""
+        for i, w in enumerate(self.sma_windows):
+            self.close_sums[i] = self._recent(self.close_buf, w).sum(axis=1) if self.count >= w else np.nan
+        if self.count >= self.bb_window:
+            self.bb_sumsq = (self._recent(self.close_buf, self.bb_window) ** 2).sum(axis=1)
+        if self.count >= self.volume_window:
+            vols = self._recent(self.volume_buf, self.volume_window)
+            self.volume_sum = vols.sum(axis=1)
+            self.volume_sumsq = (vols ** 2).sum(axis=1)
+
+    def save(self, path: Path):
+        """상태를 NPZ로 저장 (임시 파일 후 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # np.savez는 확장자를 붙이므로 임시 파일 이름도 .npz로 끝나게 한다.
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            count=np.int64(self.count),
+            last_date=np.array(self.last_date),
+            params=np.array([self.rsi_period, self.bb_window, self.bb_k, self.atr_period, self.volume_window]),
+            sma_windows=np.array(self.sma_windows, dtype=np.int64),
+            ema_spans=np.array(self.ema_spans, dtype=np.int64),
+            **{name: getattr(self, name) for name in self.STATE_ARRAYS},
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["StreamingIndicators"]:
+        """저장된 상태 로드 (없거나 읽을 수 없으면 None)"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                rsi_period, bb_window, bb_k, atr_period, volume_window = data["params"]
+                engine = cls(
+                    data["last_close"].shape[0],
+                    rsi_period=int(rsi_period),
+                    sma_windows=data["sma_windows"].tolist(),
+                    ema_spans=data["ema_spans"].tolist(),
+                    bb_window=int(bb_window),
+                    bb_k=float(bb_k),
+                    atr_period=int(atr_period),
+                    volume_window=int(volume_window),
+                )
+                for name in cls.STATE_ARRAYS:
+                    setattr(engine, name, data[name].copy())
+                engine.count = int(data["count"])
+                engine.last_date = str(data["last_date"])
+        except Exception as e:
+            print(f"[WARN] 지표 상태 로드 실패 ({path}): {e}")
+            return None
+        engine._resync()
+        return engine
+
+    def _step(self, high, low, close, volume, commit: bool) -> Dict[str, np.ndarray]:
+        if not self.ready:
+            raise ValueError(f"워밍업 전 상태입니다 ({self.count}/{self.warmup_bars}봉). from_history로 다시 만드세요.")
+        h, l, c, v = (np.asarray(a, dtype=np.float64).reshape(self.n_symbols) for a in (high, low, close, volume))
+        prev = self.last_close
+
+        new_ema = np.stack([e + (2.0 / (s + 1)) * (c - e) for s, e in zip(self.ema_spans, self.ema)])
+
+        delta = c - prev
+        avg_gain = self.avg_gain + (np.where(delta > 0, delta, 0.0) - self.avg_gain) / self.rsi_period
+        avg_loss = self.avg_loss + (np.where(delta < 0, -delta, 0.0) - self.avg_loss) / self.rsi_period
+
+        tr = np.fmax(h - l, np.fmax(np.abs(h - prev), np.abs(l - prev)))
+        new_atr = self.atr + (tr - self.atr) / self.atr_period
+
+        # 창에서 나가는 값은 count - window 번째 봉 (링버퍼에 아직 남아 있다)
+        close_sums = np.stack([
+            s + c - self.close_buf[:, (self.count - w) % self.buf_size]
+            for s, w in zip(self.close_sums, self.sma_windows)
+        ])
+        if self.bb_window in self.sma_windows:
+            bb_sum = close_sums[self.sma_windows.index(self.bb_window)]
+        else:
+            bb_sum = self._recent(self.close_buf, self.bb_window - 1).sum(axis=1) + c
+        leaving = self.close_buf[:, (self.count - self.bb_window) % self.buf_size]
+        bb_sumsq = self.bb_sumsq + c ** 2 - leaving ** 2
+        leaving_volume = self.volume_buf[:, self.count % self.volume_window]
+        volume_sum = self.volume_sum + v - leaving_volume
+        volume_sumsq = self.volume_sumsq + v ** 2 - leaving_volume ** 2
+
+        bb_mid = bb_sum / self.bb_window
+        bb_std = np.sqrt(np.maximum(bb_sumsq / self.bb_window - bb_mid ** 2, 0.0))
+        volume_mean = volume_sum / self.volume_window
+        volume_std = np.sqrt(np.maximum(volume_sumsq / self.volume_window - volume_mean ** 2, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            volume_z = np.where(volume_std > 0, (v - volume_mean) / volume_std, 0.0)
+
+        result = {
+            "close": c,
+            "rsi": _rsi_from_averages(avg_gain, avg_loss),
+            "atr": new_atr,
+            "bb_mid": bb_mid,
+            "bb_upper": bb_mid + self.bb_k * bb_std,
+            "bb_lower": bb_mid - self.bb_k * bb_std,
+            "volume": v,
+            "volume_mean": volume_mean,
+            "volume_z": volume_z,
+        }
+        for i, w in enumerate(self.sma_windows):
+            result[f"sma{w}"] = close_sums[i] / w
+        for i, s in enumerate(self.ema_spans):
+            result[f"ema{s}"] = new_ema[i]
+
+        if commit:
+            self.last_close = c
+            self.ema = new_ema
+            self.avg_gain, self.avg_loss, self.atr = avg_gain, avg_loss, new_atr
+            self.close_sums, self.bb_sumsq = close_sums, bb_sumsq
+            self.volume_sum, self.volume_sumsq = volume_sum, volume_sumsq
+            self.close_buf[:, self.count % self.buf_size] = c
+            self.volume_buf[:, self.count % self.volume_window] = v
+            self.count += 1
+        return result
+
+    def update(self, high, low, close, volume) -> Dict[str, np.ndarray]:
+        """완성된 새 봉을 반영하고 그 봉 기준 지표를 반환 (각 값은 (N,) 배열)"""
+        return self._step(high, low, close, volume, commit=True)
+
+    def peek(self, high, low, close, volume) -> Dict[str, np.ndarray]:
+        """상태를 바꾸지 않고 이 봉을 반영했을 때의 지표 (장중 미완성 봉용)"""
+        return self._step(high, low, close, volume, commit=False)
+
+
+def _state_path(symbol: str, state_dir: Optional[Path]) -> Path:
+    state_dir = Path(state_dir) if state_dir else DEFAULT_STATE_DIR
+    return state_dir / (re.sub(r"[^A-Za-z0-9._-]", "_", symbol) + ".npz")
+
+
+def _batch_latest(bars: Dict[str, np.ndarray], params: StreamingIndicators) -> Dict[str, float]:
+    """과거 봉 전체를 배치 함수로 계산한 마지막 봉 지표 (창이 안 찬 지표는 NaN)"""
+    high, low, close, volume = (bars[name] for name in BAR_FIELDS)
+    bands = bollinger(close, params.bb_window, params.bb_k)
+    result = {
+        "close": close[-1],
+        "rsi": rsi(close, params.rsi_period)[-1],
+        "atr": atr(high, low, close, params.atr_period)[-1],
+        "bb_mid": bands["mid"][-1],
+        "bb_upper": bands["upper"][-1],
+        "bb_lower": bands["lower"][-1],
+        "volume": volume[-1],
+        "volume_mean": sma(volume, params.volume_window)[-1],
+        "volume_z": volume_zscore(volume, params.volume_window)[-1],
+    }
+    for w in params.sma_windows:
+        result[f"sma{w}"] = sma(close, w)[-1]
+    for span in params.ema_spans:
+        result[f"ema{span}"] = ema(close, span)[-1]
+    return result
+
+
+def latest_indicators(symbol: str, frame, state_dir: Optional[Path] = None) -> Optional[Dict[str, Optional[float]]]:
+    """
+    OHLCV DataFrame의 마지막 봉 기준 지표 (저장된 상태가 있으면 새 봉만 반영)
+
+    마지막 봉은 장중 값일 수 있으므로 상태는 그 전 봉까지로 유지하고, 마지막 봉은 peek으로 계산한다.
+    상태가 정확히 한 봉 뒤처져 있으면 update 한 번으로 따라잡고,
+    그 외(첫 실행, 며칠 공백, 분할 등으로 과거 종가가 바뀐 경우)는 과거 봉 전체로 다시 만든다.
+    완성된 봉이 워밍업 길이보다 적으면(상장 직후, 새로 추가한 종목 등) 상태를 저장하지 않고
+    배치 함수로 계산해서, 창이 찬 지표만 값을 채운다.
+
+    Returns:
+        Dict[str, Optional[float]]: close, rsi, atr, bb_*, volume, volume_mean, volume_z, sma20/60, ema12/26
+        (봉이 부족해 계산할 수 없는 지표는 None). 봉이 없으면 None
+    """
+    if frame is None or len(frame) == 0:
+        return None
+    dates = [d.strftime("%Y-%m-%d") for d in frame.index]
+    bars = {name: frame[name].to_numpy(dtype=np.float64) for name in BAR_FIELDS}
+    completed = len(frame) - 1
+    path = _state_path(symbol, state_dir)
+
+    engine = StreamingIndicators.load(path)
+    if engine is not None and engine.ready and engine.last_date in dates[:completed]:
+        last = dates.index(engine.last_date)
+        if not np.isclose(engine.last_close[0], bars["Close"][last]):
+            engine = None
+        elif last == completed - 2:
+            engine.update(*(bars[name][completed - 1] for name in BAR_FIELDS))
+            engine.last_date = dates[completed - 1]
+        elif last != completed - 1:
+            engine = None
+    else:
+        engine = None
+
+    if engine is None:
+        engine = StreamingIndicators.from_history(*(bars[name][:completed] for name in BAR_FIELDS))
+        engine.last_date = dates[completed - 1] if completed else ""
+        if not engine.ready:
+            result = _batch_latest(bars, engine)
+            return {key: None if np.isnan(value) else float(value) for key, value in result.items()}
+
+    try:
+        engine.save(path)
+    except OSError as e:
+        print(f"[WARN] 지표 상태 저장 실패 ({path}): {e}")
+
+    result = engine.peek(*(bars[name][-1] for name in BAR_FIELDS))
+    return {key: None if np.isnan(value[0]) else float(value[0]) for key, value in result.items()}
@@ -0,0 +1,213 @@
+"""
+로컬 OHLCV 저장소 (증분 갱신)
+심볼별 일봉을 automation/cache/ohlcv/<심볼>.npz(압축 컬럼 배열)로 보관하고, 마지막 저장일 이후 봉만 새로 받는다.
+
+- 최근 OHLCV_REFRESH_MINUTES 안에 갱신한 심볼은 요청 없이 로컬 데이터만 사용한다.
+- 증분 요청은 마지막 OVERLAP_BARS개 봉과 겹치게 받아, 겹친 구간 종가가 다르면(액면분할/배당 수정) 전체 기간을 다시 받는다.
+- 마지막 봉은 장중 값일 수 있으므로 비교에서 빼고 새 값으로 덮어쓴다.
+- 저장된 기간이 요청 기간(period_days)의 앞부분을 덮지 못하면(이전의 짧은 기간으로 만든 저장소, 짧게 받은 첫 수집)
+  전체 기간을 다시 받는다. 상장일이 더 늦어서 짧은 경우는 전체 수집 시 요청한 시작일(covered_from)을 함께 저장해 구분한다.
+- 여러 심볼의 증분/전체 요청은 각각 한 번의 일괄 요청으로 묶는다 (최대 두 번).
+"""
+
+import os
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_OHLCV_DIR = Path(os.getenv("OHLCV_CACHE_DIR", str(PROJECT_ROOT / "automation" / "cache" / "ohlcv")))
+REFRESH_MINUTES = float(os.getenv("OHLCV_REFRESH_MINUTES", "60"))
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+OVERLAP_BARS = 3
+# 겹친 구간 종가 비교 허용 오차 (상대값)
+PRICE_TOLERANCE = 1e-4
+# 심볼당 보관할 최대 봉 수
+MAX_BARS = 1000
+# 기간 시작일과 저장된 첫 봉 사이 허용 간격 (주말/연휴로 첫 거래일이 며칠 늦을 수 있다)
+COVERAGE_TOLERANCE_DAYS = 5
+
+
+def _symbol_filename(symbol: str) -> str:
+    """^TNX 같은 심볼도 파일 이름으로 쓸 수 있게 바꾼다."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", symbol) + ".npz"
+
+
+def _naive_index(frame: "pd.DataFrame") -> "pd.DataFrame":
+    """시간대가 붙은 인덱스를 날짜 기준 naive 인덱스로 맞춘다."""
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    frame = frame.copy()
+    frame.index = index.normalize()
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+class OhlcvStore:
+    """심볼별 일봉 로컬 저장소"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, refresh_minutes: float = REFRESH_MINUTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_OHLCV_DIR
+        self.refresh_seconds = refresh_minutes * 60
+
+    def path(self, symbol: str) -> Path:
+        return self.cache_dir / _symbol_filename(symbol)
+
+    def load(self, symbol: str) -> Optional[Dict]:
+        """저장된 봉과 갱신 시각 ({"frame": DataFrame, "fetched_at": epoch, "covered_from": Timestamp|None}), 없으면 None"""
+        path = self.path(symbol)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                frame = pd.DataFrame(
+                    {col: data[col] for col in OHLCV_COLUMNS},
+                    index=pd.DatetimeIndex(data["dates"].astype("datetime64[ns]")),
+                )
+                # covered_from이 없는 이전 형식은 첫 봉부터 받은 것으로 본다
+                covered_from = None
+                if "covered_from" in data.files and int(data["covered_from"]):
+                    covered_from = pd.Timestamp(int(data["covered_from"]))
+                return {"frame": frame, "fetched_at": float(data["fetched_at"]), "covered_from": covered_from}
+        except Exception as e:
+            print(f"[WARN] OHLCV 캐시 로드 실패 ({path}): {e}")
+            return None
+
+    def save(self, symbol: str, frame: "pd.DataFrame", covered_from: Optional["pd.Timestamp"] = None):
+        """
+        봉 저장 (임시 파일 후 교체)
+
+        covered_from: 이 날짜부터는 빠진 봉 없이 받았다는 표시 (전체 수집 시 요청 시작일).
+            저장된 첫 봉이 이보다 늦으면 그 전에는 거래 데이터가 없는 것으로 본다.
+        """
+        if len(frame) > MAX_BARS:
+            frame = frame.tail(MAX_BARS)
+            covered_from = None
+        if covered_from is None and len(frame):
+            covered_from = frame.index[0]
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(symbol)
+        # np.savez는 확장자를 붙이므로 임시 파일 이름도 .npz로 끝나게 한다.
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            dates=frame.index.values.astype("datetime64[ns]").astype(np.int64),
+            fetched_at=np.float64(time.time()),
+            covered_from=np.int64(pd.Timestamp(covered_from).value if covered_from is not None else 0),
+            **{col: frame[col].to_numpy(dtype=np.float64) for col in OHLCV_COLUMNS},
+        )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _covers(stored: Dict, cutoff: "pd.Timestamp") -> bool:
+        """저장된 봉이 cutoff부터의 기간을 덮는지 (앞부분이 비어 있으면 증분 갱신으로는 채울 수 없다)"""
+        first = stored["frame"].index[0]
+        if stored.get("covered_from") is not None:
+            first = min(first, stored["covered_from"])
+        return first <= cutoff + pd.Timedelta(days=COVERAGE_TOLERANCE_DAYS)
+
+    @staticmethod
+    def _overlap_agrees(stored: "pd.DataFrame", fresh: "pd.DataFrame") -> bool:
+        """겹친 구간(저장된 마지막 봉 제외)의 종가가 같은지"""
+        common = stored.index[:-1].intersection(fresh.index)
+        if len(common) == 0:
+            # 겹치는 봉이 없으면 이어 붙일 근거가 없다 (휴장 등으로 overlap이 비면 전체 재수집)
+            return False
+        old = stored.loc[common, "Close"].to_numpy(dtype=np.float64)
+        new = fresh.loc[common, "Close"].to_numpy(dtype=np.float64)
+        return bool(np.allclose(old, new, rtol=PRICE_TOLERANCE, atol=0))
+
+    def get_frames(
+        self,
+        symbols: List[str],
+        period_days: int,
+        download: Callable[..., Dict[str, "pd.DataFrame"]],
+    ) -> Dict[str, "pd.DataFrame"]:
+        """
+        심볼별 최근 period_days일 일봉 (가능하면 로컬 데이터만 사용)
+
+        Args:
+            symbols: 심볼 목록
+            period_days: 돌려줄 기간(일)
+            download: download(symbols, period_days, start=None) -> {심볼: DataFrame}
+        """
+        now = time.time()
+        cutoff = pd.Timestamp(datetime.now(timezone.utc).date() - timedelta(days=period_days))
+        frames: Dict[str, pd.DataFrame] = {}
+        incremental: Dict[str, Dict] = {}
+        full: List[str] = []
+
+        for symbol in symbols:
+            stored = self.load(symbol)
+            if stored is None or len(stored["frame"]) <= OVERLAP_BARS:
+                full.append(symbol)
+            elif not self._covers(stored, cutoff):
+                print(f"[INFO] {symbol}: 저장된 기간이 {period_days}일보다 짧아 전체 기간을 다시 받습니다")
+                full.append(symbol)
+            elif now - stored["fetched_at"] < self.refresh_seconds:
+                frames[symbol] = stored["frame"]
+            else:
+                incremental[symbol] = stored
+
+        if incremental:
+            start = min(stored["frame"].index[-OVERLAP_BARS] for stored in incremental.values())
+            try:
+                fresh_frames = download(list(incremental), period_days, start=start.strftime("%Y-%m-%d"))
+            except Exception as e:
+                print(f"[WARN] OHLCV 증분 수집 실패, 저장된 데이터를 사용합니다: {e}")
+                fresh_frames = {}
+            for symbol, entry in incremental.items():
+                stored = entry["frame"]
+                fresh = fresh_frames.get(symbol)
+                if fresh is None or fresh.empty:
+                    frames[symbol] = stored
+                    continue
+                fresh = _naive_index(fresh[OHLCV_COLUMNS])
+                if not self._overlap_agrees(stored, fresh):
+                    print(f"[INFO] {symbol}: 겹친 구간 가격이 달라 전체 기간을 다시 받습니다 (분할/수정 주가)")
+                    full.append(symbol)
+                    continue
+                merged = pd.concat([stored[stored.index < fresh.index[0]], fresh])
+                self.save(symbol, merged, covered_from=entry["covered_from"])
+                frames[symbol] = merged
+
+        if full:
+            fetch_days = max(period_days, int(self._stored_span_days(full)))
+            try:
+                fetched = download(full, fetch_days)
+            except Exception as e:
+                print(f"[WARN] OHLCV 전체 수집 실패: {e}")
+                fetched = {}
+            for symbol in full:
+                fresh = fetched.get(symbol)
+                if fresh is None or fresh.empty:
+                    stored = self.load(symbol)
+                    if stored is not None:
+                        frames[symbol] = stored["frame"]
+                    continue
+                fresh = _naive_index(fresh[OHLCV_COLUMNS])
+                covered_from = pd.Timestamp(datetime.now(timezone.utc).date() - timedelta(days=fetch_days))
+                self.save(symbol, fresh, covered_from=covered_from)
+                frames[symbol] = fresh
+
+        return {symbol: frame[frame.index >= cutoff] for symbol, frame in frames.items()}
+
+    def _stored_span_days(self, symbols: List[str]) -> float:
+        """전체 재수집 시 기존에 보관하던 기간만큼은 다시 채운다."""
+        span = 0.0
+        for symbol in symbols:
+            stored = self.load(symbol)
+            if stored is not None and len(stored["frame"]):
+                span = max(span, (datetime.now() - stored["frame"].index[0].to_pydatetime()).days + 1)
+        return span
@@ -0,0 +1,119 @@
+"""
+단계별 체크포인트
+여러 단계로 이루어진 스크립트(sofi_auto_post 등)의 단계 결과를 실행 단위 디렉터리에 JSON으로 저장한다.
+마지막 단계(LLM 호출)가 실패해 다시 실행하면, 완료된 단계는 건너뛰고 처음으로 완료되지 않은 단계부터 이어서 실행한다.
+
+- 실행 디렉터리: automation/cache/checkpoints/<스크립트 이름(name)>/<실행 키(run_key)>/ (입력이 바뀌면 실행 키도 바뀌어 새 실행으로 본다)
+  sofi_auto_post는 종목별로 run_key = <티커>-<날짜>-<입력 해시>를 쓴다
+  (예: automation/cache/checkpoints/sofi_auto_post/SOFI-2026-01-09-3fa2c1d0e9b7/). 디렉터리를 지우면 처음부터 다시 실행한다.
+- 단계 파일: <단계 이름>.json ({"saved_at": epoch, "value": ...}), 임시 파일에 쓰고 교체한다.
+- CHECKPOINT_TTL_HOURS가 지난 단계와 실행 디렉터리는 무효로 보고 정리한다.
+- 앞 단계를 새로 계산하면 그 뒤 단계는 저장본이 있어도 다시 계산한다 (앞 단계 결과에 의존하므로).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_CHECKPOINT_DIR = Path(
+    os.getenv("CHECKPOINT_DIR", str(PROJECT_ROOT / "automation" / "cache" / "checkpoints"))
+)
+DEFAULT_TTL_HOURS = float(os.getenv("CHECKPOINT_TTL_HOURS", "6"))
+
+_MISSING = object()
+
+
+def input_hash(*parts: Any) -> str:
+    """실행 입력(피드 아이템 id 목록, 설정 등)의 짧은 해시"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class StageCheckpoint:
+    """한 번의 실행(name 아래 run_key 디렉터리)에 대한 단계별 결과 저장소"""
+
+    def __init__(
+        self,
+        name: str,
+        run_key: str,
+        base_dir: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+    ):
+        self.base_dir = (Path(base_dir) if base_dir else DEFAULT_CHECKPOINT_DIR) / name
+        self.run_dir = self.base_dir / run_key
+        self.ttl = ttl_hours * 3600
+        self.resumed = []
+        self._fresh = False
+        self._prune()
+
+    def _prune(self):
+        """TTL이 지난 다른 실행 디렉터리 정리"""
+        if not self.base_dir.exists():
+            return
+        cutoff = time.time() - self.ttl
+        for run_dir in self.base_dir.iterdir():
+            try:
+                if run_dir.is_dir() and run_dir != self.run_dir and run_dir.stat().st_mtime < cutoff:
+                    shutil.rmtree(run_dir, ignore_errors=True)
+            except OSError:
+                continue
+
+    def _path(self, stage: str) -> Path:
+        return self.run_dir / f"{stage}.json"
+
+    def load(self, stage: str) -> Any:
+        """저장된 단계 결과 (없거나 TTL이 지났거나 앞 단계가 새로 계산됐으면 _MISSING)"""
+        if self._fresh:
+            return _MISSING
+        path = self._path(stage)
+        if not path.exists():
+            return _MISSING
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[WARN] 체크포인트 로드 실패 ({path}): {e}")
+            return _MISSING
+        if time.time() - float(data.get("saved_at", 0)) > self.ttl:
+            return _MISSING
+        return data.get("value")
+
+    def save(self, stage: str, value: Any):
+        try:
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(stage)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(
+                json.dumps({"saved_at": time.time(), "value": value}, ensure_ascii=False, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] 체크포인트 저장 실패 ({stage}): {e}")
+
+    def run(self, stage: str, func: Callable[[], Any]) -> Any:
+        """
+        단계 실행 (저장된 결과가 유효하면 그대로 사용)
+
+        Args:
+            stage: 단계 이름 (파일 이름으로 사용)
+            func: 결과를 계산하는 함수 (JSON으로 저장할 수 있는 값을 반환)
+        """
+        value = self.load(stage)
+        if value is not _MISSING:
+            print(f"[INFO] 체크포인트에서 재개: {stage}")
+            self.resumed.append(stage)
+            return value
+        # 이 단계부터는 새로 계산한다 (뒤 단계 저장본은 이 결과를 반영하지 않았을 수 있다)
+        self._fresh = True
+        value = func()
+        self.save(stage, value)
+        return value
+
+    def clear(self):
+        """실행이 끝까지 성공하면 실행 디렉터리를 지운다."""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
@@ -0,0 +1,112 @@
+"""
+단계 의존성 그래프 실행기
+스크립트의 단계를 (이름, 함수, 의존 단계)로 등록하면, 의존 단계가 끝난 단계부터 스레드 풀에서 동시에 실행한다.
+서로 의존하지 않는 I/O/LLM 호출이 겹쳐서 돌고, 끝나면 단계별 시작 시각/소요 시간을 출력한다.
+
+- 단계 함수는 의존 단계 결과를 같은 이름의 키워드 인자로 받는다. (예: deps=["topic"] -> func(topic=...))
+- 한 단계가 실패하면 아직 시작하지 않은 단계는 실행하지 않고, 실행 중인 단계가 끝나기를 기다린 뒤 첫 오류를 다시 던진다.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class StageGraph:
+    """의존성 그래프로 표현한 단계 묶음"""
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.name = name
+        self.max_workers = max_workers
+        self.stages: Dict[str, Dict] = {}
+        self.results: Dict[str, Any] = {}
+        # 단계 이름 -> {"start": 실행 시작 기준 초, "elapsed": 소요 초, "status": "ok"|"error"}
+        self.timings: Dict[str, Dict] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, name: str, func: Callable[..., Any], deps: Optional[List[str]] = None):
+        """단계 등록 (의존 단계는 먼저 등록돼 있어야 한다)"""
+        deps = list(deps or [])
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            raise ValueError(f"등록되지 않은 의존 단계: {name} -> {', '.join(missing)}")
+        if name in self.stages:
+            raise ValueError(f"이미 등록된 단계: {name}")
+        self.stages[name] = {"func": func, "deps": deps}
+
+    def _execute(self, name: str) -> Any:
+        stage = self.stages[name]
+        kwargs = {dep: self.results[dep] for dep in stage["deps"]}
+        started = time.monotonic()
+        status = "error"
+        try:
+            value = stage["func"](**kwargs)
+            status = "ok"
+            return value
+        finally:
+            with self._lock:
+                self.timings[name] = {
+                    "start": started - self._started_at,
+                    "elapsed": time.monotonic() - started,
+                    "status": status,
+                }
+
+    def run(self) -> Dict[str, Any]:
+        """
+        모든 단계를 실행한다.
+
+        Returns:
+            Dict[str, Any]: 단계 이름 -> 결과
+
+        Raises:
+            단계에서 처음 발생한 예외
+        """
+        self._started_at = time.monotonic()
+        pending = dict(self.stages)
+        running = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [n for n, s in pending.items() if all(d in self.results for d in s["deps"])]
+                    for name in ready:
+                        del pending[name]
+                        running[executor.submit(self._execute, name)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+
+        self._finished_at = time.monotonic()
+        if error is not None:
+            raise error
+        return self.results
+
+    def print_timings(self):
+        """단계별 시작 시각/소요 시간 (시작 순서). 실행하지 못한 단계는 '-'로 표시한다."""
+        if self._started_at is None:
+            return
+        wall = (self._finished_at or time.monotonic()) - self._started_at
+        busy = sum(t["elapsed"] for t in self.timings.values())
+        print(f"[INFO] {self.name} 단계별 소요 시간 (전체 {wall:.1f}초, 단계 합계 {busy:.1f}초):")
+        width = max(len(n) for n in self.stages) if self.stages else 0
+        order = sorted(self.stages, key=lambda n: self.timings.get(n, {}).get("start", float("inf")))
+        for name in order:
+            timing = self.timings.get(name)
+            if timing is None:
+                print(f"  {name:<{width}}        -  (실행 안 됨)")
+                continue
+            mark = "" if timing["status"] == "ok" else "  (실패)"
+            print(f"  {name:<{width}}  {timing['elapsed']:6.1f}초  (+{timing['start']:.1f}초 시작){mark}")
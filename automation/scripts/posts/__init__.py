@@ -0,0 +1,2 @@
+# Posts package
+
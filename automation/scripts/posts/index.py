@@ -0,0 +1,167 @@
+"""
+종목 분석 글 요약 인덱스
+_posts/stock의 분석 글마다 TextRank 추출 요약(결론 섹션 중심)을 만들어 티커/날짜별로 디스크에 보관한다.
+글 생성기는 최근 N일의 결론을 포스트 파일을 다시 읽지 않고 날짜 키 조회로 가져온다.
+
+- 구조: {"posts": {티커: {날짜: {"summary": str, "mtime": float, "path": str}}}}
+- refresh(): 파일 이름/수정 시각만 확인하고, 새 글이나 수정된 글만 다시 요약한다. 사라진 글은 인덱스에서 뺀다.
+- upsert(): 글을 쓰거나 업데이트한 직후 그 글만 다시 요약한다.
+- 인덱스는 포스트에서 언제든 다시 만들 수 있으므로 로드에 실패하면 빈 인덱스에서 시작한다.
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from posts.textrank import summarize
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_POSTS_DIR = PROJECT_ROOT / "_posts" / "stock"
+DEFAULT_INDEX_PATH = Path(
+    os.getenv("POST_SUMMARY_INDEX_PATH", str(PROJECT_ROOT / "automation" / "cache" / "post_summaries.json"))
+)
+
+# 2026-03-09-SOFI-소식-분석.md -> (2026-03-09, SOFI)
+_POST_NAME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-([A-Z0-9.^]+)-.+\.md$")
+
+
+def parse_post_name(name: str) -> Optional[Tuple[str, str]]:
+    """포스트 파일 이름에서 (날짜, 티커)를 읽는다. 종목 글 형식이 아니면 None"""
+    match = _POST_NAME_RE.match(name)
+    return (match.group(1), match.group(2)) if match else None
+
+
+def _post_body(path: Path) -> str:
+    content = path.read_text(encoding="utf-8")
+    parts = content.split("---", 2)
+    if content.startswith("---") and len(parts) >= 3:
+        return parts[2].strip()
+    return content
+
+
+class PostSummaryIndex:
+    """티커 -> 날짜 -> 분석 글 추출 요약"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_INDEX_PATH
+        self.posts: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.posts = data.get("posts", {})
+        except Exception as e:
+            print(f"[WARN] 요약 인덱스 로드 실패 ({self.path}): {e}")
+            self.posts = {}
+
+    def save(self):
+        """변경 사항이 있을 때만 임시 파일에 쓰고 교체한다."""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                tmp_path.write_text(
+                    json.dumps({"posts": self.posts}, ensure_ascii=False, sort_keys=True),
+                    encoding="utf-8",
+                )
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"[WARN] 요약 인덱스 저장 실패 ({self.path}): {e}")
+
+    def upsert(self, path: Path, mtime: Optional[float] = None) -> Optional[str]:
+        """
+        글 하나를 (다시) 요약해 인덱스에 넣는다.
+
+        Returns:
+            str: 요약 (종목 글 이름 형식이 아니거나 읽기 실패 시 None)
+        """
+        path = Path(path)
+        key = parse_post_name(path.name)
+        if not key:
+            return None
+        date_str, ticker = key
+        try:
+            mtime = path.stat().st_mtime if mtime is None else mtime
+            summary = summarize(_post_body(path))
+        except Exception as e:
+            print(f"[WARN] 분석 글 요약 실패 ({path.name}): {e}")
+            return None
+        with self._lock:
+            self.posts.setdefault(ticker, {})[date_str] = {
+                "summary": summary,
+                "mtime": mtime,
+                "path": path.name,
+            }
+            self._dirty = True
+        return summary
+
+    def refresh(self, posts_dir: Optional[Path] = None) -> int:
+        """
+        포스트 디렉터리와 인덱스를 맞춘다 (파일 내용은 새 글/수정된 글만 읽는다).
+
+        Returns:
+            int: 다시 요약한 글 수
+        """
+        posts_dir = Path(posts_dir) if posts_dir else DEFAULT_POSTS_DIR
+        if not posts_dir.exists():
+            return 0
+
+        seen = set()
+        updated = 0
+        for path in posts_dir.glob("*.md"):
+            key = parse_post_name(path.name)
+            if not key:
+                continue
+            date_str, ticker = key
+            seen.add((ticker, date_str))
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            entry = self.posts.get(ticker, {}).get(date_str)
+            if entry and entry.get("mtime") == mtime and entry.get("path") == path.name:
+                continue
+            if self.upsert(path, mtime) is not None:
+                updated += 1
+
+        with self._lock:
+            for ticker in list(self.posts):
+                for date_str in list(self.posts[ticker]):
+                    if (ticker, date_str) not in seen:
+                        del self.posts[ticker][date_str]
+                        self._dirty = True
+                if not self.posts[ticker]:
+                    del self.posts[ticker]
+        return updated
+
+    def recent(self, ticker: str, before_date: str, days: int = 3) -> List[Dict]:
+        """
+        before_date 이전 days일 동안의 요약 (날짜 키 직접 조회, 최근 날짜가 먼저)
+
+        Returns:
+            List[Dict]: [{"date": "YYYY-MM-DD", "summary": str}, ...] (요약이 빈 글은 제외)
+        """
+        with self._lock:
+            by_date = self.posts.get(ticker.upper(), {})
+            if not by_date:
+                return []
+            target = datetime.strptime(before_date, "%Y-%m-%d")
+            results = []
+            for offset in range(1, days + 1):
+                date_str = (target - timedelta(days=offset)).strftime("%Y-%m-%d")
+                entry = by_date.get(date_str)
+                if entry and entry.get("summary"):
+                    results.append({"date": date_str, "summary": entry["summary"]})
+            return results
@@ -0,0 +1,132 @@
+"""
+TextRank 추출 요약
+분석 글 본문을 문장 단위로 나누고, 문장 간 어휘 겹침으로 그래프를 만들어 PageRank 점수가 높은 문장을 고른다.
+
+- 결론이 모이는 섹션(FOCUS_SECTIONS: 종합 의견, 투자 시나리오, 투자자 관점)이 있으면 그 섹션 문장만 요약 대상으로 쓴다.
+  없으면 References를 뺀 본문 전체를 쓴다.
+- 토큰: 영문/숫자는 단어 단위, 한글은 어절 안의 글자 2-gram (조사가 붙어도 같은 어근끼리 겹치도록)
+- 유사도: 겹치는 토큰 수 / (log|Si| + log|Sj|) (TextRank 원 논문의 문장 유사도)
+- 선택한 문장은 원래 순서대로 이어 붙인다.
+"""
+
+import math
+import re
+from typing import Dict, List, Set
+
+FOCUS_SECTIONS = ("종합 의견", "투자 시나리오", "투자자 관점")
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+MIN_SENTENCE_CHARS = 20
+
+_HEADER_RE = re.compile(r"^(#{2,6})\s*(.+?)\s*$", re.MULTILINE)
+_FOOTNOTE_RE = re.compile(r"\[\^[^\]]*\]")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+_MARKUP_RE = re.compile(r"[*_`>#]+")
+_BULLET_RE = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+", re.MULTILINE)
+# "~다." 평서문 끝, 일반 문장부호 뒤 공백/줄바꿈에서 나눈다.
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+|[가-힣]+")
+
+
+def focus_text(body: str) -> str:
+    """결론 섹션 본문 (없으면 References 앞까지의 본문 전체)"""
+    body = body.split("## References", 1)[0]
+    headers = list(_HEADER_RE.finditer(body))
+    parts = []
+    for idx, match in enumerate(headers):
+        if not any(name in match.group(2) for name in FOCUS_SECTIONS):
+            continue
+        level = len(match.group(1))
+        end = len(body)
+        # 같은 수준 이상의 다음 헤더까지 (하위 헤더는 포함)
+        for nxt in headers[idx + 1:]:
+            if len(nxt.group(1)) <= level:
+                end = nxt.start()
+                break
+        parts.append(body[match.end():end])
+    return "\n".join(parts) if parts else body
+
+
+def split_sentences(text: str) -> List[str]:
+    """마크다운 서식/각주/링크를 걷어내고 문장으로 나눈다."""
+    text = _FOOTNOTE_RE.sub("", text)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _BULLET_RE.sub("", text)
+    text = _HEADER_RE.sub("", text)
+    text = _MARKUP_RE.sub("", text)
+    sentences = []
+    for raw in _SENTENCE_SPLIT_RE.split(text):
+        sentence = re.sub(r"\s+", " ", raw).strip()
+        if len(sentence) >= MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+    return sentences
+
+
+def sentence_tokens(sentence: str) -> Set[str]:
+    tokens = set()
+    for word in _WORD_RE.findall(sentence):
+        if word[0] >= "가":
+            if len(word) == 1:
+                continue
+            tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1:
+            tokens.add(word.lower())
+    return tokens
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    if len(a) < 2 or len(b) < 2:
+        return 0.0
+    overlap = len(a & b)
+    return overlap / (math.log(len(a)) + math.log(len(b))) if overlap else 0.0
+
+
+def textrank_scores(sentences: List[str]) -> List[float]:
+    """문장별 TextRank 점수 (가중치 그래프 PageRank)"""
+    n = len(sentences)
+    if n == 0:
+        return []
+    tokens = [sentence_tokens(s) for s in sentences]
+    weights: List[Dict[int, float]] = [{} for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            w = _similarity(tokens[i], tokens[j])
+            if w > 0:
+                weights[i][j] = w
+                weights[j][i] = w
+    out_sums = [sum(row.values()) for row in weights]
+
+    scores = [1.0 / n] * n
+    for _ in range(MAX_ITERATIONS):
+        new_scores = []
+        for i in range(n):
+            rank = sum(scores[j] * w / out_sums[j] for j, w in weights[i].items() if out_sums[j] > 0)
+            new_scores.append((1 - DAMPING) / n + DAMPING * rank)
+        delta = sum(abs(a - b) for a, b in zip(new_scores, scores))
+        scores = new_scores
+        if delta < TOLERANCE:
+            break
+    return scores
+
+
+def summarize(body: str, max_sentences: int = 4, max_chars: int = 600) -> str:
+    """
+    분석 글 본문의 추출 요약
+
+    Args:
+        body: Front Matter를 뺀 마크다운 본문
+        max_sentences: 고를 문장 수
+        max_chars: 요약 최대 길이 (넘으면 점수가 낮은 문장부터 뺀다)
+
+    Returns:
+        str: 원래 순서로 이어 붙인 핵심 문장 (문장이 없으면 빈 문자열)
+    """
+    sentences = split_sentences(focus_text(body))
+    if not sentences:
+        return ""
+    scores = textrank_scores(sentences)
+    ranked = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)[:max_sentences]
+    while len(ranked) > 1 and sum(len(sentences[i]) + 1 for i in ranked) > max_chars:
+        ranked.pop()
+    return " ".join(sentences[i] for i in sorted(ranked))[:max_chars]
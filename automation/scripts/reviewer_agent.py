@@ -14,7 +14,7 @@ ReviewerAgent
 import os
 import re
 from typing import Optional
-from google import genai
+from llm.client import generate
 
 
 class ReviewerAgent:
@@ -22,9 +22,7 @@ class ReviewerAgent:
         key = api_key or os.getenv("GEMINI_API_KEY")
         if not key:
             raise RuntimeError("GEMINI_API_KEY 가 설정되지 않았습니다.")
-        self.client = genai.Client(api_key=key)
-        # 안정적 모델 우선
-        self.model = "models/gemini-2.0-flash"
+        self.api_key = key
 
     def review(self, draft_content: str, category: str = "document") -> str:
         if not draft_content:
@@ -64,11 +62,7 @@ class ReviewerAgent:
 """
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt
-            )
-            text = (response.text or "").strip()
+            text = generate(prompt, task="review", api_key=self.api_key)
             text = self._post_process(text)
             return text if text else draft_content
         except Exception:
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-SoFi 자동 포스팅 Agent (고도화 버전)
+종목 분석 자동 포스팅 Agent (고도화 버전)
 거시경제 데이터, 기술적 지표, 이전 분석 맥락을 통합하여 전문가 수준의 분석 글을 생성한다.
+_data/stock_watchlist.yml에서 post 설정이 있는 종목마다 글을 만들고(기본: SOFI),
+여러 종목은 제한된 작업자 풀에서 동시에 처리한다 (시장 데이터 일괄 요청, 기사 캐시, 호스트별 요청 제한 공유).
 """
 
 import os
 import json
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -25,45 +29,90 @@ except ImportError:
 
 try:
     import requests
-    from bs4 import BeautifulSoup
 except ImportError:
-    print("[ERROR] requests 또는 beautifulsoup4 패키지가 설치되지 않았습니다.")
-    print("pip install requests beautifulsoup4 를 실행하세요.")
+    print("[ERROR] requests 패키지가 설치되지 않았습니다.")
+    print("pip install requests 를 실행하세요.")
     exit(1)
 
-try:
-    from google import genai
-except ImportError:
-    print("[ERROR] google-genai 패키지가 설치되지 않았습니다.")
-    print("pip install google-genai 를 실행하세요.")
-    exit(1)
 
-try:
-    import yfinance as yf
-    import pandas as pd
-    import numpy as np
-    YFINANCE_AVAILABLE = True
-except ImportError:
-    print("[WARN] yfinance, pandas, numpy가 설치되지 않았습니다. 기술적 지표 수집이 제한됩니다.")
+from articles.cache import ArticleCache
+from articles.extract import extract_article_text
+from articles.fetcher import HostThrottle, extract_all
+from market.data import YFINANCE_AVAILABLE, fetch_market_frames, load_market_config, ticker_market_config
+from market.indicators import latest_indicators
+from market.store import OhlcvStore
+from feeds.archive import FeedArchive
+from feeds.dedup import cluster_items
+from feeds.index import FeedIndex
+from feeds.watchlist import load_watchlist, short_name
+from llm.client import GENAI_AVAILABLE, LLMError, generate
+from pipeline.checkpoint import StageCheckpoint, input_hash
+from posts.index import PostSummaryIndex
+
+if not YFINANCE_AVAILABLE:
+    print("[WARN] yfinance, pandas가 설치되지 않았습니다. 기술적 지표 수집이 제한됩니다.")
     print("pip install yfinance pandas numpy 를 실행하세요.")
-    YFINANCE_AVAILABLE = False
 
 # 환경 설정
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 STOCK_FEED_PATH = PROJECT_ROOT / "assets" / "data" / "stock_feed.json"
+# 시장 데이터 심볼 (_data/market_symbols.yml)
+MARKET_CONFIG = load_market_config()
+# 로컬 OHLCV 저장소 (automation/cache/ohlcv/). 새 봉만 받아 이어 붙인다.
+OHLCV_STORE = OhlcvStore()
+# 기사 본문 캐시 (정규화 URL 기준, TTL + LRU). 같은 날 재생성 시 새 링크만 내려받는다.
+ARTICLE_CACHE = ArticleCache()
+# 종목별 기사 추출이 동시에 돌아도 같은 호스트 요청 제한은 공유한다
+ARTICLE_THROTTLE = HostThrottle()
+# 일자별 피드 아카이브 (assets/data/feed/YYYY-MM-DD.jsonl)
+FEED_ARCHIVE = FeedArchive(PROJECT_ROOT / "assets" / "data" / "feed")
 # _posts 디렉터리 사용 (카테고리별 폴더 구조)
 POSTS_DIR = PROJECT_ROOT / "_posts"
 POSTS_DIR.mkdir(parents=True, exist_ok=True)
 # 하위 호환성을 위한 이전 경로 (확인용)
 POSTS_DIR_FALLBACK = PROJECT_ROOT / "_posts_stock"
+# 분석 글 추출 요약 인덱스 (automation/cache/post_summaries.json). 이전 분석 맥락을 파일을 다시 읽지 않고 가져온다.
+POST_SUMMARY_INDEX = PostSummaryIndex()
+# 프롬프트에 넣을 이전 분석 기간(일)
+PREVIOUS_SUMMARY_DAYS = int(os.getenv("PREVIOUS_SUMMARY_DAYS", "3"))
 
 # Gemini API 설정
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# 같은 날 업데이트 시 새 아이템만으로 업데이트 섹션을 추가 (0이면 항상 전체 재생성)
+DELTA_UPDATE_ENABLED = os.getenv("SOFI_DELTA_UPDATE", "1") == "1"
+# 동시에 글을 만들 종목 수
+POST_WORKERS = int(os.getenv("STOCK_POST_WORKERS", "4"))
+if not GENAI_AVAILABLE:
+    print("[ERROR] google-genai 패키지가 설치되지 않았습니다.")
+    print("pip install google-genai 를 실행하세요.")
+    exit(1)
 if not GEMINI_API_KEY:
     print("[ERROR] GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
     exit(1)
 
 
+def load_post_profiles() -> List[Dict]:
+    """
+    글을 만들 종목 목록 (_data/stock_watchlist.yml에서 post가 있는 항목, 없으면 첫 번째 종목)
+
+    Returns:
+        List[Dict]: [{"ticker", "name", "sector", "focus", "market_config"}, ...]
+    """
+    watchlist = load_watchlist()
+    entries = [entry for entry in watchlist if entry.get("post")] or watchlist[:1]
+    profiles = []
+    for entry in entries:
+        post = entry["post"] if isinstance(entry.get("post"), dict) else {}
+        profiles.append({
+            "ticker": entry["ticker"],
+            "name": short_name(entry),
+            "sector": post.get("sector") or "성장주",
+            "focus": post.get("focus") or "핵심 비즈니스 모델과 경쟁 우위",
+            "market_config": ticker_market_config(MARKET_CONFIG, entry),
+        })
+    return profiles
+
+
 def load_stock_feed() -> Dict:
     """주식 피드 데이터 로드"""
     if not STOCK_FEED_PATH.exists():
@@ -73,14 +122,35 @@ def load_stock_feed() -> Dict:
         return json.load(f)
 
 
-def filter_sofi_items(items: List[Dict], hours: int = 24) -> List[Dict]:
-    """SoFi 관련 최신 아이템 필터링"""
+def load_recent_feed_items(hours: int = 24, ticker: Optional[str] = None) -> List[Dict]:
+    """
+    최근 N시간 피드 아이템 로드
+    SQLite 인덱스가 있으면 (ticker, 시각) 범위 조회, 없으면 해당 구간의 아카이브 파티션만 읽고,
+    둘 다 없으면 stock_feed.json(최신 N개 뷰)을 사용한다.
+    """
+    if FEED_ARCHIVE.days():
+        since = datetime.now(ZoneInfo("Asia/Seoul")) - timedelta(hours=hours)
+        try:
+            index = FeedIndex()
+            try:
+                index.sync_from_archive(FEED_ARCHIVE)
+                return index.query(ticker=ticker, since=since)
+            finally:
+                index.close()
+        except Exception as e:
+            print(f"[WARN] 피드 인덱스 조회 실패, 아카이브에서 직접 읽습니다: {e}")
+        return FEED_ARCHIVE.recent_items(hours=hours)
+    return load_stock_feed().get("items", [])
+
+
+def filter_ticker_items(items: List[Dict], ticker: str, hours: int = 24) -> List[Dict]:
+    """종목 관련 최신 아이템 필터링"""
     tz = ZoneInfo("Asia/Seoul")
     cutoff_time = datetime.now(tz) - timedelta(hours=hours)
     
-    sofi_items = []
+    ticker_items = []
     for item in items:
-        if "SOFI" not in item.get("related_tickers", []):
+        if ticker not in item.get("related_tickers", []):
             continue
         
         try:
@@ -90,14 +160,23 @@ def filter_sofi_items(items: List[Dict], hours: int = 24) -> List[Dict]:
         except Exception:
             continue
         
-        sofi_items.append(item)
+        ticker_items.append(item)
     
-    sofi_items.sort(key=lambda x: x["timestamp"], reverse=True)
-    return sofi_items
+    # 같은 소식이 여러 소스로 들어온 경우 대표 기사만 남긴다 (본문 수집/프롬프트 중복 방지)
+    ticker_items = cluster_items(ticker_items)
+    ticker_items.sort(key=lambda x: x["timestamp"], reverse=True)
+    return ticker_items
+
+
+def _last_change(frame) -> Tuple[float, float]:
+    """마지막 종가와 직전 종가 (하루치만 있으면 같은 값)"""
+    current = frame['Close'].iloc[-1]
+    prev = frame['Close'].iloc[-2] if len(frame) > 1 else current
+    return current, prev
 
 
-def collect_macro_data() -> Dict:
-    """거시경제 데이터 수집 (국채 금리, 나스닥 지수, 경쟁사 주가)"""
+def collect_macro_data(frames: Optional[Dict] = None, config: Optional[Dict] = None) -> Dict:
+    """거시경제 데이터 수집 (국채 금리, 나스닥 지수, 경쟁사 주가). config는 종목별 시장 데이터 설정"""
     macro_data = {
         "tnx": None,  # 10년물 국채 금리
         "nasdaq_fintech": None,  # 나스닥 핀테크 지수 (대체 지표)
@@ -108,13 +187,16 @@ def collect_macro_data() -> Dict:
         print("[WARN] yfinance 미설치로 거시경제 데이터 수집 건너뜀")
         return macro_data
     
+    config = config or MARKET_CONFIG
+    if frames is None:
+        frames = fetch_market_frames(config, store=OHLCV_STORE)
+    macro_symbols = config["macro"]
+    
     try:
         # 10년물 국채 금리 (^TNX)
-        tnx = yf.Ticker("^TNX")
-        tnx_info = tnx.history(period="5d")
-        if not tnx_info.empty:
-            current_rate = tnx_info['Close'].iloc[-1]
-            prev_rate = tnx_info['Close'].iloc[-2] if len(tnx_info) > 1 else current_rate
+        tnx_info = frames.get(macro_symbols.get("tnx"))
+        if tnx_info is not None and not tnx_info.empty:
+            current_rate, prev_rate = _last_change(tnx_info)
             change = current_rate - prev_rate
             macro_data["tnx"] = {
                 "current": round(current_rate, 2),
@@ -127,11 +209,9 @@ def collect_macro_data() -> Dict:
     
     try:
         # 나스닥 지수 (대체 지표)
-        nasdaq = yf.Ticker("^IXIC")
-        nasdaq_info = nasdaq.history(period="5d")
-        if not nasdaq_info.empty:
-            current = nasdaq_info['Close'].iloc[-1]
-            prev = nasdaq_info['Close'].iloc[-2] if len(nasdaq_info) > 1 else current
+        nasdaq_info = frames.get(macro_symbols.get("nasdaq_fintech"))
+        if nasdaq_info is not None and not nasdaq_info.empty:
+            current, prev = _last_change(nasdaq_info)
             change_pct = ((current - prev) / prev * 100) if prev > 0 else 0
             macro_data["nasdaq_fintech"] = {
                 "current": round(current, 2),
@@ -141,15 +221,12 @@ def collect_macro_data() -> Dict:
     except Exception as e:
         print(f"[WARN] 나스닥 지수 수집 실패: {e}")
     
-    # 경쟁사 주가 (UPST, AFRM)
-    competitors = ["UPST", "AFRM"]
-    for ticker in competitors:
+    # 경쟁사 주가 (종목별 post.competitors, 없으면 _data/market_symbols.yml의 competitors)
+    for ticker in config["competitors"]:
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.history(period="5d")
-            if not info.empty:
-                current = info['Close'].iloc[-1]
-                prev = info['Close'].iloc[-2] if len(info) > 1 else current
+            info = frames.get(ticker)
+            if info is not None and not info.empty:
+                current, prev = _last_change(info)
                 change_pct = ((current - prev) / prev * 100) if prev > 0 else 0
                 macro_data["competitors"][ticker] = {
                     "current": round(current, 2),
@@ -162,12 +239,14 @@ def collect_macro_data() -> Dict:
     return macro_data
 
 
-def fetch_technical_data() -> Dict:
-    """SoFi 주가의 기술적 지표 수집 (OHLCV, RSI, 이동평균선)"""
+def fetch_technical_data(frames: Optional[Dict] = None, config: Optional[Dict] = None) -> Dict:
+    """종목 주가의 기술적 지표 수집 (OHLCV, RSI, 이동평균선, 볼린저 밴드, ATR). 대상은 config["technical"]["symbol"]"""
     technical_data = {
         "ohlcv": None,
         "rsi": None,
         "moving_averages": {},
+        "bollinger": None,
+        "atr": None,
         "volume_analysis": None
     }
     
@@ -175,11 +254,14 @@ def fetch_technical_data() -> Dict:
         print("[WARN] yfinance 미설치로 기술적 지표 수집 건너뜀")
         return technical_data
     
+    config = config or MARKET_CONFIG
+    symbol = config["technical"]["symbol"]
     try:
-        sofi = yf.Ticker("SOFI")
-        hist = sofi.history(period="60d")  # 60일 데이터로 RSI 계산
+        if frames is None:
+            frames = fetch_market_frames(config, store=OHLCV_STORE)
+        hist = frames.get(symbol)
         
-        if hist.empty:
+        if hist is None or hist.empty:
             return technical_data
         
         # 최근 5일 OHLCV
@@ -197,38 +279,44 @@ def fetch_technical_data() -> Dict:
             "change_pct": round(((latest['Close'] - prev['Close']) / prev['Close'] * 100) if prev['Close'] > 0 else 0, 2)
         }
         
-        # RSI 계산 (14일 기준)
-        if len(hist) >= 14:
-            delta = hist['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            current_rsi = rsi.iloc[-1]
-            technical_data["rsi"] = round(current_rsi, 2)
-        
-        # 이동평균선 (20일, 60일)
-        if len(hist) >= 20:
-            ma20 = hist['Close'].rolling(window=20).mean().iloc[-1]
-            technical_data["moving_averages"]["ma20"] = round(ma20, 2)
-            technical_data["moving_averages"]["above_ma20"] = latest['Close'] > ma20
+        # 지표 계산 (RSI 14일 Wilder, 이동평균 20/60일, 볼린저 20일, ATR 14일, 거래량 z-score)
+        # 저장된 지표 상태가 있으면 새 봉만 반영한다 (market.indicators)
+        # 봉이 부족하면 창이 찬 지표만 채운다 (계산하지 못한 값은 None)
+        indicators = latest_indicators(symbol, hist)
+        if indicators is None:
+            return technical_data
+        missing = [key for key in ("rsi", "sma20", "sma60", "bb_mid", "atr", "volume_z") if indicators.get(key) is None]
+        if missing:
+            print(f"[WARN] 봉이 부족해 일부 지표를 계산하지 못했습니다 ({len(hist)}봉): {', '.join(missing)}")
         
-        if len(hist) >= 60:
-            ma60 = hist['Close'].rolling(window=60).mean().iloc[-1]
-            technical_data["moving_averages"]["ma60"] = round(ma60, 2)
-            technical_data["moving_averages"]["above_ma60"] = latest['Close'] > ma60
+        close = indicators["close"]
+        if indicators["rsi"] is not None:
+            technical_data["rsi"] = round(indicators["rsi"], 2)
+        for window in (20, 60):
+            ma = indicators.get(f"sma{window}")
+            if ma is not None:
+                technical_data["moving_averages"][f"ma{window}"] = round(ma, 2)
+                technical_data["moving_averages"][f"above_ma{window}"] = close > ma
+        if indicators["bb_mid"] is not None:
+            technical_data["bollinger"] = {
+                "upper": round(indicators["bb_upper"], 2),
+                "lower": round(indicators["bb_lower"], 2),
+            }
+        if indicators["atr"] is not None:
+            technical_data["atr"] = round(indicators["atr"], 2)
         
         # 거래량 분석
-        avg_volume = hist['Volume'].tail(20).mean()
-        current_volume = latest['Volume']
-        volume_ratio = (current_volume / avg_volume) if avg_volume > 0 else 1
-        technical_data["volume_analysis"] = {
-            "current": int(current_volume),
-            "average_20d": int(avg_volume),
-            "ratio": round(volume_ratio, 2)
-        }
+        avg_volume = indicators["volume_mean"]
+        if avg_volume is not None:
+            volume_ratio = (indicators["volume"] / avg_volume) if avg_volume > 0 else 1
+            technical_data["volume_analysis"] = {
+                "current": int(indicators["volume"]),
+                "average_20d": int(avg_volume),
+                "ratio": round(volume_ratio, 2),
+                "zscore": round(indicators["volume_z"], 2)
+            }
         
-        print(f"[INFO] SoFi 기술적 지표 수집 완료: ${latest['Close']:.2f}, RSI: {technical_data.get('rsi', 'N/A')}")
+        print(f"[INFO] {symbol} 기술적 지표 수집 완료: ${latest['Close']:.2f}, RSI: {technical_data.get('rsi', 'N/A')}")
         
     except Exception as e:
         print(f"[WARN] 기술적 지표 수집 실패: {e}")
@@ -236,64 +324,27 @@ def fetch_technical_data() -> Dict:
     return technical_data
 
 
-def load_previous_summary(date_str: str) -> Optional[str]:
-    """이전 날짜의 SoFi 분석 글 요약 로드 (연속성 확보)"""
-    tz = ZoneInfo("Asia/Seoul")
+def load_previous_summary(date_str: str, ticker: str = "SOFI", days: int = PREVIOUS_SUMMARY_DAYS) -> Optional[str]:
+    """
+    최근 며칠간 종목 분석 글의 결론 요약 로드 (연속성 확보)
+
+    요약 인덱스(POST_SUMMARY_INDEX)에서 날짜 키로 바로 가져온다. 인덱스는 main()에서 실행마다 한 번 갱신한다.
+    """
     try:
-        target_date = datetime.strptime(date_str, "%Y-%m-%d")
-        prev_date = target_date - timedelta(days=1)
-        prev_date_str = prev_date.strftime("%Y-%m-%d")
-        
-        # 이전 날짜의 SoFi 포스트 찾기 (stock 카테고리 폴더에서)
-        stock_dir = POSTS_DIR / "stock"
-        pattern = f"{prev_date_str}-SOFI-*"
-        if stock_dir.exists():
-            prev_posts = list(stock_dir.glob(pattern))
-        else:
-            # 하위 호환성: 루트에서도 확인
-            prev_posts = list(POSTS_DIR.glob(pattern))
-        
-        if not prev_posts:
+        entries = POST_SUMMARY_INDEX.recent(ticker, date_str, days)
+        if not entries:
             return None
-        
-        # 가장 최근 포스트 읽기
-        prev_post = prev_posts[0]
-        content = prev_post.read_text(encoding="utf-8")
-        
-        # Front Matter 제거하고 본문만 추출
-        if "---" in content:
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                body = parts[2].strip()
-            else:
-                body = content
-        else:
-            body = content
-        
-        # Gemini로 요약 생성 (간단한 추출)
-        # 실제로는 Gemini API를 호출해서 요약하는 것이 좋지만, 여기서는 간단히 핵심만 추출
-        lines = body.split('\n')
-        summary_lines = []
-        for line in lines[:30]:  # 처음 30줄만
-            if line.strip() and not line.startswith('#'):
-                summary_lines.append(line.strip()[:200])  # 각 줄 최대 200자
-        
-        summary = '\n'.join(summary_lines[:10])  # 최대 10줄
-        if len(summary) > 1000:
-            summary = summary[:1000] + "..."
-        
-        print(f"[INFO] 이전 분석 로드: {prev_date_str}")
-        return summary
-        
+        print(f"[INFO] 이전 분석 로드: {', '.join(e['date'] for e in entries)} ({ticker})")
+        return "\n".join(f"- {e['date']}: {e['summary']}" for e in entries)
     except Exception as e:
         print(f"[WARN] 이전 분석 로드 실패: {e}")
         return None
 
 
-def check_existing_post(date_str: str) -> Optional[Path]:
-    """해당 날짜의 SoFi 포스트가 이미 존재하는지 확인 (stock 카테고리 폴더에서)"""
+def check_existing_post(date_str: str, ticker: str = "SOFI") -> Optional[Path]:
+    """해당 날짜의 종목 포스트가 이미 존재하는지 확인 (stock 카테고리 폴더에서)"""
     stock_dir = POSTS_DIR / "stock"
-    pattern = f"{date_str}-SOFI-*"
+    pattern = f"{date_str}-{ticker}-*"
     
     # stock 카테고리 폴더에서 먼저 확인
     if stock_dir.exists():
@@ -315,9 +366,9 @@ def check_existing_post(date_str: str) -> Optional[Path]:
     return None
 
 
-def should_update_post(existing_post_path: Path, sofi_items: List[Dict]) -> bool:
+def should_update_post(existing_post_path: Path, ticker_items: List[Dict]) -> bool:
     """기존 포스트를 업데이트해야 하는지 판단"""
-    if not sofi_items:
+    if not ticker_items:
         return False  # 새 뉴스가 없으면 업데이트 불필요
     
     # 기존 포스트의 수정 시간 확인
@@ -327,7 +378,7 @@ def should_update_post(existing_post_path: Path, sofi_items: List[Dict]) -> bool
         hours_since_update = (now - post_mtime).total_seconds() / 3600
         
         # 2시간 이상 지났거나, 새 뉴스가 많으면 업데이트
-        if hours_since_update >= 2 or len(sofi_items) >= 5:
+        if hours_since_update >= 2 or len(ticker_items) >= 5:
             return True
     except Exception:
         # 파일 정보를 읽을 수 없으면 업데이트
@@ -378,7 +429,7 @@ def clean_html_tags(content: str) -> str:
 
 
 def fetch_article_content(url: str, timeout: int = 10) -> Optional[str]:
-    """URL에서 실제 기사 내용을 추출 (Seeking Alpha 제외)"""
+    """URL에서 실제 기사 내용을 추출해 기사 캐시에 넣는다 (Seeking Alpha 제외). 캐시 조회는 호출 전에 한다."""
     # Seeking Alpha는 스캠 글들이 많고 추출도 실패하므로 제외
     if "seekingalpha.com" in url.lower():
         return None
@@ -390,48 +441,48 @@ def fetch_article_content(url: str, timeout: int = 10) -> Optional[str]:
         resp = requests.get(url, headers=headers, timeout=timeout)
         resp.raise_for_status()
         
-        soup = BeautifulSoup(resp.content, 'html.parser')
-        
-        for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-            tag.decompose()
-        
-        article_content = None
-        selectors = [
-            'article', '[class*="article"]', '[class*="content"]', '[class*="post"]',
-            '[id*="article"]', '[id*="content"]', 'main', '.entry-content',
-            '.article-body', '.post-content'
-        ]
-        
-        for selector in selectors:
-            article = soup.select_one(selector)
-            if article:
-                article_content = article
-                break
-        
-        if not article_content:
-            article_content = soup.find('body') or soup
-        
-        text = article_content.get_text(separator='\n', strip=True)
-        text = re.sub(r'\n\s*\n+', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        # 텍스트/링크 밀도로 본문 블록만 골라낸다 (lxml 스트리밍, 없으면 html.parser)
+        charset = resp.encoding if "charset" in resp.headers.get("Content-Type", "").lower() else None
+        text = extract_article_text(resp.content, encoding=charset)
         
         if len(text) < 100:
             return None
         
-        return text[:5000] if len(text) > 5000 else text
+        text = text[:5000] if len(text) > 5000 else text
+        ARTICLE_CACHE.put(url, text)
+        return text
     
     except Exception as e:
         print(f"[WARN] 기사 내용 추출 실패 ({url}): {e}")
         return None
 
 
-def prepare_news_summary(items: List[Dict]) -> str:
+def prepare_news_summary(items: List[Dict], ticker: str = "SOFI") -> str:
     """뉴스 아이템을 요약 텍스트로 변환 (실제 기사 내용 포함, Seeking Alpha 제외)"""
     # Seeking Alpha 기사 필터링
     filtered_items = [item for item in items if "seekingalpha.com" not in item.get("url", "").lower()]
-    summary = f"총 {len(filtered_items)}개의 SOFI 관련 뉴스 (Seeking Alpha 제외: {len(items) - len(filtered_items)}개)\n\n"
-    
-    for idx, item in enumerate(filtered_items, 1):
+    summary = f"총 {len(filtered_items)}개의 {ticker} 관련 뉴스 (Seeking Alpha 제외: {len(items) - len(filtered_items)}개)\n\n"
+    
+    # 캐시에 있는 기사는 바로 쓰고, 없는 기사만 병렬로 추출한다
+    # (호스트별 요청 간격 유지, 마감 시간 초과분은 제목/요약만 사용)
+    urls = [item.get("url", "") for item in filtered_items]
+    article_contents = [ARTICLE_CACHE.get(url) if url else None for url in urls]
+    misses = [i for i, (url, content) in enumerate(zip(urls, article_contents)) if url and content is None]
+    cache_hits = sum(1 for content in article_contents if content is not None)
+    print(f"[INFO] 기사 내용 {len(urls)}개 중 캐시 적중 {cache_hits}개, {len(misses)}개 병렬 추출 중...")
+    started = time.monotonic()
+    fetched_contents = extract_all(
+        [urls[i] for i in misses],
+        lambda url, timeout: fetch_article_content(url, timeout=timeout),
+        throttle=ARTICLE_THROTTLE,
+    )
+    for i, content in zip(misses, fetched_contents):
+        article_contents[i] = content
+    extracted = sum(1 for content in article_contents if content)
+    print(f"[INFO] 기사 내용 추출 완료: {extracted}/{len(urls)}개, {time.monotonic() - started:.1f}초 (캐시 적중 {cache_hits}개)")
+    ARTICLE_CACHE.save()
+    
+    for idx, (item, article_content) in enumerate(zip(filtered_items, article_contents), 1):
         timestamp = item.get("timestamp", "")
         try:
             dt = datetime.fromisoformat(timestamp)
@@ -448,31 +499,28 @@ def prepare_news_summary(items: List[Dict]) -> str:
         summary += f"제목: {title}\n"
         summary += f"URL: {url}\n"
         
-        print(f"[INFO] 기사 내용 추출 중: {url}")
-        article_content = fetch_article_content(url)
-        
         if article_content:
             summary += f"\n기사 내용:\n{article_content}\n"
         else:
             summary += f"\n(기사 내용 추출 실패 - 제목/요약만 사용)\n"
         
         summary += "\n" + "="*80 + "\n\n"
-        time.sleep(1)
     
     return summary
 
 
-def format_macro_context(macro_data: Dict) -> str:
+def format_macro_context(macro_data: Dict, profile: Dict) -> str:
     """거시경제 데이터를 프롬프트 형식으로 포맷팅"""
+    name, sector = profile["name"], profile["sector"]
     context = "**시장 환경 (Macro Context)**:\n\n"
     
     if macro_data.get("tnx"):
         tnx = macro_data["tnx"]
         context += f"- **미국 10년물 국채 금리 (TNX)**: {tnx['current']}% (전일 대비 {tnx['change']:+.2f}%p, {tnx['change_pct']:+.2f}%)\n"
         if tnx['change'] > 0:
-            context += "  → 국채 금리 상승은 핀테크 기업의 대출 마진에 압박을 줄 수 있음.\n"
+            context += f"  → 국채 금리 상승은 {sector} 기업의 대출 마진과 밸류에이션에 압박을 줄 수 있음.\n"
         elif tnx['change'] < 0:
-            context += "  → 국채 금리 하락은 핀테크 기업의 대출 마진 확대에 유리함.\n"
+            context += f"  → 국채 금리 하락은 {sector} 기업의 대출 마진 확대와 밸류에이션에 유리함.\n"
     
     if macro_data.get("nasdaq_fintech"):
         nasdaq = macro_data["nasdaq_fintech"]
@@ -483,7 +531,7 @@ def format_macro_context(macro_data: Dict) -> str:
         for ticker, data in macro_data["competitors"].items():
             context += f"  - {ticker}: ${data['current']:.2f} (전일 대비 {data['change_pct']:+.2f}%)\n"
     
-    context += "\n이 맥락에서 SoFi 뉴스를 해석하세요. 개별 호재/악재보다 전체 시장 환경이 SoFi 주가에 미치는 영향을 먼저 고려하세요.\n\n"
+    context += f"\n이 맥락에서 {name} 뉴스를 해석하세요. 개별 호재/악재보다 전체 시장 환경이 {name} 주가에 미치는 영향을 먼저 고려하세요.\n\n"
     
     return context
 
@@ -518,9 +566,23 @@ def format_technical_context(technical_data: Dict) -> str:
             above = "위" if ma.get("above_ma60") else "아래"
             context += f"- **60일 이동평균**: ${ma['ma60']:.2f} (현재가 {above})\n"
     
+    if technical_data.get("bollinger"):
+        bb = technical_data["bollinger"]
+        context += f"- **볼린저 밴드 (20일, 2σ)**: ${bb['lower']:.2f} ~ ${bb['upper']:.2f}"
+        if ohlcv["close"] > bb["upper"]:
+            context += " (상단 이탈 - 과열)\n"
+        elif ohlcv["close"] < bb["lower"]:
+            context += " (하단 이탈 - 과매도)\n"
+        else:
+            context += " (밴드 내)\n"
+    
+    if technical_data.get("atr"):
+        atr = technical_data["atr"]
+        context += f"- **ATR (14일)**: ${atr:.2f} (일평균 변동폭, 현재가의 {atr / ohlcv['close'] * 100:.1f}%)\n"
+    
     if technical_data.get("volume_analysis"):
         vol = technical_data["volume_analysis"]
-        context += f"- **거래량**: {vol['current']:,}주 (20일 평균 대비 {vol['ratio']:.2f}배)\n"
+        context += f"- **거래량**: {vol['current']:,}주 (20일 평균 대비 {vol['ratio']:.2f}배, z-score {vol['zscore']:+.2f})\n"
         if vol['ratio'] > 1.5:
             context += "  → 거래량 급증은 큰 움직임의 신호일 수 있음.\n"
     
@@ -529,31 +591,32 @@ def format_technical_context(technical_data: Dict) -> str:
     return context
 
 
-def get_deep_dive_prompt(date_str: str, macro_data: Dict, technical_data: Dict) -> str:
+def get_deep_dive_prompt(date_str: str, macro_data: Dict, technical_data: Dict, profile: Dict) -> str:
     """뉴스가 부족할 때 사용하는 Deep Dive 모드 프롬프트"""
-    return f"""당신은 월스트리트의 20년 차 핀테크 전문 헤지펀드 매니저입니다.
+    name = profile["name"]
+    return f"""당신은 월스트리트의 20년 차 {profile["sector"]} 전문 헤지펀드 매니저입니다.
 
 **날짜**: {date_str}
 
-**상황**: 오늘 SoFi 관련 주요 뉴스가 거의 없습니다. 이 경우 단순히 뉴스를 요약하는 것이 아니라, SoFi의 펀더멘털이나 특정 주제에 대한 심층 분석을 제공하세요.
+**상황**: 오늘 {name} 관련 주요 뉴스가 거의 없습니다. 이 경우 단순히 뉴스를 요약하는 것이 아니라, {name}의 펀더멘털이나 특정 주제에 대한 심층 분석을 제공하세요.
 
-{format_macro_context(macro_data) if macro_data.get("tnx") or macro_data.get("competitors") else ""}
+{format_macro_context(macro_data, profile) if macro_data.get("tnx") or macro_data.get("competitors") else ""}
 
 {format_technical_context(technical_data) if technical_data.get("ohlcv") else ""}
 
 **작성 규칙**:
-1. SoFi의 핵심 비즈니스 모델, 기술력(Galileo 플랫폼), 뱅킹 라이선스의 의미 등에 대해 교육적으로 설명하세요.
+1. {name}의 {profile["focus"]} 등에 대해 교육적으로 설명하세요.
 2. 최근 재무제표의 특정 항목이나 트렌드를 분석하세요.
-3. 현재 시장 환경에서 SoFi가 직면한 기회와 리스크를 분석하세요.
+3. 현재 시장 환경에서 {name}가 직면한 기회와 리스크를 분석하세요.
 4. 모든 문장은 "~다."로 끝나는 건조한 평서문을 사용하세요.
 5. 최소 2000자 이상 작성하세요.
 
 **구조**:
 ### 핵심 주제 (1개 선택)
-- SoFi의 특정 비즈니스 영역이나 기술력에 대한 심층 분석
+- {name}의 특정 비즈니스 영역이나 기술력에 대한 심층 분석
 
 ### 펀더멘털 분석
-- 선택한 주제가 SoFi의 장기 가치에 미치는 영향
+- 선택한 주제가 {name}의 장기 가치에 미치는 영향
 - 재무 지표와의 연관성
 
 ### 시장 환경과의 연관성
@@ -567,8 +630,19 @@ def get_deep_dive_prompt(date_str: str, macro_data: Dict, technical_data: Dict)
 **⚠️ 중요**: Front Matter 없이 본문만 작성하세요. 제목(###)부터 시작하세요."""
 
 
-def generate_post_with_gemini(items: List[Dict], date_str: str, macro_data: Dict, technical_data: Dict, previous_summary: Optional[str]) -> Optional[str]:
-    """Gemini API를 사용하여 포스트 생성 (고도화 버전)"""
+def call_gemini_with_fallback(prompt: str, mode: str, min_length: int = 100) -> Optional[str]:
+    """Gemini 호출 (llm.client의 "stock_post" 모델 체인: 모델 폴백, 429/5xx 백오프 재시도, 마감 시간)"""
+    print(f"[INFO] Gemini API로 글 작성 중... (모드: {mode})")
+    try:
+        return generate(prompt, task="stock_post", api_key=GEMINI_API_KEY, min_length=min_length)
+    except LLMError as e:
+        print(f"[ERROR] Gemini 호출 실패: {e}")
+        return None
+
+
+def generate_post_with_gemini(profile: Dict, items: List[Dict], date_str: str, macro_data: Dict, technical_data: Dict, previous_summary: Optional[str], news_summary: Optional[str] = None) -> Optional[str]:
+    """Gemini API를 사용하여 종목 포스트 생성 (고도화 버전). news_summary가 있으면 기사 추출을 건너뛴다."""
+    ticker, name = profile["ticker"], profile["name"]
     
     # 뉴스 개수에 따라 모드 결정
     if len(items) < 2:
@@ -577,29 +651,22 @@ def generate_post_with_gemini(items: List[Dict], date_str: str, macro_data: Dict
         news_summary = ""
     else:
         mode = "daily_news"
-        news_summary = prepare_news_summary(items)
-    
-    client = genai.Client(api_key=GEMINI_API_KEY)
-    # 모델 폴백 체인 (사용 가능한 모델 순서대로 시도)
-    model_candidates = [
-        "models/gemini-2.5-flash",
-        "models/gemini-2.0-flash",
-        "models/gemini-flash-latest",
-    ]
+        if news_summary is None:
+            news_summary = prepare_news_summary(items, ticker)
     
     if mode == "deep_dive":
-        prompt = get_deep_dive_prompt(date_str, macro_data, technical_data)
+        prompt = get_deep_dive_prompt(date_str, macro_data, technical_data, profile)
     else:
         # Daily News 모드 - 고도화된 프롬프트
         # f-string 내부에서 백슬래시 사용을 피하기 위해 먼저 변수에 저장
-        macro_context = format_macro_context(macro_data) if (macro_data.get("tnx") or macro_data.get("competitors")) else ""
+        macro_context = format_macro_context(macro_data, profile) if (macro_data.get("tnx") or macro_data.get("competitors")) else ""
         technical_context = format_technical_context(technical_data) if technical_data.get("ohlcv") else ""
         previous_context = ""
         if previous_summary:
-            previous_context = f"**이전 분석 맥락 (어제)**:\n{previous_summary}\n\n이전 전망과 비교하여 뷰를 수정하거나 강화하세요. 연속성을 유지하면서 오늘의 새로운 정보를 반영하세요.\n\n"
+            previous_context = f"**이전 분석 맥락 (최근 {PREVIOUS_SUMMARY_DAYS}일, 각 글의 결론 요약)**:\n{previous_summary}\n\n이전 전망과 비교하여 뷰를 수정하거나 강화하세요. 연속성을 유지하면서 오늘의 새로운 정보를 반영하세요.\n\n"
         
-        prompt = f"""당신은 월스트리트의 20년 차 핀테크 전문 헤지펀드 매니저입니다.
-아래 SoFi(SOFI) 관련 최신 뉴스들의 **실제 기사 내용**을 분석하여 투자자들이 이해하기 쉬운 블로그 포스트를 작성하세요.
+        prompt = f"""당신은 월스트리트의 20년 차 {profile["sector"]} 전문 헤지펀드 매니저입니다.
+아래 {name}({ticker}) 관련 최신 뉴스들의 **실제 기사 내용**을 분석하여 투자자들이 이해하기 쉬운 블로그 포스트를 작성하세요.
 
 **⚠️ 절대 금지 사항**:
 - 프롬프트 내용을 본문에 포함하지 마세요
@@ -622,7 +689,7 @@ def generate_post_with_gemini(items: List[Dict], date_str: str, macro_data: Dict
 1. **기사 내용 분석**: 각 뉴스의 제목과 URL만이 아니라, 제공된 **실제 기사 내용**을 읽고 분석하여 작성한다.
 2. 모든 문장은 "~다."로 끝나는 건조한 평서문을 사용한다.
 3. 단순히 뉴스를 요약하지 말고, 다음 3가지 관점에서 분석한다:
-   - **Fundamental (펀더멘털)**: 이 뉴스가 SoFi의 EPS(주당순이익), 가이던스, 장기 성장성에 어떤 영향을 주는가?
+   - **Fundamental (펀더멘털)**: 이 뉴스가 {name}의 EPS(주당순이익), 가이던스, 장기 성장성에 어떤 영향을 주는가?
    - **Sentiment (심리)**: 레딧(Reddit)의 반응과 뉴스 톤을 볼 때 개미 투자자들의 심리는 탐욕인가 공포인가?
    - **Policy/Risk (정세/리스크)**: 현재 정책 환경(트럼프 행정부 등)과 이 뉴스는 상충하는가, 부합하는가?
 4. 거시경제 데이터와 기술적 지표를 뉴스와 결합하여 분석한다.
@@ -674,148 +741,294 @@ def generate_post_with_gemini(items: List[Dict], date_str: str, macro_data: Dict
 - 프롬프트의 지시문이나 설명을 본문에 포함하지 마세요. 순수한 분석 내용만 작성하세요.
 - 각주는 [^1], [^2] 형식으로 사용하고, References 섹션에는 `- [^1]: [출처명](URL)` 형식으로 작성하세요."""
 
-    # 모델 폴백: 첫 번째 모델이 실패하면 다음 모델 시도
-    content = None
-    last_error = None
-    
-    for model_name in model_candidates:
-        try:
-            print(f"[INFO] Gemini API로 글 작성 중... (모드: {mode}, 모델: {model_name})")
-            response = client.models.generate_content(
-                model=model_name,
-                contents=prompt
-            )
-            
-            content = (response.text or "").strip()
-            
-            if not content or len(content) < 100:
-                print(f"[WARN] Gemini 응답이 너무 짧습니다: {len(content)}자")
-                if model_name != model_candidates[-1]:
-                    print(f"[INFO] 다음 모델 시도: {model_candidates[model_candidates.index(model_name) + 1]}")
-                    continue
-                else:
-                    print(f"[ERROR] 모든 모델에서 응답이 너무 짧습니다")
-                    return None
-            
-            # 성공하면 루프 종료
-            print(f"[OK] 모델 {model_name}로 포스트 생성 성공")
-            break
-            
-        except Exception as e:
-            last_error = e
-            print(f"[WARN] 모델 {model_name} 실패: {e}")
-            if model_name != model_candidates[-1]:
-                print(f"[INFO] 다음 모델 시도: {model_candidates[model_candidates.index(model_name) + 1]}")
-                continue
-            else:
-                # 모든 모델 실패
-                print(f"[ERROR] 모든 모델 시도 실패: {last_error}")
-                return None
-    
-    # 최종 검증
-    if not content or len(content) < 100:
-        print(f"[ERROR] Gemini 응답이 비어있거나 너무 짧습니다: {len(content) if content else 0}자")
+    content = call_gemini_with_fallback(prompt, mode)
+    if not content:
         return None
     
     # MathJax 태그 및 기타 HTML 태그 제거 (서식 깨짐 방지)
     content = clean_html_tags(content)
     
-    # Front Matter 생성
-    tz = ZoneInfo("Asia/Seoul")
-    now = datetime.now(tz)
-    title = f"[{date_str}] SOFI 소식 분석"
+    # Front Matter 생성 (업데이트 시 새 아이템만 반영하도록 사용한 피드 아이템 id를 기록)
+    front_matter = build_front_matter(date_str, ticker, post_item_ids(items))
     
-    front_matter = f"""---
+    # Footer 제거 (사용자 요청)
+    return front_matter + content
+
+
+def post_item_ids(items: List[Dict]) -> List[str]:
+    """포스트에 반영한 피드 아이템 id (중복으로 묶인 alternates 포함)"""
+    ids = []
+    for item in items:
+        ids.append(item.get("id", ""))
+        ids.extend(alt.get("id", "") for alt in item.get("alternates", []))
+    return sorted(set(i for i in ids if i))
+
+
+def build_front_matter(date_str: str, ticker: str, item_ids: List[str], created: Optional[str] = None) -> str:
+    """
+    포스트 Front Matter 생성
+
+    Args:
+        date_str: 포스트 날짜 (YYYY-MM-DD)
+        ticker: 종목 티커 (제목과 태그)
+        item_ids: 포스트에 반영한 피드 아이템 id (feed_item_ids로 기록, Jekyll은 무시한다)
+        created: 기존 포스트의 date 값 (업데이트 시 유지하고 last_modified_at을 추가)
+    """
+    now = datetime.now(ZoneInfo("Asia/Seoul")).strftime('%Y-%m-%d %H:%M:%S') + " +0900"
+    title = f"[{date_str}] {ticker} 소식 분석"
+    modified = f"last_modified_at: {now}\n" if created else ""
+    return f"""---
 layout: post
 title: "{title}"
-date: {now.strftime('%Y-%m-%d %H:%M:%S')} +0900
-author: rldhkstopic
+date: {created or now}
+{modified}author: rldhkstopic
 category: stock
-tags: ["SOFI", "주식", "투자", "분석"]
+tags: ["{ticker}", "주식", "투자", "분석"]
 views: 0
+feed_item_ids: {json.dumps(item_ids)}
 ---
 
 """
-    
-    # Footer 제거 (사용자 요청)
-    return front_matter + content
 
 
-def main():
-    """메인 함수"""
-    print("[INFO] SoFi 자동 포스팅 시작 (고도화 버전)...")
+def read_post(post_path: Path) -> Dict:
+    """
+    포스트를 Front Matter 값과 본문으로 나눈다.
+
+    Returns:
+        Dict: {"date": str|None, "item_ids": List[str]|None (기록이 없는 이전 포스트는 None), "body": str}
+    """
+    content = post_path.read_text(encoding="utf-8")
+    parts = content.split("---", 2)
+    if not content.startswith("---") or len(parts) < 3:
+        return {"date": None, "item_ids": None, "body": content}
+    front_matter, body = parts[1], parts[2].strip()
+    date_match = re.search(r"^date:\s*(.+)$", front_matter, re.MULTILINE)
+    ids_match = re.search(r"^feed_item_ids:\s*(\[.*\])\s*$", front_matter, re.MULTILINE)
+    item_ids = None
+    if ids_match:
+        try:
+            item_ids = json.loads(ids_match.group(1))
+        except ValueError:
+            item_ids = None
+    return {
+        "date": date_match.group(1).strip() if date_match else None,
+        "item_ids": item_ids,
+        "body": body,
+    }
+
+
+def get_delta_update_prompt(profile: Dict, date_str: str, body: str, news_summary: str, technical_context: str, next_footnote: int) -> str:
+    """같은 날 새로 들어온 뉴스만으로 기존 글에 덧붙일 업데이트 섹션을 요청하는 프롬프트"""
+    return f"""당신은 월스트리트의 20년 차 {profile["sector"]} 전문 헤지펀드 매니저입니다.
+오늘({date_str}) 작성한 {profile["name"]}({profile["ticker"]}) 분석 글 이후 새로운 뉴스가 들어왔습니다. 기존 글은 그대로 두고, 새 뉴스만 분석한 **업데이트 섹션**을 작성하세요.
+
+**기존 글 (수정하지 말고 맥락으로만 사용)**:
+{body}
+
+{technical_context}
+
+**새로 들어온 뉴스 (제목, URL, 실제 기사 내용 포함)**:
+{news_summary}
+
+**작성 규칙**:
+1. 첫 줄은 `### 업데이트`로 시작한다.
+2. 새 뉴스가 기존 분석(펀더멘털, 심리, 정책/리스크, Bull/Bear 시나리오)을 강화하는지, 수정하는지, 뒤집는지 명확히 밝힌다.
+3. 기존 글의 내용을 반복하지 않는다. 500~1000자로 작성한다.
+4. 모든 문장은 "~다."로 끝나는 건조한 평서문을 사용하고, 이모지와 MathJax/LaTeX 수식은 사용하지 않는다.
+5. 출처 각주는 [^{next_footnote}]부터 번호를 이어서 사용한다.
+6. 마지막에 `## References`를 쓰고, 이번 섹션에서 사용한 각주만 `- [^n]: [출처명](URL)` 형식으로 나열한다.
+
+**⚠️ 중요**: Front Matter, 기존 글, 지시문을 출력하지 마세요. 업데이트 섹션과 References만 작성하세요."""
+
+
+def merge_delta_update(body: str, update: str, heading: str) -> str:
+    """기존 본문의 References 앞에 업데이트 섹션을 넣고, 새 각주를 References 끝에 붙인다."""
+    update_text, _, update_refs = update.partition("## References")
+    update_text = re.sub(r"^#{1,6}\s*업데이트[^\n]*\n", "", update_text.strip()).strip()
+    main_text, _, refs = body.partition("## References")
+    merged = f"{main_text.rstrip()}\n\n{heading}\n\n{update_text}\n"
+    ref_lines = "\n".join(part for part in (refs.strip(), update_refs.strip()) if part)
+    if ref_lines:
+        merged += f"\n## References\n\n{ref_lines}\n"
+    return merged
+
+
+def update_post_with_delta(profile: Dict, post: Dict, new_items: List[Dict], date_str: str, technical_data: Dict, news_summary: str) -> Optional[str]:
+    """
+    새 아이템만으로 업데이트 섹션을 생성해 기존 포스트에 합친다.
+
+    Returns:
+        str: Front Matter를 포함한 전체 포스트 (생성 실패 시 None)
+    """
+    footnotes = [int(n) for n in re.findall(r"\[\^(\d+)\]", post["body"])]
+    technical_context = format_technical_context(technical_data) if technical_data.get("ohlcv") else ""
+    prompt = get_delta_update_prompt(profile, date_str, post["body"], news_summary, technical_context, max(footnotes, default=0) + 1)
+    update = call_gemini_with_fallback(prompt, "delta_update")
+    if not update:
+        return None
     
-    tz = ZoneInfo("Asia/Seoul")
-    today = datetime.now(tz).strftime("%Y-%m-%d")
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    heading = f"### 업데이트 ({now.strftime('%H:%M')} KST)"
+    body = merge_delta_update(post["body"], clean_html_tags(update), heading)
+    item_ids = sorted(set(post["item_ids"]) | set(post_item_ids(new_items)))
+    return build_front_matter(date_str, profile["ticker"], item_ids, created=post["date"]) + body
+
+
+def generate_ticker_post(profile: Dict, today: str, items: List[Dict], get_market_frames) -> Optional[Path]:
+    """
+    종목 하나의 오늘 분석 글 생성/업데이트
+
+    Args:
+        profile: load_post_profiles()의 항목
+        today: 날짜 (YYYY-MM-DD)
+        items: 이 종목의 최근 피드 아이템
+        get_market_frames: 전 종목 시장 데이터를 돌려주는 함수 (처음 호출할 때 한 번만 받는다)
+
+    Returns:
+        Path: 생성/업데이트한 포스트 경로 (건너뛰었거나 실패하면 None)
+    """
+    ticker = profile["ticker"]
+    config = profile["market_config"]
     
     # 1. 오늘 날짜 포스트가 이미 존재하는지 확인
-    existing_post = check_existing_post(today)
+    existing_post = check_existing_post(today, ticker)
     
-    # 2. 주식 피드 로드 (업데이트 여부 판단을 위해 먼저 로드)
-    feed_data = load_stock_feed()
-    items = feed_data.get("items", [])
-    print(f"[INFO] 전체 피드 아이템: {len(items)}개")
+    # 단계별 체크포인트: 같은 날 같은 입력(피드 아이템, 시장 설정)으로 다시 실행하면 완료된 단계를 건너뛴다
+    run_key = f"{ticker}-{today}-{input_hash(sorted(item.get('id', '') for item in items), profile)}"
+    checkpoint = StageCheckpoint("sofi_auto_post", run_key)
     
-    # 3. SoFi 관련 최신 아이템 필터링 (최근 24시간)
-    sofi_items = filter_sofi_items(items, hours=24)
-    print(f"[INFO] SoFi 관련 최신 아이템: {len(sofi_items)}개")
+    # 3. 종목 관련 최신 아이템 필터링 (최근 24시간)
+    ticker_items = checkpoint.run("ticker_items", lambda: filter_ticker_items(items, ticker, hours=24))
+    print(f"[INFO] {ticker} 관련 최신 아이템: {len(ticker_items)}개")
     
     # 4. 기존 포스트가 있으면 업데이트 여부 판단
+    delta_post = None
     if existing_post:
-        print(f"[INFO] {today} SOFI 포스트가 이미 존재합니다: {existing_post.name}")
-        if should_update_post(existing_post, sofi_items):
-            print(f"[INFO] 새 뉴스가 있거나 시간이 지나서 포스트를 업데이트합니다.")
-            # 기존 파일 삭제 (덮어쓰기)
-            existing_post.unlink()
-            print(f"[INFO] 기존 포스트 삭제 완료")
+        print(f"[INFO] {today} {ticker} 포스트가 이미 존재합니다: {existing_post.name}")
+        if not should_update_post(existing_post, ticker_items):
+            print(f"[INFO] {ticker} 업데이트 불필요 (새 뉴스 부족 또는 최근 업데이트됨). 스킵.")
+            return None
+        # 기존 파일은 새 글 생성에 성공한 뒤 교체한다 (생성 실패 시 기존 글 유지)
+        post = read_post(existing_post)
+        if DELTA_UPDATE_ENABLED and post["item_ids"]:
+            recorded = set(post["item_ids"])
+            new_items = [item for item in ticker_items if item.get("id") not in recorded]
+            if not new_items:
+                print(f"[INFO] {ticker} 기존 포스트에 반영되지 않은 새 뉴스가 없습니다. 스킵.")
+                return None
+            print(f"[INFO] {ticker} 새 뉴스 {len(new_items)}개로 업데이트 섹션을 추가합니다 (기존 {len(recorded)}개 반영됨).")
+            delta_post = post
+            ticker_items = new_items
         else:
-            print(f"[INFO] 업데이트 불필요 (새 뉴스 부족 또는 최근 업데이트됨). 스킵.")
-            return
-    
-    # 2. 주식 피드 로드
-    feed_data = load_stock_feed()
-    items = feed_data.get("items", [])
-    print(f"[INFO] 전체 피드 아이템: {len(items)}개")
-    
-    # 3. SoFi 관련 최신 아이템 필터링 (최근 24시간)
-    sofi_items = filter_sofi_items(items, hours=24)
-    print(f"[INFO] SoFi 관련 최신 아이템: {len(sofi_items)}개")
+            print(f"[INFO] {ticker} 새 뉴스가 있거나 시간이 지나서 포스트를 다시 생성합니다.")
+    
+    # 증분 업데이트: 새 아이템 기사와 기술적 지표만 사용한다
+    if delta_post is not None:
+        technical_data = checkpoint.run("technical_data", lambda: fetch_technical_data(get_market_frames(), config))
+        news_summary = checkpoint.run("delta_news_summary", lambda: prepare_news_summary(ticker_items, ticker))
+        content = update_post_with_delta(profile, delta_post, ticker_items, today, technical_data, news_summary)
+        if not content:
+            print(f"[ERROR] {ticker} 업데이트 섹션 생성 실패 (수집 단계 체크포인트 유지: {checkpoint.run_dir})")
+            return None
+        existing_post.write_text(content, encoding="utf-8")
+        POST_SUMMARY_INDEX.upsert(existing_post)
+        checkpoint.clear()
+        print(f"[OK] {ticker} 포스트 업데이트 완료: {existing_post.name} ({len(content)}자)")
+        return existing_post
     
-    # 4. 거시경제 데이터 수집
-    print("[INFO] 거시경제 데이터 수집 중...")
-    macro_data = collect_macro_data()
+    # 5. 거시경제 데이터 수집
+    print(f"[INFO] {ticker} 거시경제 데이터 수집 중...")
+    macro_data = checkpoint.run("macro_data", lambda: collect_macro_data(get_market_frames(), config))
     
     # 6. 기술적 지표 수집
-    print("[INFO] 기술적 지표 수집 중...")
-    technical_data = fetch_technical_data()
+    print(f"[INFO] {ticker} 기술적 지표 수집 중...")
+    technical_data = checkpoint.run("technical_data", lambda: fetch_technical_data(get_market_frames(), config))
     
     # 7. 이전 분석 로드 (연속성)
-    print("[INFO] 이전 분석 맥락 로드 중...")
-    previous_summary = load_previous_summary(today)
+    print(f"[INFO] {ticker} 이전 분석 맥락 로드 중...")
+    previous_summary = checkpoint.run("previous_summary", lambda: load_previous_summary(today, ticker))
     
     # 8. 뉴스가 없어도 Deep Dive 모드로 진행
-    if not sofi_items:
-        print("[INFO] 새로운 SoFi 뉴스가 없습니다. Deep Dive 모드로 진행합니다.")
+    news_summary = None
+    if not ticker_items:
+        print(f"[INFO] 새로운 {ticker} 뉴스가 없습니다. Deep Dive 모드로 진행합니다.")
     else:
-        print(f"[INFO] {len(sofi_items)}개의 SoFi 뉴스를 발견했습니다. Daily News 모드로 진행합니다.")
+        print(f"[INFO] {len(ticker_items)}개의 {ticker} 뉴스를 발견했습니다. Daily News 모드로 진행합니다.")
+        if len(ticker_items) >= 2:
+            news_summary = checkpoint.run("news_summary", lambda: prepare_news_summary(ticker_items, ticker))
     
     # 9. Gemini로 포스트 생성
-    print("[INFO] Gemini API로 포스트 생성 시작...")
-    content = generate_post_with_gemini(sofi_items, today, macro_data, technical_data, previous_summary)
+    print(f"[INFO] Gemini API로 {ticker} 포스트 생성 시작...")
+    content = generate_post_with_gemini(profile, ticker_items, today, macro_data, technical_data, previous_summary, news_summary)
     if not content:
-        print("[ERROR] 포스트 생성 실패")
-        return
+        print(f"[ERROR] {ticker} 포스트 생성 실패 (수집 단계 체크포인트 유지: {checkpoint.run_dir})")
+        return None
     
     # 10. 파일 저장 (stock 카테고리 폴더에 저장)
     stock_dir = POSTS_DIR / "stock"
     stock_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"{today}-SOFI-소식-분석.md"
+    filename = f"{today}-{ticker}-소식-분석.md"
     filepath = stock_dir / filename
     
     filepath.write_text(content, encoding="utf-8")
+    POST_SUMMARY_INDEX.upsert(filepath)
+    if existing_post and existing_post.resolve() != filepath.resolve():
+        existing_post.unlink()
+        print(f"[INFO] 기존 포스트 삭제 완료: {existing_post.name}")
+    checkpoint.clear()
     print(f"[OK] 포스트 생성 완료: {filename}")
     print(f"[OK] 경로: {filepath}")
     print(f"[OK] 글 길이: {len(content)}자")
+    return filepath
+
+
+def main():
+    """메인 함수"""
+    print("[INFO] 종목 분석 자동 포스팅 시작 (고도화 버전)...")
+    
+    tz = ZoneInfo("Asia/Seoul")
+    today = datetime.now(tz).strftime("%Y-%m-%d")
+    profiles = load_post_profiles()
+    print(f"[INFO] 대상 종목: {', '.join(p['ticker'] for p in profiles)}")
+    
+    # 이전 분석 요약 인덱스 갱신 (새 글/수정된 글만 다시 요약)
+    refreshed = POST_SUMMARY_INDEX.refresh(POSTS_DIR / "stock")
+    if refreshed:
+        print(f"[INFO] 분석 글 요약 인덱스 갱신: {refreshed}개")
+    
+    # 2. 주식 피드 로드 (업데이트 여부 판단을 위해 먼저 로드, 최근 24시간 파티션만 읽는다)
+    items_by_ticker = {p["ticker"]: load_recent_feed_items(hours=24, ticker=p["ticker"]) for p in profiles}
+    print("[INFO] 최근 피드 아이템: " + ", ".join(f"{t} {len(v)}개" for t, v in items_by_ticker.items()))
+    
+    # 전 종목의 거시 지표/경쟁사/종목 시세를 한 번의 일괄 요청으로 받는다 (체크포인트가 없는 단계가 처음 요청할 때)
+    market_frames = None
+    market_lock = threading.Lock()
+    
+    def get_market_frames() -> Dict:
+        nonlocal market_frames
+        with market_lock:
+            if market_frames is None:
+                configs = [p["market_config"] for p in profiles]
+                market_frames = fetch_market_frames(configs[0], store=OHLCV_STORE, extra_configs=configs[1:]) if YFINANCE_AVAILABLE else {}
+            return market_frames
+    
+    def _run(profile: Dict) -> Optional[Path]:
+        try:
+            return generate_ticker_post(profile, today, items_by_ticker[profile["ticker"]], get_market_frames)
+        except Exception as e:
+            print(f"[ERROR] {profile['ticker']} 포스트 생성 중 오류: {e}")
+            return None
+    
+    # 종목별 작업은 대부분 네트워크 대기(기사 추출, Gemini)라 스레드로 동시에 처리한다
+    started = time.monotonic()
+    workers = max(1, min(POST_WORKERS, len(profiles)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stock-post") as executor:
+        results = list(executor.map(_run, profiles))
+    POST_SUMMARY_INDEX.save()
+    
+    done = [p["ticker"] for p, path in zip(profiles, results) if path]
+    print(f"[INFO] 종목 분석 완료: {len(done)}/{len(profiles)}개 ({', '.join(done) or '없음'}), {time.monotonic() - started:.1f}초")
 
 
 if __name__ == "__main__":
@@ -7,19 +7,35 @@ RSS 피드와 SNS 소스에서 뉴스를 수집하여 stock_feed.json을 업데
 
 import os
 import json
+import time
 import hashlib
-import requests
-import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Optional
 from zoneinfo import ZoneInfo
-from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+from feeds.archive import FeedArchive
+from feeds.cache import FeedCache
+from feeds.dedup import NearDuplicateIndex, cluster_items
+from feeds.index import FeedIndex
+from feeds.metrics import FeedMetrics
+from feeds.fetcher import fetch_all
+from feeds.parser import DEFAULT_MAX_STALE, parse_feed_entries, parse_published, select_entries
+from feeds.urls import UrlCanonicalizer
+from feeds.watchlist import TickerMatcher, load_watchlist
+
 # 환경 변수
 ECONOMIC_NEWS_RSS_FEEDS = os.getenv("ECONOMIC_NEWS_RSS_FEEDS", "").strip()
 STOCK_FEED_JSON_PATH = Path("assets/data/stock_feed.json")
+# stock_feed.json에 노출할 최신 항목 수 (전체 이력은 assets/data/feed/ 아카이브에 보관)
 MAX_ITEMS = 200
+# 피드 병렬 수집 설정 (동시 요청 수 / 실행 전체 마감 시간(초))
+FEED_FETCH_WORKERS = int(os.getenv("FEED_FETCH_WORKERS", "8"))
+FEED_FETCH_DEADLINE = float(os.getenv("FEED_FETCH_DEADLINE", "30"))
+# 이전 실행에서 저장한 기사와 근접 중복을 비교할 기간(시간)
+DEDUP_WINDOW_HOURS = 48
+# SQLite 피드 인덱스 사용 여부 (0이면 아카이브 파티션만 사용)
+FEED_INDEX_ENABLED = os.getenv("FEED_INDEX_ENABLED", "1").strip() != "0"
 
 # 기본 RSS 피드
 DEFAULT_FEEDS = [
@@ -28,26 +44,109 @@ DEFAULT_FEEDS = [
     "https://feeds.bloomberg.com/politics/news.rss",
 ]
 
-# 관심 종목 티커 (한국: 6자리, 미국: 대문자)
-WATCHLIST_TICKERS = ["SOFI"]
+# Reddit RSS 피드 (공개 API)
+REDDIT_FEEDS = [
+    "https://www.reddit.com/r/stocks/hot/.rss",
+    "https://www.reddit.com/r/investing/hot/.rss",
+    "https://www.reddit.com/r/koreastock/hot/.rss",
+]
+
+# SoFi 전용 소스 (Seeking Alpha는 스캠 글들이 많고 추출도 실패하므로 제외)
+YAHOO_SOFI_FEED = "https://feeds.finance.yahoo.com/rss/2.0/headline?s=SOFI&region=US&lang=en-US"
+SOFI_REDDIT_FEEDS = [
+    "https://www.reddit.com/r/sofistock/hot/.rss",
+    "https://www.reddit.com/r/sofi/hot/.rss",
+]
+
+BOT_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; StockFeedBot/1.0)"}
+
+# 조건부 요청 캐시 (ETag/Last-Modified/본문 해시). 변경 없는 피드는 XML 파싱을 건너뛴다.
+FEED_CACHE = FeedCache()
+FEED_ARCHIVE = FeedArchive()
+# 소스별 수집 지표 (automation/results/feed_metrics.jsonl)
+FEED_METRICS = FeedMetrics()
+# 기사 URL 정규화 (추적 파라미터 제거, 리다이렉터 풀기). 항목 id는 정규화된 URL로만 만든다.
+URL_CANONICALIZER = UrlCanonicalizer()
+
+# 관심 종목 (_data/stock_watchlist.yml, 한국: 6자리, 미국: 대문자)
+WATCHLIST = load_watchlist()
+WATCHLIST_TICKERS = [entry["ticker"] for entry in WATCHLIST]
+TICKER_MATCHER = TickerMatcher(WATCHLIST)
+
+
+def get_rss_feed_urls() -> List[str]:
+    """수집 대상 RSS 피드 URL 목록 (환경 변수 우선)"""
+    if ECONOMIC_NEWS_RSS_FEEDS:
+        return [u.strip() for u in ECONOMIC_NEWS_RSS_FEEDS.split(",") if u.strip()]
+    return DEFAULT_FEEDS
+
 
+def build_feed_requests() -> List[Dict]:
+    """모든 수집기가 사용하는 피드 요청 목록 (한 번에 병렬 수집하기 위함)"""
+    reqs = [{"url": url, "headers": {}} for url in get_rss_feed_urls()]
+    reqs += [{"url": url, "headers": BOT_HEADERS} for url in REDDIT_FEEDS]
+    reqs += [{"url": url, "headers": BOT_HEADERS} for url in [YAHOO_SOFI_FEED] + SOFI_REDDIT_FEEDS]
+    return reqs
 
-def generate_item_id(url: str, timestamp: str) -> str:
-    """URL과 타임스탬프로 고유 ID 생성"""
-    content = f"{url}|{timestamp}"
-    return hashlib.md5(content.encode()).hexdigest()
+
+def fetch_feeds(reqs: List[Dict], fetched: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+    """
+    피드 응답 목록을 요청 순서대로 반환한다.
+    main()에서 미리 병렬 수집한 결과(fetched)가 있으면 재사용하고, 없는 URL만 새로 가져온다.
+    """
+    fetched = fetched or {}
+    missing = [r for r in reqs if r["url"] not in fetched]
+    if missing:
+        results = fetch_all(missing, max_workers=FEED_FETCH_WORKERS, deadline=FEED_FETCH_DEADLINE, cache=FEED_CACHE)
+        for r in results:
+            FEED_METRICS.record_fetch(r)
+        fetched = {**fetched, **{r["url"]: r for r in results}}
+    return [fetched[r["url"]] for r in reqs]
+
+
+def load_feed_entries(
+    result: Dict,
+    cutoff: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    max_stale: Optional[int] = DEFAULT_MAX_STALE,
+) -> List[Dict]:
+    """
+    수집 결과를 항목 목록으로 변환한다 (RSS 2.0 / Atom 공통).
+    실패한 요청은 예외로 올려 기존 경고 처리 흐름을 타고, 304/본문 동일이면 캐시된 항목을 재사용한다.
+    캐시에는 피드 전체 항목이 있고, 이 수집기의 cutoff/limit은 불러온 뒤에 적용한다.
+    오래된 항목이 이어질 때 멈추는 규칙은 최신순 피드용이다. Reddit hot처럼 날짜순이 아닌 피드는 max_stale=None.
+    """
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+    started = time.perf_counter()
+    entries = list(select_entries(
+        FEED_CACHE.load_items(result, parse_feed_entries), cutoff=cutoff, limit=limit, max_stale=max_stale
+    ))
+    FEED_METRICS.record_parse(result["url"], time.perf_counter() - started, len(entries))
+    return entries
+
+
+def resolve_feed_links(fetched: Dict[str, Dict], deadline: float) -> int:
+    """수집한 피드 항목 링크 중 아직 모르는 단축 URL을 마감 시각(time.monotonic 기준)까지 한 번에 해석한다."""
+    links = []
+    for result in fetched.values():
+        if result.get("error"):
+            continue
+        try:
+            links.extend(entry["link"] for entry in FEED_CACHE.load_items(result, parse_feed_entries))
+        except Exception:
+            continue
+    return URL_CANONICALIZER.resolve_all(links, deadline=deadline)
+
+
+def generate_item_id(url: str) -> str:
+    """정규화된 URL로 고유 ID 생성 (재발행으로 pubDate가 바뀌어도 같은 id)"""
+    return hashlib.md5(url.encode()).hexdigest()
 
 
 def extract_tickers(text: str) -> List[str]:
-    """텍스트에서 티커 추출 (간단한 패턴 매칭)"""
-    found = []
-    text_upper = text.upper()
-    
-    for ticker in WATCHLIST_TICKERS:
-        if ticker in text_upper:
-            found.append(ticker)
-    
-    return found
+    """텍스트에서 관심종목 티커 추출 (토큰 경계 기준 티커/회사명 매칭)"""
+    return TICKER_MATCHER.match(text)
 
 
 def categorize_item(item: Dict) -> str:
@@ -81,45 +180,29 @@ def determine_sentiment(content: str) -> Optional[str]:
         return "NEUTRAL"
 
 
-def collect_rss_news() -> List[Dict]:
+def collect_rss_news(fetched: Optional[Dict[str, Dict]] = None) -> List[Dict]:
     """RSS 피드에서 뉴스 수집"""
-    feed_urls = DEFAULT_FEEDS
-    if ECONOMIC_NEWS_RSS_FEEDS:
-        feed_urls = [u.strip() for u in ECONOMIC_NEWS_RSS_FEEDS.split(",") if u.strip()]
+    feed_reqs = [{"url": url, "headers": {}} for url in get_rss_feed_urls()]
     
     all_items = []
     tz = ZoneInfo("Asia/Seoul")
     cutoff_time = datetime.now(tz) - timedelta(hours=24)
     
-    for url in feed_urls:
+    for result in fetch_feeds(feed_reqs, fetched):
+        url = result["url"]
         try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            
-            root = ET.fromstring(resp.content)
-            channel = root.find("channel")
-            if channel is None:
-                continue
-            
-            for item in channel.findall("item"):
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("pubDate")
-                desc_el = item.find("description")
-                
-                title = (title_el.text or "").strip() if title_el is not None else ""
-                link = (link_el.text or "").strip() if link_el is not None else ""
-                pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                desc = (desc_el.text or "").strip() if desc_el is not None else ""
+            for entry in load_feed_entries(result, cutoff=cutoff_time):
+                title = entry["title"]
+                link = URL_CANONICALIZER.unwrap(entry["link"])
+                pub = entry["pub"]
+                desc = entry["desc"]
                 
                 if not title or not link:
                     continue
                 
                 # 시간 파싱
                 try:
-                    dt = parsedate_to_datetime(pub)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+                    dt = parse_published(pub)
                     dt_kst = dt.astimezone(tz)
                     
                     if dt_kst < cutoff_time:
@@ -141,7 +224,7 @@ def collect_rss_news() -> List[Dict]:
                 
                 # 아이템 생성
                 feed_item = {
-                    "id": generate_item_id(link, dt_kst.isoformat()),
+                    "id": generate_item_id(URL_CANONICALIZER.canonicalize(link)),
                     "timestamp": dt_kst.isoformat(),
                     "source_type": "NEWS",
                     "source_name": source_name,
@@ -164,49 +247,31 @@ def collect_rss_news() -> List[Dict]:
     return all_items
 
 
-def collect_reddit_posts() -> List[Dict]:
+def collect_reddit_posts(fetched: Optional[Dict[str, Dict]] = None) -> List[Dict]:
     """Reddit에서 주식 관련 게시물 수집 (간단한 웹 스크래핑)"""
     # Reddit RSS 피드 사용 (공개 API)
-    reddit_feeds = [
-        "https://www.reddit.com/r/stocks/hot/.rss",
-        "https://www.reddit.com/r/investing/hot/.rss",
-        "https://www.reddit.com/r/koreastock/hot/.rss",
-    ]
+    feed_reqs = [{"url": url, "headers": BOT_HEADERS} for url in REDDIT_FEEDS]
     
     all_items = []
     tz = ZoneInfo("Asia/Seoul")
     cutoff_time = datetime.now(tz) - timedelta(hours=24)
     
-    for url in reddit_feeds:
+    for result in fetch_feeds(feed_reqs, fetched):
+        url = result["url"]
         try:
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; StockFeedBot/1.0)"}
-            resp = requests.get(url, headers=headers, timeout=10)
-            resp.raise_for_status()
-            
-            root = ET.fromstring(resp.content)
-            channel = root.find("channel")
-            if channel is None:
-                continue
-            
-            for item in channel.findall("item"):
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("published") or item.find("pubDate")
-                desc_el = item.find("description")
-                
-                title = (title_el.text or "").strip() if title_el is not None else ""
-                link = (link_el.text or "").strip() if link_el is not None else ""
-                pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                desc = (desc_el.text or "").strip() if desc_el is not None else ""
+            # hot 피드는 날짜순이 아니므로(고정글/오래된 인기글이 앞에 온다) 끝까지 본다.
+            for entry in load_feed_entries(result, cutoff=cutoff_time, max_stale=None):
+                title = entry["title"]
+                link = URL_CANONICALIZER.unwrap(entry["link"])
+                pub = entry["pub"]
+                desc = entry["desc"]
                 
                 if not title or not link:
                     continue
                 
                 # 시간 파싱
                 try:
-                    dt = parsedate_to_datetime(pub)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+                    dt = parse_published(pub)
                     dt_kst = dt.astimezone(tz)
                     
                     if dt_kst < cutoff_time:
@@ -219,7 +284,7 @@ def collect_reddit_posts() -> List[Dict]:
                 
                 # 아이템 생성
                 feed_item = {
-                    "id": generate_item_id(link, dt_kst.isoformat()),
+                    "id": generate_item_id(URL_CANONICALIZER.canonicalize(link)),
                     "timestamp": dt_kst.isoformat(),
                     "source_type": "SNS",
                     "source_name": "Reddit",
@@ -242,102 +307,69 @@ def collect_reddit_posts() -> List[Dict]:
     return all_items
 
 
-def collect_sofi_specific_sources() -> List[Dict]:
+def collect_sofi_specific_sources(fetched: Optional[Dict[str, Dict]] = None) -> List[Dict]:
     """SoFi 전용 소스에서 콘텐츠 수집 (Seeking Alpha 제외)"""
     all_items = []
     tz = ZoneInfo("Asia/Seoul")
     cutoff_time = datetime.now(tz) - timedelta(hours=24)
     
     # Seeking Alpha는 스캠 글들이 많고 추출도 실패하므로 제외
+    feed_reqs = [{"url": url, "headers": BOT_HEADERS} for url in [YAHOO_SOFI_FEED] + SOFI_REDDIT_FEEDS]
+    yahoo_result, *reddit_results = fetch_feeds(feed_reqs, fetched)
     
     # 1. Yahoo Finance - SoFi 뉴스
-    yahoo_url = "https://feeds.finance.yahoo.com/rss/2.0/headline?s=SOFI&region=US&lang=en-US"
     try:
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; StockFeedBot/1.0)"}
-        resp = requests.get(yahoo_url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        
-        root = ET.fromstring(resp.content)
-        channel = root.find("channel")
-        
-        if channel is not None:
-            for item in channel.findall("item")[:20]:
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("pubDate")
-                desc_el = item.find("description")
-                
-                title = (title_el.text or "").strip() if title_el is not None else ""
-                link = (link_el.text or "").strip() if link_el is not None else ""
-                pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                desc = (desc_el.text or "").strip() if desc_el is not None else ""
+        # 최신순 피드라 cutoff 이전 항목이 이어지면 멈춘다 (limit은 cutoff를 통과한 항목 수)
+        for entry in load_feed_entries(yahoo_result, cutoff=cutoff_time, limit=20):
+            title = entry["title"]
+            link = URL_CANONICALIZER.unwrap(entry["link"])
+            pub = entry["pub"]
+            desc = entry["desc"]
+            
+            if not title or not link:
+                continue
+            
+            try:
+                dt = parse_published(pub)
+                dt_kst = dt.astimezone(tz)
                 
-                if not title or not link:
+                if dt_kst < cutoff_time:
                     continue
-                
-                try:
-                    dt = parsedate_to_datetime(pub)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
-                    dt_kst = dt.astimezone(tz)
-                    
-                    if dt_kst < cutoff_time:
-                        continue
-                except Exception:
-                    dt_kst = datetime.now(tz)
-                
-                feed_item = {
-                    "id": generate_item_id(link, dt_kst.isoformat()),
-                    "timestamp": dt_kst.isoformat(),
-                    "source_type": "NEWS",
-                    "source_name": "Yahoo Finance",
-                    "category": "WATCHLIST",
-                    "related_tickers": ["SOFI"],
-                    "content": title + (" - " + desc[:200] if desc else ""),
-                    "url": link,
-                    "sentiment": determine_sentiment(title + " " + desc),
-                }
-                
-                all_items.append(feed_item)
+            except Exception:
+                dt_kst = datetime.now(tz)
+            
+            feed_item = {
+                "id": generate_item_id(URL_CANONICALIZER.canonicalize(link)),
+                "timestamp": dt_kst.isoformat(),
+                "source_type": "NEWS",
+                "source_name": "Yahoo Finance",
+                "category": "WATCHLIST",
+                "related_tickers": ["SOFI"],
+                "content": title + (" - " + desc[:200] if desc else ""),
+                "url": link,
+                "sentiment": determine_sentiment(title + " " + desc),
+            }
+            
+            all_items.append(feed_item)
     
     except Exception as e:
         print(f"[WARN] Yahoo Finance 수집 실패: {e}")
     
     # 3. Reddit - SoFi 전용 서브레딧
-    sofi_reddit_feeds = [
-        "https://www.reddit.com/r/sofistock/hot/.rss",
-        "https://www.reddit.com/r/sofi/hot/.rss",
-    ]
-    
-    for url in sofi_reddit_feeds:
+    for result in reddit_results:
+        url = result["url"]
         try:
-            headers = {"User-Agent": "Mozilla/5.0 (compatible; StockFeedBot/1.0)"}
-            resp = requests.get(url, headers=headers, timeout=10)
-            resp.raise_for_status()
-            
-            root = ET.fromstring(resp.content)
-            channel = root.find("channel")
-            if channel is None:
-                continue
-            
-            for item in channel.findall("item")[:15]:
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("published") or item.find("pubDate")
-                desc_el = item.find("description")
-                
-                title = (title_el.text or "").strip() if title_el is not None else ""
-                link = (link_el.text or "").strip() if link_el is not None else ""
-                pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                desc = (desc_el.text or "").strip() if desc_el is not None else ""
+            for entry in load_feed_entries(result, limit=15):
+                title = entry["title"]
+                link = URL_CANONICALIZER.unwrap(entry["link"])
+                pub = entry["pub"]
+                desc = entry["desc"]
                 
                 if not title or not link:
                     continue
                 
                 try:
-                    dt = parsedate_to_datetime(pub)
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+                    dt = parse_published(pub)
                     dt_kst = dt.astimezone(tz)
                     
                     if dt_kst < cutoff_time:
@@ -346,7 +378,7 @@ def collect_sofi_specific_sources() -> List[Dict]:
                     continue
                 
                 feed_item = {
-                    "id": generate_item_id(link, dt_kst.isoformat()),
+                    "id": generate_item_id(URL_CANONICALIZER.canonicalize(link)),
                     "timestamp": dt_kst.isoformat(),
                     "source_type": "SNS",
                     "source_name": "Reddit",
@@ -380,23 +412,33 @@ def load_existing_feed() -> List[Dict]:
         return []
 
 
-def merge_items(existing: List[Dict], new_items: List[Dict]) -> List[Dict]:
-    """기존 아이템과 새 아이템 병합 (중복 제거)"""
-    existing_ids: Set[str] = {item["id"] for item in existing}
-    
-    # 새 아이템 중 중복 제거
-    unique_new = [item for item in new_items if item["id"] not in existing_ids]
-    
-    # 병합 및 정렬 (최신순)
-    all_items = existing + unique_new
-    all_items.sort(key=lambda x: x["timestamp"], reverse=True)
-    
-    # 상위 200개만 유지
-    return all_items[:MAX_ITEMS]
+def drop_known_duplicates(items: List[Dict]) -> List[Dict]:
+    """최근 아카이브에 이미 있는 기사(같은 id 또는 다른 URL의 같은 소식)를 새 항목에서 뺀다."""
+    recent_index = NearDuplicateIndex()
+    recent_ids = set()
+    for item in FEED_ARCHIVE.recent_items(hours=DEDUP_WINDOW_HOURS):
+        recent_index.add(item)
+        recent_ids.add(item["id"])
+    
+    # id는 정규화 URL만으로 만들므로, 재발행으로 날짜 파티션이 달라진 기사도 id로 바로 걸러진다.
+    return [
+        item for item in items
+        if item["id"] not in recent_ids and recent_index.find(item) is None
+    ]
+
+
+def seed_archive_from_feed():
+    """아카이브가 비어 있으면 기존 stock_feed.json 항목으로 한 번 채운다 (이전 형식에서 이전)."""
+    if FEED_ARCHIVE.days():
+        return
+    existing_items = load_existing_feed()
+    if existing_items:
+        seeded = FEED_ARCHIVE.append_items(existing_items)
+        print(f"[INFO] 기존 stock_feed.json에서 아카이브 초기화: {len(seeded)}개")
 
 
 def save_feed(items: List[Dict]):
-    """stock_feed.json 저장"""
+    """stock_feed.json 저장 (아카이브의 최신 N개 뷰)"""
     tz = ZoneInfo("Asia/Seoul")
     data = {
         "last_updated": datetime.now(tz).isoformat(),
@@ -413,15 +455,13 @@ def save_feed(items: List[Dict]):
 
 
 def send_sofi_discord_notification(webhook_url: str, items: List[Dict]) -> int:
-    """SOFI 관련 새 뉴스를 Discord로 전송"""
+    """SOFI 관련 새 뉴스를 Discord로 전송 (메시지당 embed 최대 10개로 묶어서)"""
     if not webhook_url:
         return 0
     
-    import requests
-    from datetime import datetime
-    
-    sent_count = 0
+    from discord_notifier import WebhookDispatcher
     
+    embeds = []
     for item in items:
         # SOFI 관련 아이템만 필터링
         tickers = item.get("related_tickers", [])
@@ -459,18 +499,9 @@ def send_sofi_discord_notification(webhook_url: str, items: List[Dict]) -> int:
             embed["url"] = item["url"]
         
         embed["footer"] = {"text": "Stock Feed Agent"}
-        
-        payload = {"embeds": [embed]}
-        
-        try:
-            response = requests.post(webhook_url.strip().strip('"').strip("'"), json=payload, timeout=10)
-            response.raise_for_status()
-            sent_count += 1
-            print(f"[OK] Discord 알림 전송: {item.get('content', '')[:50]}...")
-        except Exception as e:
-            print(f"[WARN] Discord 알림 전송 실패: {e}")
+        embeds.append(embed)
     
-    return sent_count
+    return WebhookDispatcher(webhook_url).send_embeds(embeds)
 
 
 def main():
@@ -479,31 +510,58 @@ def main():
     
     print("[INFO] 주식 뉴스 피드 수집 시작...")
     
-    # 1. 기존 데이터 로드
-    existing_items = load_existing_feed()
-    existing_ids = {item["id"] for item in existing_items}
-    print(f"[INFO] 기존 아이템: {len(existing_items)}개")
-    
-    # 2. 새 데이터 수집
-    print("[INFO] RSS 뉴스 수집 중...")
-    news_items = collect_rss_news()
+    # 1. 아카이브 준비 (처음 실행 시 기존 stock_feed.json에서 이전)
+    seed_archive_from_feed()
+    print(f"[INFO] 아카이브 파티션: {len(FEED_ARCHIVE.days())}일")
+    
+    # 2. 새 데이터 수집 (모든 피드를 한 번에 병렬 요청)
+    feed_reqs = build_feed_requests()
+    print(f"[INFO] 피드 {len(feed_reqs)}개 병렬 수집 중... (동시 {FEED_FETCH_WORKERS}개, 마감 {FEED_FETCH_DEADLINE:.0f}초)")
+    fetch_started = time.monotonic()
+    fetched = {
+        r["url"]: r
+        for r in fetch_all(feed_reqs, max_workers=FEED_FETCH_WORKERS, deadline=FEED_FETCH_DEADLINE, cache=FEED_CACHE)
+    }
+    for r in fetched.values():
+        FEED_METRICS.record_fetch(r)
+    not_modified = sum(1 for r in fetched.values() if r["status"] == 304)
+    print(f"[INFO] 피드 수집 완료: {time.monotonic() - fetch_started:.1f}초 (304 Not Modified: {not_modified}개)")
+    
+    # 단축 URL은 같은 실행 마감 시간 안에서 한 번에 병렬로 해석해 둔다 (수집기 루프에서는 요청하지 않는다)
+    resolved = resolve_feed_links(fetched, fetch_started + FEED_FETCH_DEADLINE)
+    if resolved:
+        print(f"[INFO] 단축 URL 해석: {resolved}개")
+    
+    print("[INFO] RSS 뉴스 파싱 중...")
+    news_items = collect_rss_news(fetched)
     print(f"[INFO] RSS 뉴스: {len(news_items)}개")
     
-    print("[INFO] Reddit 게시물 수집 중...")
-    reddit_items = collect_reddit_posts()
+    print("[INFO] Reddit 게시물 파싱 중...")
+    reddit_items = collect_reddit_posts(fetched)
     print(f"[INFO] Reddit 게시물: {len(reddit_items)}개")
     
-    print("[INFO] SoFi 전용 소스 수집 중...")
-    sofi_items = collect_sofi_specific_sources()
+    print("[INFO] SoFi 전용 소스 파싱 중...")
+    sofi_items = collect_sofi_specific_sources(fetched)
     print(f"[INFO] SoFi 전용 소스: {len(sofi_items)}개")
     
-    # 3. 병합
-    all_new_items = news_items + reddit_items + sofi_items
+    FEED_CACHE.save()
+    URL_CANONICALIZER.save()
+    FEED_METRICS.flush()
+    
+    # 3. 근접 중복 기사 묶기 (같은 소식의 다른 소스는 대표 항목의 alternates로)
+    collected_items = news_items + reddit_items + sofi_items
+    all_new_items = drop_known_duplicates(cluster_items(collected_items))
+    print(f"[INFO] 근접 중복 정리: {len(collected_items)}개 -> {len(all_new_items)}개")
+    
+    # 아카이브에 추가 (해당 날짜 파티션에 없는 항목만 기록된다)
+    appended_items = FEED_ARCHIVE.append_items(all_new_items)
+    print(f"[INFO] 아카이브에 새로 추가된 아이템: {len(appended_items)}개")
+    FEED_ARCHIVE.prune()
     
     # 4. SOFI 관련 새 뉴스만 필터링 (Discord 알림용)
     sofi_new_items = [
-        item for item in all_new_items
-        if item["id"] not in existing_ids and "SOFI" in item.get("related_tickers", [])
+        item for item in appended_items
+        if "SOFI" in item.get("related_tickers", [])
     ]
     
     # 5. Discord 알림 전송 (SOFI 관련 새 뉴스만, 중요 뉴스만 필터링)
@@ -533,12 +591,18 @@ def main():
     elif sofi_new_items:
         print(f"[INFO] SOFI 관련 새 뉴스 {len(sofi_new_items)}개 발견 (Discord 알림 미설정)")
     
-    # 6. 병합 및 저장
-    merged_items = merge_items(existing_items, all_new_items)
-    print(f"[INFO] 병합 후 총 아이템: {len(merged_items)}개")
-    
-    # 7. 저장
-    save_feed(merged_items)
+    # 6. 최신 N개 뷰 재생성 (인덱스가 있으면 인덱스에서 내보낸다)
+    # 이번에 추가한 아이템도 아카이브에 이미 기록됐으므로 오프셋 기반 동기화 한 번으로 인덱스에 들어간다.
+    if FEED_INDEX_ENABLED:
+        index = FeedIndex()
+        try:
+            index.sync_from_archive(FEED_ARCHIVE)
+            latest_items = index.export_json(STOCK_FEED_JSON_PATH, MAX_ITEMS)
+            print(f"[OK] {len(latest_items)}개 아이템 저장 완료: {STOCK_FEED_JSON_PATH}")
+        finally:
+            index.close()
+    else:
+        save_feed(FEED_ARCHIVE.latest_items(MAX_ITEMS))
     print("[OK] 완료!")
 
 
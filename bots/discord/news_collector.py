@@ -12,17 +12,36 @@
 """
 
 import os
+import sys
 import asyncio
 import requests
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from email.utils import parsedate_to_datetime
+from pathlib import Path
 from zoneinfo import ZoneInfo
 from typing import List, Dict, Set
 import discord
 from discord import app_commands
 from google import genai
 
+# 리포지토리 전체가 함께 배포된 경우 automation/scripts의 feeds 패키지(조건부 요청 캐시)와
+# llm 공통 호출 계층(모델 폴백 체인, 백오프)을 공유한다.
+# bots/discord만 단독 배포된 환경에서는 기존 방식(매번 전체 다운로드/파싱, 단일 모델 호출)으로 동작한다.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "automation" / "scripts"))
+try:
+    from feeds.cache import FeedCache
+    from feeds.parser import parse_feed_entries, parse_published, select_entries
+    FEEDS_AVAILABLE = True
+except ImportError:
+    FEEDS_AVAILABLE = False
+
+try:
+    from llm.client import generate
+    LLM_AVAILABLE = True
+except ImportError:
+    LLM_AVAILABLE = False
+
 # .env 파일 지원
 try:
     from dotenv import load_dotenv
@@ -59,34 +78,44 @@ class NewsCollector:
     
     def __init__(self):
         self.seen_links: Set[str] = set()
-        self.client = genai.Client(api_key=GEMINI_API_KEY) if GEMINI_API_KEY else None
+        # 공통 호출 계층을 쓸 수 없는 단독 배포 환경에서만 클라이언트를 직접 만든다
+        self.client = genai.Client(api_key=GEMINI_API_KEY) if GEMINI_API_KEY and not LLM_AVAILABLE else None
+        self.feed_cache = FeedCache() if FEEDS_AVAILABLE else None
     
     def fetch_rss_items(self, url: str, hours: int = 24) -> List[Dict]:
         """RSS 피드에서 최근 N시간 내 뉴스 항목 수집"""
         items = []
         try:
-            resp = requests.get(url, timeout=10, headers={"User-Agent": "rldhkstopic-news-collector/1.0"})
-            if resp.status_code != 200:
-                return items
-            
-            root = ET.fromstring(resp.text)
-            channel = root.find("channel")
-            if channel is None:
+            headers = {"User-Agent": "rldhkstopic-news-collector/1.0"}
+            if self.feed_cache is not None:
+                headers.update(self.feed_cache.request_headers(url))
+            resp = requests.get(url, timeout=10, headers=headers)
+            if resp.status_code not in (200, 304):
                 return items
             
             tz = ZoneInfo("Asia/Seoul")
             cutoff_time = datetime.now(tz) - timedelta(hours=hours)
             
-            for item in channel.findall("item"):
-                title_el = item.find("title")
-                link_el = item.find("link")
-                pub_el = item.find("pubDate")
-                desc_el = item.find("description")
-                
-                title = (title_el.text or "").strip() if title_el is not None else ""
-                link = (link_el.text or "").strip() if link_el is not None else ""
-                pub = (pub_el.text or "").strip() if pub_el is not None else ""
-                desc = (desc_el.text or "").strip() if desc_el is not None else ""
+            if self.feed_cache is not None:
+                # 304 또는 본문 해시가 같으면 XML을 다시 파싱하지 않는다.
+                # 캐시에는 피드 전체 항목이 있으므로 이번 요청의 hours 구간은 불러온 뒤에 고른다.
+                entries = select_entries(
+                    self.feed_cache.load_items(
+                        {"url": url, "status": resp.status_code, "headers": dict(resp.headers), "content": resp.content},
+                        parse_feed_entries,
+                    ),
+                    cutoff=cutoff_time,
+                )
+            elif resp.status_code == 200:
+                entries = self._parse_rss(resp.content)
+            else:
+                return items
+            
+            for entry in entries:
+                title = entry["title"]
+                link = entry["link"]
+                pub = entry["pub"]
+                desc = entry["desc"]
                 
                 if not title or not link:
                     continue
@@ -97,7 +126,8 @@ class NewsCollector:
                 
                 # 시간 필터링
                 try:
-                    dt = parsedate_to_datetime(pub)
+                    # feeds 파서는 Atom(ISO 8601) 날짜도 해석한다.
+                    dt = parse_published(pub) if FEEDS_AVAILABLE else parsedate_to_datetime(pub)
                     if dt.tzinfo is None:
                         dt = dt.replace(tzinfo=ZoneInfo("UTC"))
                     dt_kst = dt.astimezone(tz)
@@ -120,6 +150,27 @@ class NewsCollector:
         
         return items
     
+    def _parse_rss(self, content: bytes) -> List[Dict]:
+        """feeds 패키지를 쓸 수 없는 단독 배포 환경용 RSS 파싱"""
+        root = ET.fromstring(content)
+        channel = root.find("channel")
+        if channel is None:
+            return []
+        
+        entries = []
+        for item in channel.findall("item"):
+            title_el = item.find("title")
+            link_el = item.find("link")
+            pub_el = item.find("pubDate")
+            desc_el = item.find("description")
+            entries.append({
+                "title": (title_el.text or "").strip() if title_el is not None else "",
+                "link": (link_el.text or "").strip() if link_el is not None else "",
+                "pub": (pub_el.text or "").strip() if pub_el is not None else "",
+                "desc": (desc_el.text or "").strip() if desc_el is not None else "",
+            })
+        return entries
+    
     def _extract_source(self, url: str) -> str:
         """URL에서 뉴스 소스 추출"""
         if "bloomberg" in url.lower():
@@ -142,7 +193,7 @@ class NewsCollector:
         if not items:
             return ""
         
-        if not self.client:
+        if not GEMINI_API_KEY:
             # Gemini API가 없으면 간단한 요약
             return f"총 {len(items)}건의 뉴스가 수집되었습니다."
         
@@ -161,6 +212,8 @@ class NewsCollector:
 - 한국어로 작성
 - 이모지 사용 금지"""
             
+            if LLM_AVAILABLE:
+                return generate(prompt, task="default", api_key=GEMINI_API_KEY)
             response = self.client.models.generate_content(
                 model="models/gemini-2.0-flash-exp",
                 contents=prompt
@@ -176,6 +229,8 @@ class NewsCollector:
         for url in feed_urls:
             items = self.fetch_rss_items(url, hours=24)
             all_items.extend(items)
+        if self.feed_cache is not None:
+            self.feed_cache.save()
         
         # 시간순 정렬
         all_items.sort(key=lambda x: x.get("published_at", ""), reverse=True)